@@ -174,10 +174,8 @@ class QStockTools(Toolkit):
         - List[Dict]: 包含最近5个交易日的总成交数据，
         Dict包含字段: ['日期', '成交额'] 或 ['date', 'turnover']（取决于use_chinese_fields参数）
         """
-        data = index_data_service.get_turnover_history_data(start_date=start_date, end_date=end_date, freq=1, fqt=1, use_chinese_fields=use_chinese_fields)
-        # 遍历日期列只取当日包含9:30的数据,其他时间段的数据不取
-        data = [d for d in data if '09:30:00' in d['日期']]
-        return data
+        # 只取每日9:30的竞价成交数据,其他时间段的数据不取
+        return index_data_service.get_turnover_history_at_time("09:30:00", start_date=start_date, end_date=end_date, use_chinese_fields=use_chinese_fields)
 
     def get_rzrq_turnover_ratio(self, start_date = None, end_date = None, page: int = 1, page_size: int = 10, use_chinese_fields: bool = True) -> List[Dict]:
         """ 获取融资融券占总成交比例数据(含总融资余额与上证指数偏离率)
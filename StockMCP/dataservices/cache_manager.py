@@ -1,6 +1,7 @@
 import redis
 import json
 import logging
+import math
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -9,6 +10,40 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        """序列化缓存数据，datetime等类型仍按str()输出，与json.dumps(default=str)保持一致
+
+        JSON没有NaN/Infinity，orjson将其输出为null，读取后为None
+        """
+        return orjson.dumps(data, default=str,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+    def _loads(data: Any) -> Any:
+        """反序列化缓存数据，orjson无法解析时(如旧版本用json.dumps写入的NaN)改用json.loads"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+except ImportError:
+    def _dumps(data: Any) -> str:
+        """序列化缓存数据，NaN/Infinity与orjson一致输出为null"""
+        return json.dumps(_nan_to_none(data), default=str)
+
+    _loads = json.loads
+
+def _nan_to_none(data: Any) -> Any:
+    """将数据中的NaN/Infinity替换为None"""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _nan_to_none(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_nan_to_none(item) for item in data]
+    return data
+
 class DatabaseInterface(ABC):
     """数据库接口"""
     
@@ -66,7 +101,7 @@ class SQLiteDatabase(DatabaseInterface):
                 cursor.execute("""
                     INSERT OR REPLACE INTO cache (key, data)
                     VALUES (?, ?)
-                """, (key, json.dumps(serializable_data, default=str)))
+                """, (key, _dumps(serializable_data)))
                 conn.commit()
                 return True
         except Exception as e:
@@ -82,7 +117,7 @@ class SQLiteDatabase(DatabaseInterface):
                 """, (key,))
                 result = cursor.fetchone()
                 if result:
-                    return json.loads(result[0])
+                    return _loads(result[0])
                 return None
         except Exception as e:
             logger.error(f"从SQLite加载数据失败: {e}")
@@ -104,7 +139,8 @@ class CacheManager:
     
     def __init__(self, redis_host: str = "localhost", redis_port: int = 6379, 
                  db_type: str = "sqlite", db_config: Dict[str, Any] = None):
-        self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        # 缓存数据直接以字节串交给_loads解析(orjson和json.loads均接受bytes)，省去redis-py先整体解码为str的开销
+        self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=False)
         self.db = self._create_database(db_type, db_config or {})
     
     def _create_database(self, db_type: str, db_config: Dict[str, Any]) -> DatabaseInterface:
@@ -120,47 +156,73 @@ class CacheManager:
             # 先从Redis获取
             cached_data = self.redis_client.get(key)
             if cached_data:
-                data = json.loads(cached_data)
-                # 如果数据是列表且不为空，尝试转换为DataFrame
-                if isinstance(data, list) and len(data) > 0:
-                    # 检查是否是字典列表（可转换为DataFrame的结构）
-                    if isinstance(data[0], dict):
-                        data = pd.DataFrame(data)
-                        # 对数据进行排序
-                        data = self._sort_data(data)
-                        # 确保日期列是字符串
-                        if '日期' in data:
-                            data['日期'] = data['日期'].apply(lambda x: str(x))
-                        if 'date' in data:
-                            data['date'] = data['date'].apply(lambda x: str(x))
-                        
-                        return data.to_dict(orient='records')
-                # 对列表数据进行排序
-                if isinstance(data, list):
-                    data = self._sort_data(data)
-
-                return data
+                return self._from_redis(cached_data)
             
             # Redis没有则从数据库获取
-            db_data = self.db.load_data(key)
-            if db_data:
-                # 同步到Redis
-                self.redis_client.setex(key, 3600, json.dumps(db_data, default=str))  # 默认缓存1小时
-                # 如果数据是列表且不为空，尝试转换为DataFrame
-                if isinstance(db_data, list) and len(db_data) > 0:
-                    # 检查是否是字典列表（可转换为DataFrame的结构）
-                    if isinstance(db_data[0], dict):
-                        data = pd.DataFrame(db_data)
-                        # 对数据进行排序
-                        data = self._sort_data(data)
-                        return data.to_dict(orient='records')
-                # 对列表数据进行排序
-                if isinstance(db_data, list):
-                    db_data = self._sort_data(db_data)
-                return db_data
+            return self._from_db(key)
         except Exception as e:
             logger.error(f"获取缓存数据失败: {e}")
         return None
+
+    def get_cached_data_many(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """批量获取缓存数据，一次MGET读取Redis，Redis未命中的键再逐个查数据库"""
+        try:
+            values = self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"批量获取缓存数据失败: {e}")
+            values = [None] * len(keys)
+
+        result = {}
+        for key, cached_data in zip(keys, values):
+            try:
+                result[key] = self._from_redis(cached_data) if cached_data else self._from_db(key)
+            except Exception as e:
+                logger.error(f"获取缓存数据失败: {e}")
+                result[key] = None
+        return result
+
+    def _from_redis(self, cached_data: Any) -> Any:
+        """解析Redis中的缓存数据"""
+        data = _loads(cached_data)
+        # 如果数据是列表且不为空，尝试转换为DataFrame
+        if isinstance(data, list) and len(data) > 0:
+            # 检查是否是字典列表（可转换为DataFrame的结构）
+            if isinstance(data[0], dict):
+                data = pd.DataFrame(data)
+                # 对数据进行排序
+                data = self._sort_data(data)
+                # 确保日期列是字符串
+                if '日期' in data:
+                    data['日期'] = data['日期'].apply(lambda x: str(x))
+                if 'date' in data:
+                    data['date'] = data['date'].apply(lambda x: str(x))
+                
+                return data.to_dict(orient='records')
+        # 对列表数据进行排序
+        if isinstance(data, list):
+            data = self._sort_data(data)
+
+        return data
+
+    def _from_db(self, key: str) -> Optional[Any]:
+        """从数据库获取缓存数据，并同步到Redis"""
+        db_data = self.db.load_data(key)
+        if db_data:
+            # 同步到Redis
+            self.redis_client.setex(key, 3600, _dumps(db_data))  # 默认缓存1小时
+            # 如果数据是列表且不为空，尝试转换为DataFrame
+            if isinstance(db_data, list) and len(db_data) > 0:
+                # 检查是否是字典列表（可转换为DataFrame的结构）
+                if isinstance(db_data[0], dict):
+                    data = pd.DataFrame(db_data)
+                    # 对数据进行排序
+                    data = self._sort_data(data)
+                    return data.to_dict(orient='records')
+            # 对列表数据进行排序
+            if isinstance(db_data, list):
+                db_data = self._sort_data(db_data)
+            return db_data
+        return None
     
     def _sort_data(self, data):
         """对数据按日期/时间字段进行排序"""
@@ -217,13 +279,27 @@ class CacheManager:
                 serializable_data = sorted_data
             
             # 保存到Redis
-            self.redis_client.setex(key, expiry, json.dumps(serializable_data, default=str))
+            self.redis_client.setex(key, expiry, _dumps(serializable_data))
             # 保存到数据库(不包含过期时间)
             return self.db.save_data(key, serializable_data)
         except Exception as e:
             logger.error(f"设置缓存数据失败: {e}")
             return False
     
+    def touch_cached_data(self, key: str, expiry: int = 3600) -> bool:
+        """重置Redis中缓存数据的过期时间，Redis中已没有该键时从数据库重新载入"""
+        try:
+            if self.redis_client.expire(key, expiry):
+                return True
+            db_data = self.db.load_data(key)
+            if db_data is None:
+                return False
+            self.redis_client.setex(key, expiry, _dumps(db_data))
+            return True
+        except Exception as e:
+            logger.error(f"延长缓存过期时间失败: {e}")
+            return False
+
     def invalidate_cache(self, key: str) -> bool:
         """清除缓存"""
         try:
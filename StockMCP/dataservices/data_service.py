@@ -1,9 +1,10 @@
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import traceback
 from qstock.data import trade
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 import pandas as pd
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -18,26 +19,61 @@ def get_date(item):
                 continue
     return datetime.min
 
+def _zip_records(columns: tuple, values) -> List[Dict]:
+    """按列名和各列取值构造字典列表"""
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+def df_to_records(df: pd.DataFrame) -> List[Dict]:
+    """按列将DataFrame转换为字典列表
+
+    结果与df.to_dict(orient='records')相同，但每列只调用一次tolist()转换为Python原生类型，
+    不再逐个单元格装箱
+    """
+    if df.empty:
+        return []
+    columns = tuple(df.columns)
+    return _zip_records(columns, [df.iloc[:, i].tolist() for i in range(len(columns))])
+
+def df_to_columnar(df: pd.DataFrame) -> Dict[str, list]:
+    """将DataFrame转换为按列存储的缓存格式 {"columns": [...], "data": [[列值...], ...]}"""
+    return {
+        "columns": list(df.columns),
+        "data": [df.iloc[:, i].tolist() for i in range(len(df.columns))],
+    }
+
+def columnar_to_records(payload: Dict[str, list]) -> List[Dict]:
+    """将按列存储的缓存数据展开为字典列表"""
+    columns = tuple(payload["columns"])
+    if not columns:
+        return []
+    return _zip_records(columns, payload["data"])
+
+def is_columnar(data: Any) -> bool:
+    """判断缓存数据是否为按列存储格式"""
+    return isinstance(data, dict) and "columns" in data and "data" in data
+
+@lru_cache(maxsize=4096, typed=True)
+def _join_key(*parts: Any) -> str:
+    """以冒号拼接缓存键，相同参数的缓存键只拼接一次"""
+    return ":".join(map(str, parts))
+
+# 按weekday()索引的日期偏移天数：周六、周日调整到之后最近的工作日(开始日期)或之前最近的工作日(结束日期)
+_START_ADJ = tuple(timedelta(days=d) for d in (0, 0, 0, 0, 0, 2, 1))
+_END_ADJ = tuple(timedelta(days=d) for d in (0, 0, 0, 0, 0, -1, -2))
+
 def adjust_start_date(incremental_start_date: datetime)-> datetime:
-    # 确定目标起始日期是否为交易日（周末、法定节假日不交易）
-    if incremental_start_date.weekday() == 5:
-        # 调整为后两个交易日
-        incremental_start_date += timedelta(days=2)
-    elif incremental_start_date.weekday() == 6:
-        # 调整为后一个交易日
-        incremental_start_date += timedelta(days=1)
-    return incremental_start_date
+    # 确定目标起始日期是否为交易日（周末、法定节假日不交易），周六调整为后两天，周日调整为后一天
+    return incremental_start_date + _START_ADJ[incremental_start_date.weekday()]
 
 def adjust_end_date(incremental_end_date: datetime)-> datetime:
     # 如果结束日期是周六周日，则调整为之前最近的工作日
-    if incremental_end_date.weekday() == 5:
-        incremental_end_date -= timedelta(days=1)  # 周六
-    elif incremental_end_date.weekday() == 6:
-        incremental_end_date -= timedelta(days=2)  # 周日
-    return incremental_end_date
+    return incremental_end_date + _END_ADJ[incremental_end_date.weekday()]
 
 class DataService:
     """数据服务类，封装数据获取和缓存逻辑"""
+
+    # 最近交易日缓存 (查询时的自然日, 最近交易日)，自然日变化后重新查询
+    _trade_day_cache: Optional[Tuple[date, datetime]] = None
     
     def __init__(self):
         try:
@@ -48,6 +84,21 @@ class DataService:
         # 初始化最后一个交易日
         self.last_trade_date = datetime.strptime(trade.latest_trade_date(), "%Y-%m-%d").date()
     
+    @classmethod
+    def _latest_trading_day(cls) -> datetime:
+        """获取最近一个交易日，每个自然日只查询一次"""
+        today = date.today()
+        cached = DataService._trade_day_cache
+        if cached is None or cached[0] != today:
+            cached = (today, datetime.strptime(trade.latest_trade_date(), "%Y-%m-%d"))
+            DataService._trade_day_cache = cached
+        return cached[1]
+
+    @staticmethod
+    def _key(*parts: Any) -> str:
+        """生成缓存键 "part1:part2:..."，各部分需可哈希"""
+        return _join_key(*parts)
+
     def set_cache_manager(self, cache_manager):
         """设置缓存管理器"""
         self.cache_manager = cache_manager
@@ -58,11 +109,23 @@ class DataService:
             return None
         return self.cache_manager.get_cached_data(cache_key)
     
+    def get_cached_data_many(self, cache_keys: List[str]) -> Dict[str, Optional[Any]]:
+        """批量从缓存获取数据"""
+        if self.cache_manager is None:
+            return {key: None for key in cache_keys}
+        return self.cache_manager.get_cached_data_many(cache_keys)
+
     def set_cached_data(self, cache_key: str, data: Any, expiry: int = 3600) -> bool:
         """设置缓存数据"""
         if self.cache_manager is None:
             return False
         return self.cache_manager.set_cached_data(cache_key, data, expiry)
+
+    def touch_cached_data(self, cache_key: str, expiry: int = 3600) -> bool:
+        """重置缓存数据的过期时间，数据保持不变"""
+        if self.cache_manager is None:
+            return False
+        return self.cache_manager.touch_cached_data(cache_key, expiry)
     
     def _need_incremental_update(self, cached_data: Any, start_date: Optional[str] = None, end_date: Optional[str] = None, freq: Optional[str|int] = 'd', market: Optional[str] = '沪深A') -> bool:
         """判断是否需要增量更新"""
@@ -72,7 +135,7 @@ class DataService:
         try:
             # 如果是DataFrame，转换为字典列表处理
             if isinstance(cached_data, pd.DataFrame):
-                data_list = cached_data.to_dict(orient='records')
+                data_list = df_to_records(cached_data)
             else:
                 data_list = cached_data
                 
@@ -130,9 +193,20 @@ class DataService:
                 if earliest_cached_date is None or item_date < earliest_cached_date:
                     earliest_cached_date = item_date
             
-            if latest_cached_date is None or earliest_cached_date is None:
-                return False
-            
+            return self._range_needs_update(earliest_cached_date, latest_cached_date,
+                                            start_date=start_date, end_date=end_date, freq=freq, market=market)
+        except Exception as e:
+            logger.error(f"判断是否需要增量更新时出错: {e}")
+            return False
+
+    def _range_needs_update(self, earliest_cached_date: Optional[datetime], latest_cached_date: Optional[datetime],
+                            start_date: Optional[str] = None, end_date: Optional[str] = None,
+                            freq: Optional[str|int] = 'd', market: Optional[str] = '沪深A') -> bool:
+        """根据缓存数据的最早和最新日期判断是否需要增量更新，已知日期范围时无需再扫描缓存数据"""
+        if latest_cached_date is None or earliest_cached_date is None:
+            return False
+
+        try:
             # 确定目标结束日期
             target_end_date = datetime.now()
 
@@ -209,7 +283,7 @@ class DataService:
         try:
             # 处理缓存数据的不同类型
             if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
+                cached_data_list = df_to_records(cached_data)
             elif isinstance(cached_data, list):
                 cached_data_list = cached_data
             else:
@@ -218,7 +292,7 @@ class DataService:
             
             # 处理增量数据的不同类型
             if isinstance(incremental_data, pd.DataFrame):
-                incremental_data_list = incremental_data.to_dict(orient='records')
+                incremental_data_list = df_to_records(incremental_data)
             elif isinstance(incremental_data, list):
                 incremental_data_list = incremental_data
             else:
@@ -234,7 +308,7 @@ class DataService:
                 # 去除完全重复的行
                 df = df.drop_duplicates()
                 # 转换回列表
-                merged_list = df.to_dict(orient='records')
+                merged_list = df_to_records(df)
             
             # 按日期排序，升序
             merged_list.sort(key=get_date, reverse=False)
@@ -263,7 +337,7 @@ class DataService:
             traceback.print_exc()
             # 返回原始缓存数据，确保返回类型一致性
             if isinstance(cached_data, pd.DataFrame):
-                return cached_data.to_dict(orient='records')
+                return df_to_records(cached_data)
             elif isinstance(cached_data, list):
                 return cached_data
             else:
@@ -1,7 +1,9 @@
 import logging
 from typing import Dict, List, Optional, Any, Union
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 import requests
 from pyquery import PyQuery as pq
 import qstock as qs
@@ -12,10 +14,68 @@ from ..common_utils import get_stock_indicators
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import stock_rzrq as rzrq
-from .data_service import DataService, get_date, adjust_start_date, adjust_end_date
+from .data_service import (DataService, get_date, adjust_start_date, adjust_end_date, df_to_records, df_to_columnar,
+                           columnar_to_records, is_columnar)
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> datetime:
+    """解析'YYYY-MM-DD'格式的日期，相同日期字符串只解析一次"""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+def _extract_date_bounds(cached_data: Any, date_keys: tuple = ("日期", "date")) -> Optional[tuple]:
+    """按日期列计算缓存数据的(最早日期, 最新日期)，日期精度保留到日
+
+    DataFrame直接读取日期列，字典列表只提取日期字段，不会逐行构造字典；
+    数据中没有日期字段时返回None，数据为空或日期均无法解析时返回(None, None)
+    """
+    if isinstance(cached_data, pd.DataFrame):
+        date_key = next((k for k in date_keys if k in cached_data.columns), None)
+        if date_key is None:
+            return None if not cached_data.empty else (None, None)
+        dates = cached_data[date_key].to_numpy()
+    else:
+        if not isinstance(cached_data, list):
+            logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
+            cached_data = list(cached_data) if cached_data else []
+        if not cached_data:
+            return None, None
+        date_key = next((k for k in date_keys if k in cached_data[0]), None)
+        if date_key is None:
+            return None
+        dates = [item.get(date_key) for item in cached_data]
+
+    try:
+        # 日期为'YYYY-MM-DD'时直接转换为datetime64[D]，精度即保留到日，最值由NumPy一次归约求得
+        dates = np.asarray(dates, dtype='datetime64[D]')
+    except (ValueError, TypeError):
+        # 含时间部分等无法直接按日转换的格式，交给pandas解析后再截取到日
+        dates = pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce", cache=True).to_numpy(dtype='datetime64[D]')
+    dates = dates[~np.isnat(dates)]
+    if dates.size == 0:
+        return None, None
+    return dates.min().astype('datetime64[us]').item(), dates.max().astype('datetime64[us]').item()
+
+def _is_iso_date(date_str: str) -> bool:
+    """是否为'YYYY-MM-DD'格式的日期字符串"""
+    return len(date_str) == 10 and date_str[4] == date_str[7] == "-"
+
+def _covers_request(bounds: tuple, start_date: Optional[str], end_date: Optional[str], latest_trading_day: str) -> bool:
+    """按字符串比较判断缓存数据的日期范围是否已覆盖请求的日期范围，无法确定时返回False
+
+    'YYYY-MM-DD'格式日期的字典序即时间先后，日期范围已覆盖请求时无需再解析日期
+    """
+    min_date, max_date = bounds
+    if start_date and not (_is_iso_date(start_date) and start_date >= min_date):
+        return False
+    target_end = min(end_date, latest_trading_day) if end_date else latest_trading_day
+    return _is_iso_date(target_end) and max_date >= target_end
+
+def _as_records(cached_data: Any) -> Any:
+    """按列存储的缓存数据展开为字典列表，其余格式的缓存数据原样返回"""
+    return columnar_to_records(cached_data) if is_columnar(cached_data) else cached_data
+
 class IndexDataService(DataService):
     """指数数据类，封装指数相关数据获取逻辑"""
     def __init__(self):
@@ -190,6 +250,22 @@ class IndexDataService(DataService):
             # traceback.print_exc()
             return []
     
+    def get_turnover_history_at_time(self, time_str: str = "09:30:00", start_date: Optional[str] = None,
+                                     end_date: Optional[str] = None, use_chinese_fields: bool = True) -> List[Dict]:
+        """ 获取沪深京三市场每日指定时刻的分钟成交数据，默认取9:30的竞价成交
+        参数：
+        - time_str: 时刻，格式为'HH:MM:SS'，默认为'09:30:00'
+        - start_date: 开始日期，格式为'YYYY-MM-DD'，默认为None
+        - end_date: 结束日期，格式为'YYYY-MM-DD'，默认为None
+        - use_chinese_fields: 是否使用中文字段名，默认为True
+        """
+        data = self.get_turnover_history_data(start_date=start_date, end_date=end_date, freq=1, fqt=1,
+                                              use_chinese_fields=use_chinese_fields)
+        # 分钟数据的日期格式为'YYYY-MM-DD HH:MM:SS'，只比较末尾的时刻
+        date_key = "日期" if use_chinese_fields else "date"
+        suffix = f" {time_str}"
+        return [d for d in data if str(d.get(date_key, "")).endswith(suffix)]
+    
     def _fetch_turnover_impl(self, start_date: Optional[str], end_date: Optional[str], freq : Optional[str|int] = 'd', fqt: Optional[int] = 1,
                              use_chinese_fields: bool = True) -> List[Dict]:
         """统一封装的获取成交数据方法
@@ -269,13 +345,37 @@ class IndexDataService(DataService):
             rzrq_turnover_df.reset_index(inplace=True)
             
             rzrq_turnover_df["日期"] = rzrq_turnover_df["日期"].astype(str)
-            result = rzrq_turnover_df.to_dict(orient='records')
+            result = df_to_records(rzrq_turnover_df)
             return result
         except Exception as e:
             logger.error(f"获取融资融券成交比例数据失败: {str(e)}")
             # traceback.print_exc()
             return []
 
+    def _set_cached_data_with_bounds(self, cache_key: str, data: List[Dict], expiry: int = 3600) -> bool:
+        """按列写入缓存数据，并将其(最早日期, 最新日期)写入"<cache_key>:bounds"，每次写入缓存数据时一并更新
+
+        缓存数据保存为 {"columns": [...], "data": [[列值...], ...]}，按日期升序排列，列名只保存一次
+        """
+        df = pd.DataFrame(data)
+        date_key = next((k for k in ("日期", "date") if k in df.columns), None)
+        if date_key is not None:
+            df = df.sort_values(date_key, kind="stable")
+        saved = self.set_cached_data(cache_key, df_to_columnar(df), expiry=expiry)
+        earliest, latest = _extract_date_bounds(df) or (None, None)
+        self.set_cached_data(f"{cache_key}:bounds", {
+            "min_date": earliest.strftime("%Y-%m-%d") if earliest else None,
+            "max_date": latest.strftime("%Y-%m-%d") if latest else None,
+        }, expiry=expiry)
+        return saved
+
+    def _get_cached_date_bounds(self, cache_key: str) -> Optional[tuple]:
+        """读取缓存数据的('YYYY-MM-DD'格式的最早日期, 最新日期)，没有记录日期范围时返回None"""
+        bounds = self.get_cached_data(f"{cache_key}:bounds")
+        if not isinstance(bounds, dict) or not bounds.get("min_date") or not bounds.get("max_date"):
+            return None
+        return bounds["min_date"], bounds["max_date"]
+
     def get_rzrq_turnover_ratio(self, start_date='19000101', end_date=None, page: int = 1, page_size: int = 10, 
                                 use_chinese_fields: bool = True) -> List[Dict]:
         """ 获取融资融券占总成交比例数据(含总融资余额与上证指数偏离率)
@@ -289,19 +389,26 @@ class IndexDataService(DataService):
         # 生成缓存键
         cache_key = f"rzrq_turnover_ratio:{use_chinese_fields}"
         
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
+        # 尝试从缓存获取数据，按列存储的缓存数据展开为字典列表
+        cached_data = _as_records(self.get_cached_data(cache_key))
         if cached_data is not None:
             logger.info(f"从缓存获取融资融券数据: {cache_key}")
+            # 日期范围与缓存数据一同写入，命中时直接读取，读取不到时才扫描缓存数据
+            bounds = self._get_cached_date_bounds(cache_key)
+            if bounds and _covers_request(bounds, start_date, end_date, self._latest_trading_day().strftime("%Y-%m-%d")):
+                return cached_data
+            date_bounds = (_parse_ymd(bounds[0]), _parse_ymd(bounds[1])) if bounds else _extract_date_bounds(cached_data)
             # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            if date_bounds and (date_bounds[1] is None or
+                                self._range_needs_update(*date_bounds, start_date=start_date, end_date=end_date)):
                 logger.info("检测到需要增量更新融资融券数据")
-                incremental_data = self._get_incremental_rzrq_data(cached_data, start_date=start_date, end_date=end_date, page=page, page_size=page_size, use_chinese_fields=use_chinese_fields)
+                incremental_data = self._get_incremental_rzrq_data(cached_data, start_date=start_date, end_date=end_date, page=page, page_size=page_size,
+                                                                   use_chinese_fields=use_chinese_fields, date_bounds=date_bounds)
                 if incremental_data:
                     # 合并数据
                     merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
                     # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=7200)
+                    self._set_cached_data_with_bounds(cache_key, merged_data, expiry=7200)
                     logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
                     return merged_data
             
@@ -310,7 +417,7 @@ class IndexDataService(DataService):
         try: 
             result = self._get_rzrq_turnover_ratio_impl(start_date, end_date, page, page_size, use_chinese_fields)
             # 缓存数据2小时
-            self.set_cached_data(cache_key, result, expiry=7200)
+            self._set_cached_data_with_bounds(cache_key, result, expiry=7200)
             return result
         except Exception as e:
             logger.error(f"获取融资融券成交比例数据失败: {str(e)}")
@@ -602,6 +709,28 @@ class IndexDataService(DataService):
             # traceback.print_exc()
             return []
     
+    def _scan_cached_dates(self, cached_data_list: List[Dict], freq: Optional[str|int] = 'd',
+                           _isinstance=isinstance, _str=str, _datetime=datetime, _get_date=get_date) -> Optional[tuple]:
+        """按freq调整精度后返回缓存数据的(最早日期, 最新日期)，有记录缺少日期字段时返回None
+
+        循环中用到的内置函数和全局名称以默认参数绑定为局部变量，避免逐条记录查找全局名称
+        """
+        dates = []
+        append = dates.append
+        adjust = self._adjust_date_by_freq
+        for item in cached_data_list:
+            date_key = "日期" if "日期" in item else "date" if "date" in item else None
+            if date_key is None:
+                return None
+            item_date = item[date_key]
+            if _isinstance(item_date, _str):
+                item_date = _get_date(item)
+            elif not _isinstance(item_date, _datetime):
+                continue
+            append(adjust(item_date, freq))
+        # 由内置min/max一次完成比较，不再逐条维护最早、最新日期
+        return min(dates, default=None), max(dates, default=None)
+
     def _get_incremental_turnover_data(self, cached_data: List[Dict], start_date: Optional[str], 
                                        end_date: Optional[str], freq: Optional[str|int] = 'd', fqt: Optional[int] = 1,
                                        use_chinese_fields: bool = True) -> List[Dict]:
@@ -619,47 +748,23 @@ class IndexDataService(DataService):
                 logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
                 cached_data_list = list(cached_data) if cached_data else []
             
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            # 获取缓存数据的最早日期
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                elif "date" in item:
-                    if isinstance(item["date"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["date"], datetime):
-                        item_date = item["date"]
-                    else:
-                        continue
-                else:
-                    return []
-                    
-                # 根据freq调整日期精度
-                item_date = self._adjust_date_by_freq(item_date, freq)
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
+            # 获取缓存数据的最早、最新日期
+            date_bounds = self._scan_cached_dates(cached_data_list, freq)
+            if date_bounds is None:
+                return []
+            earliest_cached_date, latest_cached_date = date_bounds
             
             # 确定增量开始日期：如果指定了start_date且早于缓存中的最早日期，则使用start_date
             incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
             
             if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
+                requested_start_date = _parse_ymd(start_date)
                 # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
                 requested_start_date = adjust_start_date(requested_start_date)
             else:
                 incremental_start_date = adjust_start_date(incremental_start_date)
+                # 未指定开始日期时以增量开始日期作为请求的开始日期
+                requested_start_date = incremental_start_date
             
             # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
             if earliest_cached_date and requested_start_date < earliest_cached_date:
@@ -671,7 +776,7 @@ class IndexDataService(DataService):
             # 增量结束日期为今天或指定的结束日期
             incremental_end_date = datetime.now()
             if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+                incremental_end_date = _parse_ymd(end_date)
                 # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
                 incremental_end_date = adjust_end_date(incremental_end_date)
             else:
@@ -706,62 +811,33 @@ class IndexDataService(DataService):
     
     def _get_incremental_rzrq_data(self, cached_data: List[Dict], start_date: Optional[str], 
                                    end_date: Optional[str], page: Optional[int] = 1, page_size: Optional[int] = 100, 
-                                   use_chinese_fields: bool = True) -> List[Dict]:
-        """获取增量的融资融券数据"""
+                                   use_chinese_fields: bool = True, date_bounds: Optional[tuple] = None) -> List[Dict]:
+        """获取增量的融资融券数据，date_bounds为已知的缓存数据(最早日期, 最新日期)"""
         try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                # 如果是DataFrame类型，转换为字典列表
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                # 如果已经是列表格式
-                cached_data_list = cached_data
-            else:
-                # 其他情况尝试转换为列表
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            # 获取缓存数据的最早日期
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                elif "date" in item:
-                    if isinstance(item["date"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["date"], datetime):
-                        item_date = item["date"]
-                    else:
-                        continue
-                else:
-                    return []
-                    
-                # 根据freq调整日期精度（融资融券数据默认为日频）
-                item_date = self._adjust_date_by_freq(item_date, 'd')
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
-            
+            now_dt = datetime.now()
+            # 未给出日期范围时直接读取日期列计算缓存数据的最早、最新日期，不再整体转换为字典列表
+            if date_bounds is None:
+                date_bounds = _extract_date_bounds(cached_data)
+            if date_bounds is None:
+                return []
+            earliest_cached_date, latest_cached_date = date_bounds
+            if latest_cached_date is None:
+                # 缓存中没有数据，直接获取请求日期范围内的数据
+                logger.info(f"缓存为空，获取指定日期范围（{start_date}至{end_date}）的融资融券占比数据")
+                return self._get_rzrq_turnover_ratio_impl(start_date=start_date, end_date=end_date,
+                                                          page=page, page_size=page_size, use_chinese_fields=use_chinese_fields)
+
             # 确定增量开始日期：如果指定了start_date且早于缓存中的最早日期，则使用start_date
-            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
+            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else now_dt
             
             if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
+                requested_start_date = _parse_ymd(start_date)
                 # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
                 requested_start_date = adjust_start_date(requested_start_date)
             else:
                 incremental_start_date = adjust_start_date(incremental_start_date)
+                # 未指定开始日期时以增量开始日期作为请求的开始日期
+                requested_start_date = incremental_start_date
             
             # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
             if earliest_cached_date and requested_start_date < earliest_cached_date:
@@ -771,10 +847,10 @@ class IndexDataService(DataService):
                 incremental_start_date = requested_start_date
             
             # 增量结束日期为今天或指定的结束日期
-            incremental_end_date = datetime.now()
+            incremental_end_date = now_dt
 
             if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+                incremental_end_date = _parse_ymd(end_date)
             else:
                 incremental_end_date = adjust_end_date(incremental_end_date)
             # 如果请求的结束时间比缓存中最早的日期晚，则只需要获取更早的数据
@@ -924,47 +1000,23 @@ class IndexDataService(DataService):
                 logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
                 cached_data_list = list(cached_data) if cached_data else []
             
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            # 获取缓存数据的最早日期
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                elif "date" in item:
-                    if isinstance(item["date"], str):
-                        item_date = get_date(item)
-                    elif isinstance(item["date"], datetime):
-                        item_date = item["date"]
-                    else:
-                        continue
-                else:
-                    return []
-                    
-                # 根据freq调整日期精度
-                item_date = self._adjust_date_by_freq(item_date, freq)
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
+            # 获取缓存数据的最早、最新日期
+            date_bounds = self._scan_cached_dates(cached_data_list, freq)
+            if date_bounds is None:
+                return []
+            earliest_cached_date, latest_cached_date = date_bounds
             
             # 确定增量开始日期：如果指定了start_date且早于缓存中的最早日期，则使用start_date
             incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
             
             if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
+                requested_start_date = _parse_ymd(start_date)
                 # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
                 requested_start_date = adjust_start_date(requested_start_date)
             else:
                 incremental_start_date = adjust_start_date(incremental_start_date)
+                # 未指定开始日期时以增量开始日期作为请求的开始日期
+                requested_start_date = incremental_start_date
             
             # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
             if earliest_cached_date and requested_start_date < earliest_cached_date:
@@ -976,7 +1028,7 @@ class IndexDataService(DataService):
             # 增量结束日期为今天或指定的结束日期
             incremental_end_date = datetime.now()
             if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+                incremental_end_date = _parse_ymd(end_date)
                 # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
                 incremental_end_date = adjust_end_date(incremental_end_date)
             else:
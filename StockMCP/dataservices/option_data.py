@@ -6,7 +6,7 @@ import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from .data_service import DataService, adjust_start_date, adjust_end_date
+from .data_service import DataService, adjust_start_date, adjust_end_date, df_to_records
 import replace_qstock_func
 
 logger = logging.getLogger(__name__)
@@ -145,7 +145,7 @@ class OptionDataService(DataService):
                 if df.empty:
                     return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取期权实时数据失败: {str(e)}")
             return []
@@ -228,7 +228,7 @@ class OptionDataService(DataService):
                 if df.empty:
                     return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取期权价值数据失败: {str(e)}")
             return []
@@ -311,7 +311,7 @@ class OptionDataService(DataService):
                 if df.empty:
                     return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取期权风险数据失败: {str(e)}")
             return []
@@ -378,7 +378,7 @@ class OptionDataService(DataService):
             if df.empty:
                 return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取期权T型看板数据失败: {str(e)}")
             return []
@@ -433,7 +433,7 @@ class OptionDataService(DataService):
             if df.empty:
                 return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取所有期权标的的到期日信息失败: {str(e)}")
             return []
@@ -504,7 +504,7 @@ class OptionDataService(DataService):
             if df.empty:
                 return []
             
-            return df.to_dict(orient='records')
+            return df_to_records(df)
         except Exception as e:
             logger.error(f"获取期权标的代码 {code} 的到期日信息失败: {str(e)}")
             return []
\ No newline at end of file
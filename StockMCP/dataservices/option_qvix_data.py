@@ -1,22 +1,159 @@
 import logging
-from typing import Dict, List, Optional, Any
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Dict, Final, List, Mapping, NamedTuple, Optional, Any
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from .data_service import DataService, adjust_start_date, adjust_end_date
-import index_option_qvix
+import base64
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+from .data_service import (DataService, adjust_start_date, adjust_end_date, df_to_records,
+                           df_to_columnar, columnar_to_records, is_columnar)
 
 logger = logging.getLogger(__name__)
 
+def _qvix_api():
+    """延迟导入index_option_qvix，缓存命中时无需加载"""
+    try:
+        from .. import index_option_qvix
+    except ImportError:
+        # dataservices作为顶层包导入时(StockMCP目录已在sys.path中)
+        import index_option_qvix
+    return index_option_qvix
+
+# 已解析的index_option_qvix获取函数 {symbol: 函数}
+_FETCHERS: Dict[int, Callable[..., pd.DataFrame]] = {}
+
+def _fetcher(symbol: "QvixSymbol") -> Callable[..., pd.DataFrame]:
+    """获取品种对应的index_option_qvix函数，首次调用时解析后缓存"""
+    fetcher = _FETCHERS.get(symbol)
+    if fetcher is None:
+        fetcher = _FETCHERS[symbol] = getattr(_qvix_api(), _REGISTRY[symbol].fetcher)
+    return fetcher
+
+class QvixSymbol(IntEnum):
+    """期权QVIX品种，取值为缓存键表_CACHE_KEYS的下标"""
+    ETF50 = 0
+    ETF50_MIN = 1
+    ETF300 = 2
+    ETF300_MIN = 3
+    ETF500 = 4
+    ETF500_MIN = 5
+    CYB = 6
+    CYB_MIN = 7
+    KCB = 8
+    KCB_MIN = 9
+    ETF100 = 10
+    ETF100_MIN = 11
+    INDEX300 = 12
+    INDEX300_MIN = 13
+    INDEX1000 = 14
+    INDEX1000_MIN = 15
+    INDEX50 = 16
+    INDEX50_MIN = 17
+
+    @property
+    def key(self) -> str:
+        """对应的缓存键"""
+        return _CACHE_KEYS[self]
+
+# 进程内缓存的有效期(秒)和最大条目数
+_L1_TTL = 30
+_L1_MAXSIZE = 64
+
+# 等待其他线程完成同一品种上游请求的最长时间(秒)
+_INFLIGHT_TIMEOUT = 5
+
+# 缓存键表，按QvixSymbol取值顺序排列
+_CACHE_KEYS = (
+    "option_qvix:50etf",
+    "option_qvix:50etf_min",
+    "option_qvix:300etf",
+    "option_qvix:300etf_min",
+    "option_qvix:500etf",
+    "option_qvix:500etf_min",
+    "option_qvix:cyb",
+    "option_qvix:cyb_min",
+    "option_qvix:kcb",
+    "option_qvix:kcb_min",
+    "option_qvix:100etf",
+    "option_qvix:100etf_min",
+    "option_qvix:300index",
+    "option_qvix:300index_min",
+    "option_qvix:1000index",
+    "option_qvix:1000index_min",
+    "option_qvix:50index",
+    "option_qvix:50index_min",
+)
+
+class FetchSpec(NamedTuple):
+    """QVIX数据获取配置"""
+    fetcher: str    # index_option_qvix中的获取函数名
+    expiry: int     # 缓存有效期(秒)
+    desc: str       # 数据描述，用于日志和文档
+
+# QVIX品种注册表，OptionQvixDataService的get_*方法由此生成
+_REGISTRY: Final[Mapping[QvixSymbol, FetchSpec]] = MappingProxyType({
+    QvixSymbol.ETF50: FetchSpec("index_option_50etf_qvix", 3600, "50ETF期权波动率指数QVIX日线数据"),
+    QvixSymbol.ETF50_MIN: FetchSpec("index_option_50etf_min_qvix", 300, "50ETF期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.ETF300: FetchSpec("index_option_300etf_qvix", 3600, "300ETF期权波动率指数QVIX日线数据"),
+    QvixSymbol.ETF300_MIN: FetchSpec("index_option_300etf_min_qvix", 300, "300ETF期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.ETF500: FetchSpec("index_option_500etf_qvix", 3600, "500ETF期权波动率指数QVIX日线数据"),
+    QvixSymbol.ETF500_MIN: FetchSpec("index_option_500etf_min_qvix", 300, "500ETF期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.CYB: FetchSpec("index_option_cyb_qvix", 3600, "创业板期权波动率指数QVIX日线数据"),
+    QvixSymbol.CYB_MIN: FetchSpec("index_option_cyb_min_qvix", 300, "创业板期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.KCB: FetchSpec("index_option_kcb_qvix", 3600, "科创板期权波动率指数QVIX日线数据"),
+    QvixSymbol.KCB_MIN: FetchSpec("index_option_kcb_min_qvix", 300, "科创板期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.ETF100: FetchSpec("index_option_100etf_qvix", 3600, "深证100ETF期权波动率指数QVIX日线数据"),
+    QvixSymbol.ETF100_MIN: FetchSpec("index_option_100etf_min_qvix", 300, "深证100ETF期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.INDEX300: FetchSpec("index_option_300index_qvix", 3600, "中证300股指期权波动率指数QVIX日线数据"),
+    QvixSymbol.INDEX300_MIN: FetchSpec("index_option_300index_min_qvix", 300, "中证300股指期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.INDEX1000: FetchSpec("index_option_1000index_qvix", 3600, "中证1000股指期权波动率指数QVIX日线数据"),
+    QvixSymbol.INDEX1000_MIN: FetchSpec("index_option_1000index_min_qvix", 300, "中证1000股指期权波动率指数QVIX分钟线数据"),
+    QvixSymbol.INDEX50: FetchSpec("index_option_50index_qvix", 3600, "上证50股指期权波动率指数QVIX日线数据"),
+    QvixSymbol.INDEX50_MIN: FetchSpec("index_option_50index_min_qvix", 300, "上证50股指期权波动率指数QVIX分钟线数据"),
+})
+
+class QvixDailyRecord(NamedTuple):
+    """QVIX日线记录"""
+    date: str
+    open: float
+    high: float
+    low: float
+    close: float
+
+class QvixMinuteRecord(NamedTuple):
+    """QVIX分钟线记录"""
+    time: str
+    qvix: float
+
 class OptionQvixDataService(DataService):
     """期权QVIX数据类，封装期权波动率指数相关数据获取逻辑"""
     
     def __init__(self):
         super().__init__()
         self.proxy = None
+        # 后台刷新缓存的线程池，每个品种同一时间最多一个刷新任务
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="qvix-refresh")
+        self._refresh_locks = {symbol: threading.Lock() for symbol in QvixSymbol}
+        # 进程内缓存 {cache_key: (过期时间, 数据)}，位于Redis之前，短时间内的重复请求无需网络往返
+        self._l1: Dict[str, tuple] = {}
+        # 正在从上游获取数据的品种 {symbol: 完成事件}，用于合并并发的缓存未命中请求
+        self._inflight: Dict[QvixSymbol, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+        # 批量获取时并发请求未命中缓存品种的线程池
+        self._pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="qvix-fetch")
     
     def set_proxy(self, proxy: Optional[str|dict] = None):
         """设置HTTP代理
@@ -26,1020 +163,353 @@ class OptionQvixDataService(DataService):
                  或字符串格式，如 "http://127.0.0.1:1080"
         """
         self.proxy = proxy
-        
-    def get_50etf_qvix(self) -> List[Dict]:
-        """ 获取50ETF期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含50ETF期权波动率指数QVIX日线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:50etf"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取50ETF期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新50ETF期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_50etf_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新50ETF期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_50etf_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取50ETF期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_50etf_qvix(self) -> List[Dict]:
-        """ 获取50ETF期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_50etf_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取50ETF期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
 
-    def get_50etf_min_qvix(self) -> List[Dict]:
-        """ 获取50ETF期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含50ETF期权波动率指数QVIX分钟线数据
+    @staticmethod
+    def _to_feather(df: pd.DataFrame) -> bytes:
+        """将DataFrame编码为Zstd压缩的Arrow Feather(V2，即Arrow IPC文件格式)字节串"""
+        # QVIX为两位小数的百分比，float32精度足够，数值列体积减半
+        float_columns = df.select_dtypes('float64').columns
+        if len(float_columns):
+            df = df.astype({c: 'float32' for c in float_columns})
+        sink = io.BytesIO()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        feather.write_feather(table, sink, compression='zstd', compression_level=3)
+        return sink.getvalue()
+
+    @classmethod
+    def _encode(cls, df: pd.DataFrame) -> str:
+        """将DataFrame编码为Feather数据块
+
+        缓存层以JSON文本形式写入Redis/SQLite，因此二进制数据块以base64字符串保存
         """
-        # 生成缓存键
-        cache_key = "option_qvix:50etf_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取50ETF期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新50ETF期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_50etf_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新50ETF期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+        return base64.b64encode(cls._to_feather(df)).decode('ascii')
 
-        try:
-            # 获取实时数据
-            result = self._fetch_50etf_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取50ETF期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+    @staticmethod
+    def _decode(buf: str) -> "pa.Table":
+        """将Feather数据块解码为Arrow表"""
+        return feather.read_table(io.BytesIO(base64.b64decode(buf)))
 
-    def _fetch_50etf_min_qvix(self) -> List[Dict]:
-        """ 获取50ETF期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_50etf_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取50ETF期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
+    @staticmethod
+    def _table_to_records(table: "pa.Table") -> List[Dict]:
+        """用Arrow将表转换为字典列表
 
-    def get_300etf_qvix(self) -> List[Dict]:
-        """ 获取300ETF期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含300ETF期权波动率指数QVIX日线数据
+        日期列转为字符串；float32列经最短十进制表示还原为float64，避免输出17.229999542236328这类数值
         """
-        # 生成缓存键
-        cache_key = "option_qvix:300etf"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取300ETF期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新300ETF期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_300etf_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新300ETF期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
+        for i, field in enumerate(table.schema):
+            if pa.types.is_date(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+            elif pa.types.is_float32(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()).cast(pa.float64()))
+        return table.to_pylist()
+
+    @staticmethod
+    def _stringify_date(df: pd.DataFrame) -> pd.DataFrame:
+        """日期列统一为字符串格式"""
+        if 'date' in df:
+            dates = df['date']
+            if np.issubdtype(dates.dtype, np.datetime64):
+                # datetime64列用NumPy向量化转换，无需逐个元素调用str()
+                df = df.assign(date=np.datetime_as_string(dates.to_numpy(), unit='D'))
             else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_300etf_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取300ETF期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_300etf_qvix(self) -> List[Dict]:
-        """ 获取300ETF期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_300etf_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取300ETF期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
-
-    def get_300etf_min_qvix(self) -> List[Dict]:
-        """ 获取300ETF期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含300ETF期权波动率指数QVIX分钟线数据
+                df = df.assign(date=dates.astype(str))
+        return df
+
+    @classmethod
+    def _to_records(cls, data: Any) -> List[Dict]:
+        """将DataFrame或按列存储的缓存数据转换为字典列表，日期列统一为字符串格式"""
+        if is_columnar(data):
+            return columnar_to_records(data)
+        if not isinstance(data, pd.DataFrame):
+            return data
+        if len(data.index) == 0:
+            return []
+        if ARROW_AVAILABLE:
+            return cls._table_to_records(pa.Table.from_pandas(data, preserve_index=False))
+        return df_to_records(cls._stringify_date(data))
+
+    def get_cached_data(self, cache_key: str|QvixSymbol) -> Optional[Any]:
+        """从缓存获取数据，Feather数据块解码为字典列表
+
+        cache_key 可以是QvixSymbol，按下标直接查表得到缓存键
         """
-        # 生成缓存键
-        cache_key = "option_qvix:300etf_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取300ETF期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新300ETF期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_300etf_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新300ETF期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_300etf_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取300ETF期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+        if isinstance(cache_key, int):
+            cache_key = _CACHE_KEYS[cache_key]
 
-    def _fetch_300etf_min_qvix(self) -> List[Dict]:
-        """ 获取300ETF期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_300etf_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取300ETF期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
+        # 先查进程内缓存，未命中再查Redis/数据库
+        entry = self._l1.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
 
-    def get_500etf_qvix(self) -> List[Dict]:
-        """ 获取500ETF期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含500ETF期权波动率指数QVIX日线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:500etf"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
+        cached_data = self._decode_cached(cache_key, super().get_cached_data(cache_key))
         if cached_data is not None:
-            logger.info(f"从缓存获取500ETF期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新500ETF期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_500etf_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新500ETF期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
+            self._remember(cache_key, cached_data)
+        return cached_data
+
+    def get_cached_data_many(self, cache_keys: List[str|QvixSymbol]) -> Dict[str, Optional[Any]]:
+        """批量从缓存获取数据，进程内缓存未命中的键通过一次MGET读取"""
+        results = {}
+        pending = []
+        now = time.monotonic()
+        for cache_key in cache_keys:
+            if isinstance(cache_key, int):
+                cache_key = _CACHE_KEYS[cache_key]
+            entry = self._l1.get(cache_key)
+            if entry is not None and entry[0] > now:
+                results[cache_key] = entry[1]
             else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_500etf_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取500ETF期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_500etf_qvix(self) -> List[Dict]:
-        """ 获取500ETF期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_500etf_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取500ETF期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
-
-    def get_500etf_min_qvix(self) -> List[Dict]:
-        """ 获取500ETF期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含500ETF期权波动率指数QVIX分钟线数据
+                pending.append(cache_key)
+
+        if pending:
+            for cache_key, raw in super().get_cached_data_many(pending).items():
+                cached_data = self._decode_cached(cache_key, raw)
+                if cached_data is not None:
+                    self._remember(cache_key, cached_data)
+                results[cache_key] = cached_data
+        return results
+
+    def _remember(self, cache_key: str, cached_data: Any):
+        """写入进程内缓存"""
+        if len(self._l1) >= _L1_MAXSIZE:
+            self._prune_l1()
+        self._l1[cache_key] = (time.monotonic() + _L1_TTL, cached_data)
+
+    def _decode_cached(self, cache_key: str, cached_data: Any) -> Optional[Any]:
+        """解码从Redis/数据库获取的缓存数据"""
+        if isinstance(cached_data, str):
+            try:
+                return self._table_to_records(self._decode(cached_data))
+            except Exception:
+                logger.warning("解码缓存数据失败: %s", cache_key, exc_info=True)
+                return None
+        return self._to_records(cached_data)
+
+    def _prune_l1(self):
+        """清理进程内缓存中已过期的条目，仍然超出容量时清空"""
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self._l1.items()):
+            if expires_at <= now:
+                self._l1.pop(key, None)
+        if len(self._l1) >= _L1_MAXSIZE:
+            self._l1.clear()
+
+    def set_cached_data(self, cache_key: str|QvixSymbol, data: Any, expiry: int = 3600) -> bool:
+        """设置缓存数据，DataFrame在pyarrow可用时以Feather数据块保存，否则按列保存"""
+        if isinstance(cache_key, int):
+            cache_key = _CACHE_KEYS[cache_key]
+        self._l1.pop(cache_key, None)
+        if isinstance(data, pd.DataFrame):
+            if ARROW_AVAILABLE:
+                try:
+                    return super().set_cached_data(cache_key, self._encode(data), expiry)
+                except Exception:
+                    logger.warning("编码Feather数据块失败，改用按列格式缓存", exc_info=True)
+            data = df_to_columnar(self._stringify_date(data))
+        return super().set_cached_data(cache_key, data, expiry)
+
+    def _fresh_or_cached(self, symbol: QvixSymbol) -> List[Dict]:
+        """获取数据(带缓存支持)
+
+        缓存存在时立即返回缓存数据，若需要更新则在后台线程中刷新缓存(stale-while-revalidate)；
+        没有缓存时同步获取最新数据，获取失败返回空列表
         """
-        # 生成缓存键
-        cache_key = "option_qvix:500etf_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
+        cached_data = self.get_cached_data(symbol)
         if cached_data is not None:
-            logger.info(f"从缓存获取500ETF期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新500ETF期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_500etf_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新500ETF期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+            return self._serve_cached(symbol, cached_data)
 
-        try:
-            # 获取实时数据
-            result = self._fetch_500etf_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取500ETF期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+        return self._fetch_coalesced(symbol)
 
-    def _fetch_500etf_min_qvix(self) -> List[Dict]:
-        """ 获取500ETF期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_500etf_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取500ETF期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
+    def _fetch_coalesced(self, symbol: QvixSymbol) -> List[Dict]:
+        """缓存未命中时获取数据
 
-    def get_cyb_qvix(self) -> List[Dict]:
-        """ 获取创业板期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含创业板期权波动率指数QVIX日线数据
+        同一品种的并发请求只由第一个线程访问上游，其余线程等待其完成后读取缓存
         """
-        # 生成缓存键
-        cache_key = "option_qvix:cyb"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取创业板期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新创业板期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_cyb_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新创业板期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
+        with self._inflight_lock:
+            event = self._inflight.get(symbol)
+            leader = event is None
+            if leader:
+                event = self._inflight[symbol] = threading.Event()
+
+        if not leader:
+            event.wait(timeout=_INFLIGHT_TIMEOUT)
+            cached_data = self.get_cached_data(symbol)
+            if cached_data is not None:
                 return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_cyb_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取创业板期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_cyb_qvix(self) -> List[Dict]:
-        """ 获取创业板期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_cyb_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取创业板期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
-
-    def get_cyb_min_qvix(self) -> List[Dict]:
-        """ 获取创业板期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含创业板期权波动率指数QVIX分钟线数据
+            # 等待超时或上游获取失败，自行获取
+            return self._to_records(self._refresh(symbol))
+
+        try:
+            return self._to_records(self._refresh(symbol))
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(symbol, None)
+            event.set()
+
+    def _serve_cached(self, symbol: QvixSymbol, cached_data: List[Dict]) -> List[Dict]:
+        """返回缓存数据，需要更新时提交后台刷新任务"""
+        desc = _REGISTRY[symbol].desc
+        logger.info("从缓存获取%s: %s", desc, symbol.key)
+        if self._is_stale(symbol, cached_data):
+            logger.info("检测到需要更新%s，后台刷新缓存", desc)
+            self._schedule_refresh(symbol)
+        return cached_data
+
+    @staticmethod
+    def _meta_key(symbol: QvixSymbol) -> str:
+        """缓存元数据的键，元数据记录缓存数据的最新日期和获取时间"""
+        return f"{symbol.key}:meta"
+
+    def _is_stale(self, symbol: QvixSymbol, cached_data: List[Dict]) -> bool:
+        """判断缓存数据是否需要更新
+
+        优先只用元数据中的最新日期判断，无需扫描整个缓存数据；没有元数据时回退到逐条扫描(cached_data为None时视为无需更新)
         """
-        # 生成缓存键
-        cache_key = "option_qvix:cyb_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取创业板期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新创业板期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_cyb_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新创业板期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
+        meta = self.get_cached_data(self._meta_key(symbol))
+        if isinstance(meta, dict) and meta.get("last_date"):
+            return self._need_incremental_update([{meta["field"]: meta["last_date"]}])
+        return self._need_incremental_update(cached_data)
+
+    def _refresh(self, symbol: QvixSymbol) -> pd.DataFrame:
+        """获取最新数据并更新缓存及其元数据，失败时返回空DataFrame"""
+        spec = _REGISTRY[symbol]
+        new_data = self._fetch(symbol)
+        if len(new_data.index):
+            field = 'date' if 'date' in new_data else new_data.columns[0]
+            meta = {
+                "field": field,
+                "last_date": new_data[field].dropna().astype(str).max(),
+                "rows": len(new_data.index),
+                "fetched_at": time.time(),
+            }
+            cached_meta = self.get_cached_data(self._meta_key(symbol))
+            if (isinstance(cached_meta, dict) and cached_meta.get("last_date") == meta["last_date"]
+                    and cached_meta.get("rows") == meta["rows"]):
+                # 上游没有新增数据，缓存数据保持不变，只更新元数据中的获取时间，
+                # 并与元数据同时顺延数据的过期时间，避免数据先于元数据过期
+                logger.info("%s没有新增数据，跳过缓存更新", spec.desc)
+                self.touch_cached_data(symbol.key, spec.expiry)
             else:
-                return cached_data
+                self.set_cached_data(symbol, new_data, expiry=spec.expiry)
+                logger.info("已更新%s缓存", spec.desc)
+            self.set_cached_data(self._meta_key(symbol), meta, expiry=spec.expiry)
+        return new_data
 
-        try:
-            # 获取实时数据
-            result = self._fetch_cyb_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取创业板期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+    def _schedule_refresh(self, symbol: QvixSymbol):
+        """提交后台刷新任务，同一品种已有刷新任务在执行时直接跳过"""
+        lock = self._refresh_locks[symbol]
+        if not lock.acquire(blocking=False):
+            return
 
-    def _fetch_cyb_min_qvix(self) -> List[Dict]:
-        """ 获取创业板期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_cyb_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取创业板期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
-
-    def get_kcb_qvix(self) -> List[Dict]:
-        """ 获取科创板期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含科创板期权波动率指数QVIX日线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:kcb"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取科创板期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新科创板期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_kcb_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新科创板期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+        def task():
+            try:
+                self._refresh(symbol)
+            finally:
+                lock.release()
 
-        try:
-            # 获取实时数据
-            result = self._fetch_kcb_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取科创板期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
+        self._executor.submit(task)
 
-    def _fetch_kcb_qvix(self) -> List[Dict]:
-        """ 获取科创板期权波动率指数QVIX日线数据的实际实现 """
+    def _fetch(self, symbol: QvixSymbol) -> pd.DataFrame:
+        """ 获取QVIX数据的实际实现 """
+        spec = _REGISTRY[symbol]
         try:
-            df = index_option_qvix.index_option_kcb_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
+            # session为None时使用index_option_qvix中带重试策略的共享会话
+            return _fetcher(symbol)(proxy=self.proxy)
         except Exception as e:
-            logger.error(f"获取科创板期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
+            logger.error("获取%s失败: %s", spec.desc, e, exc_info=True)
+            return pd.DataFrame()
 
-    def get_kcb_min_qvix(self) -> List[Dict]:
-        """ 获取科创板期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含科创板期权波动率指数QVIX分钟线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:kcb_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取科创板期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新科创板期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_kcb_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新科创板期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+    def get_qvix_many(self, symbols: List[QvixSymbol]) -> Dict[QvixSymbol, List[Dict]]:
+        """ 批量获取多个QVIX品种数据(带缓存支持)
 
-        try:
-            # 获取实时数据
-            result = self._fetch_kcb_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取科创板期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_kcb_min_qvix(self) -> List[Dict]:
-        """ 获取科创板期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_kcb_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取科创板期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
+        先读取各品种缓存，未命中的品种提交到线程池并发获取，总耗时取决于最慢的一次请求
 
-    def get_100etf_qvix(self) -> List[Dict]:
-        """ 获取深证100ETF期权波动率指数QVIX日线数据(带缓存支持)
-        
+        参数:
+            symbols: QVIX品种列表
         返回:
-            List[Dict]: 包含深证100ETF期权波动率指数QVIX日线数据
+            Dict[QvixSymbol, List[Dict]]: 品种到数据的映射
         """
-        # 生成缓存键
-        cache_key = "option_qvix:100etf"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取深证100ETF期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新深证100ETF期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_100etf_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新深证100ETF期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
+        # 一次批量读取所有品种的缓存数据及元数据，元数据进入进程内缓存供_is_stale使用
+        cached = self.get_cached_data_many([symbol.key for symbol in symbols]
+                                           + [self._meta_key(symbol) for symbol in symbols])
+        results = {}
+        misses = []
+        for symbol in symbols:
+            cached_data = cached[symbol.key]
+            if cached_data is None:
+                misses.append(symbol)
             else:
-                return cached_data
+                results[symbol] = self._serve_cached(symbol, cached_data)
 
-        try:
-            # 获取实时数据
-            result = self._fetch_100etf_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取深证100ETF期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
+        futures = {symbol: self._pool.submit(self._fetch_coalesced, symbol) for symbol in misses}
+        for symbol, future in futures.items():
+            results[symbol] = future.result()
+        return results
 
-    def _fetch_100etf_qvix(self) -> List[Dict]:
-        """ 获取深证100ETF期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_100etf_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取深证100ETF期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
+    def get_qvix_arrow(self, symbol: QvixSymbol) -> bytes:
+        """ 获取QVIX数据的Arrow IPC文件格式字节串(带缓存支持)
 
-    def get_100etf_min_qvix(self) -> List[Dict]:
-        """ 获取深证100ETF期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含深证100ETF期权波动率指数QVIX分钟线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:100etf_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取深证100ETF期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新深证100ETF期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_100etf_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新深证100ETF期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_100etf_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取深证100ETF期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+        缓存中的Feather数据块即为Arrow IPC文件格式，直接返回而不构造字典列表，
+        调用方使用pyarrow.ipc.open_file或pyarrow.feather.read_table读取
 
-    def _fetch_100etf_min_qvix(self) -> List[Dict]:
-        """ 获取深证100ETF期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_100etf_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取深证100ETF期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
-
-    def get_300index_qvix(self) -> List[Dict]:
-        """ 获取中证300股指期权波动率指数QVIX日线数据(带缓存支持)
-        
+        参数:
+            symbol: QVIX品种
         返回:
-            List[Dict]: 包含中证300股指期权波动率指数QVIX日线数据
+            bytes: Arrow IPC文件格式数据，获取失败时为空字节串
         """
-        # 生成缓存键
-        cache_key = "option_qvix:300index"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取中证300股指期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新中证300股指期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_300index_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新中证300股指期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+        if not ARROW_AVAILABLE:
+            raise ImportError("get_qvix_arrow需要安装pyarrow")
 
-        try:
-            # 获取实时数据
-            result = self._fetch_300index_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取中证300股指期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
+        cached_data = super().get_cached_data(symbol.key)
+        if isinstance(cached_data, str):
+            if self._is_stale(symbol, None):
+                self._schedule_refresh(symbol)
+            return base64.b64decode(cached_data)
 
-    def _fetch_300index_qvix(self) -> List[Dict]:
-        """ 获取中证300股指期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_300index_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取中证300股指期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
+        new_data = self._refresh(symbol)
+        if len(new_data.index) == 0:
+            return b""
+        return self._to_feather(new_data)
 
-    def get_300index_min_qvix(self) -> List[Dict]:
-        """ 获取中证300股指期权波动率指数QVIX分钟线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含中证300股指期权波动率指数QVIX分钟线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:300index_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取中证300股指期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新中证300股指期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_300index_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新中证300股指期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+    def get_qvix_board(self) -> Dict[QvixSymbol, List[Dict]]:
+        """ 获取全部QVIX品种数据(带缓存支持)
 
-        try:
-            # 获取实时数据
-            result = self._fetch_300index_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取中证300股指期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+        所有品种的缓存通过一次批量读取获得，未命中的品种并发获取
 
-    def _fetch_300index_min_qvix(self) -> List[Dict]:
-        """ 获取中证300股指期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_300index_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取中证300股指期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
-
-    def get_1000index_qvix(self) -> List[Dict]:
-        """ 获取中证1000股指期权波动率指数QVIX日线数据(带缓存支持)
-        
         返回:
-            List[Dict]: 包含中证1000股指期权波动率指数QVIX日线数据
+            Dict[QvixSymbol, List[Dict]]: 品种到数据的映射
         """
-        # 生成缓存键
-        cache_key = "option_qvix:1000index"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取中证1000股指期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新中证1000股指期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_1000index_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新中证1000股指期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+        return self.get_qvix_many(list(_REGISTRY))
 
-        try:
-            # 获取实时数据
-            result = self._fetch_1000index_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取中证1000股指期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
+    def get_qvix_rows(self, symbol: QvixSymbol) -> List[NamedTuple]:
+        """ 获取QVIX数据的NamedTuple记录列表(带缓存支持)
 
-    def _fetch_1000index_qvix(self) -> List[Dict]:
-        """ 获取中证1000股指期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_1000index_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取中证1000股指期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
+        记录类型为QvixDailyRecord或QvixMinuteRecord，占用内存远小于字典记录，
+        适合在进程内长期持有的长序列；需要字典时调用记录的_asdict()
 
-    def get_1000index_min_qvix(self) -> List[Dict]:
-        """ 获取中证1000股指期权波动率指数QVIX分钟线数据(带缓存支持)
-        
+        参数:
+            symbol: QVIX品种
         返回:
-            List[Dict]: 包含中证1000股指期权波动率指数QVIX分钟线数据
+            List[NamedTuple]: QVIX记录列表
         """
-        # 生成缓存键
-        cache_key = "option_qvix:1000index_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取中证1000股指期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新中证1000股指期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_1000index_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新中证1000股指期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_1000index_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取中证1000股指期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
+        records = self._fresh_or_cached(symbol)
+        record_type = QvixMinuteRecord if symbol.name.endswith("_MIN") else QvixDailyRecord
+        return [record_type._make(map(record.get, record_type._fields)) for record in records]
 
-    def _fetch_1000index_min_qvix(self) -> List[Dict]:
-        """ 获取中证1000股指期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_1000index_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取中证1000股指期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
+def _make_getter(symbol: QvixSymbol) -> Callable[[OptionQvixDataService], List[Dict]]:
+    """按注册表生成get_*方法，如QvixSymbol.ETF50生成get_50etf_qvix"""
+    desc = _REGISTRY[symbol].desc
 
-    def get_50index_qvix(self) -> List[Dict]:
-        """ 获取上证50股指期权波动率指数QVIX日线数据(带缓存支持)
-        
-        返回:
-            List[Dict]: 包含上证50股指期权波动率指数QVIX日线数据
-        """
-        # 生成缓存键
-        cache_key = "option_qvix:50index"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取上证50股指期权波动率指数QVIX日线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新上证50股指期权波动率指数QVIX日线数据")
-                # 获取最新数据
-                new_data = self._fetch_50index_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新上证50股指期权波动率指数QVIX日线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+    def getter(self) -> List[Dict]:
+        return self._fresh_or_cached(symbol)
 
-        try:
-            # 获取实时数据
-            result = self._fetch_50index_qvix()
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取上证50股指期权波动率指数QVIX日线数据时发生错误：{str(e)}")
-            return []
+    getter.__name__ = f"get_{symbol.key.split(':', 1)[1]}_qvix"
+    getter.__qualname__ = f"{OptionQvixDataService.__name__}.{getter.__name__}"
+    getter.__doc__ = f""" 获取{desc}(带缓存支持)
 
-    def _fetch_50index_qvix(self) -> List[Dict]:
-        """ 获取上证50股指期权波动率指数QVIX日线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_50index_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            # 确保日期列是字符串格式
-            df['date'] = df['date'].astype(str)
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取上证50股指期权波动率指数QVIX日线数据失败: {str(e)}")
-            return []
-
-    def get_50index_min_qvix(self) -> List[Dict]:
-        """ 获取上证50股指期权波动率指数QVIX分钟线数据(带缓存支持)
-        
         返回:
-            List[Dict]: 包含上证50股指期权波动率指数QVIX分钟线数据
+            List[Dict]: 包含{desc}
         """
-        # 生成缓存键
-        cache_key = "option_qvix:50index_min"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取上证50股指期权波动率指数QVIX分钟线数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新上证50股指期权波动率指数QVIX分钟线数据")
-                # 获取最新数据
-                new_data = self._fetch_50index_min_qvix()
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=300)  # 实时数据缓存5分钟
-                    logger.info("已更新上证50股指期权波动率指数QVIX分钟线数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+    return getter
 
-        try:
-            # 获取实时数据
-            result = self._fetch_50index_min_qvix()
-            
-            # 缓存数据5分钟
-            if result:
-                self.set_cached_data(cache_key, result, expiry=300)
-            return result
-        except Exception as e:
-            logger.error(f"获取上证50股指期权波动率指数QVIX分钟线数据时发生错误：{str(e)}")
-            return []
-
-    def _fetch_50index_min_qvix(self) -> List[Dict]:
-        """ 获取上证50股指期权波动率指数QVIX分钟线数据的实际实现 """
-        try:
-            df = index_option_qvix.index_option_50index_min_qvix(proxy=self.proxy)
-            
-            if df.empty:
-                return []
-            
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取上证50股指期权波动率指数QVIX分钟线数据失败: {str(e)}")
-            return []
\ No newline at end of file
+for _symbol in _REGISTRY:
+    _getter = _make_getter(_symbol)
+    setattr(OptionQvixDataService, _getter.__name__, _getter)
@@ -1,25 +1,293 @@
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 import pandas as pd
 from datetime import datetime, timedelta
-import sys
-import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+import importlib
+import threading
+import time
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from .data_service import DataService, adjust_start_date, adjust_end_date
-from qh_list import FuturesList
-from qh_lhb import FuturesLHB
-from qh_ccjg import FuturesCCJG
-from qh_jcgc import FuturesJCGC
+from .data_service import (DataService, adjust_start_date, adjust_end_date, df_to_records, df_to_columnar,
+                           columnar_to_records, is_columnar)
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _qh_module(name: str):
+    """延迟导入期货接口模块(qh_list、qh_lhb等)，只有用到对应接口时才加载"""
+    try:
+        return importlib.import_module(f"..{name}", __package__)
+    except ImportError:
+        # dataservices作为顶层包导入时(StockMCP目录已在sys.path中)
+        return importlib.import_module(name)
+
+@lru_cache(maxsize=32)
+def _client(module: str, class_name: str, cookies: Optional[frozenset]):
+    """ 按(接口类, cookies)缓存的接口实例，同一实例复用其requests.Session的连接池 """
+    return getattr(_qh_module(module), class_name)(cookies=dict(cookies) if cookies else None)
+
+def _cookies_key(cookies: Optional[Dict[str, str]]) -> Optional[frozenset]:
+    return frozenset(cookies.items()) if cookies else None
+
+def _futures_lhb(cookies: Optional[Dict[str, str]] = None):
+    return _client("qh_lhb", "FuturesLHB", _cookies_key(cookies))
+
+def _futures_ccjg(cookies: Optional[Dict[str, str]] = None):
+    return _client("qh_ccjg", "FuturesCCJG", _cookies_key(cookies))
+
+def _futures_jcgc(cookies: Optional[Dict[str, str]] = None):
+    return _client("qh_jcgc", "FuturesJCGC", _cookies_key(cookies))
+
+# 空结果的缓存标记及其过期时间(秒)，避免反复请求节假日、无效代码等不存在的数据。
+# 标记以{"__empty__": 写入时间戳}保存，缓存同时写入不会过期的SQLite，读取时按写入时间判断是否过期
+_EMPTY_SENTINEL = "__empty__"
+_EMPTY_EXPIRY = 300
+# 键中带交易日标识的缓存的过期时间(秒)，交易日切换时缓存键随之变化
+_TRADING_DAY_EXPIRY = 86400
+# 合并记录数超过该值时改用pandas按列去重，否则逐条放入字典合并
+_FRAME_MERGE_THRESHOLD = 2000
+
+def _empty_marker() -> Dict[str, float]:
+    """生成空结果标记"""
+    return {_EMPTY_SENTINEL: time.time()}
+
+def _empty_marker_fresh(cached_data: Any) -> Optional[bool]:
+    """ 缓存数据为空结果标记时返回标记是否仍在有效期内，不是标记时返回None
+
+    旧版本写入的字符串标记没有写入时间，视为已过期
+    """
+    if isinstance(cached_data, str):
+        return False if cached_data == _EMPTY_SENTINEL else None
+    if isinstance(cached_data, dict) and _EMPTY_SENTINEL in cached_data:
+        return time.time() - cached_data[_EMPTY_SENTINEL] < _EMPTY_EXPIRY
+    return None
+
+def _first_column(df: pd.DataFrame, candidates: Tuple[str, ...]) -> Optional[str]:
+    """返回candidates中第一个存在于df的列名"""
+    for column in candidates:
+        if column in df.columns:
+            return column
+    return None
+
+def _date_column(df: pd.DataFrame) -> Optional[str]:
+    """返回建仓过程数据中的日期列名"""
+    return _first_column(df, ("交易日期", "日期", "TRADE_DATE"))
+
+def _to_columnar(df: pd.DataFrame) -> Optional[Dict[str, list]]:
+    """ 将DataFrame转换为按列存储的缓存数据，每列一个列表，不再为每行构造字典。DataFrame为空时返回None """
+    if len(df.index) == 0:
+        return None
+    return df_to_columnar(df)
+
+def _records(cached_data: Any) -> List[Dict]:
+    """ 将按列存储的缓存数据展开为字典列表，旧格式的字典列表原样返回 """
+    if is_columnar(cached_data):
+        return columnar_to_records(cached_data)
+    return cached_data
+
+def _scan_date_range(df: pd.DataFrame) -> Optional[Tuple[datetime, datetime]]:
+    """ 对日期列做一次向量化解析，返回(最早日期, 最晚日期)，没有可解析的日期时返回None """
+    date_column = _date_column(df)
+    if date_column is None:
+        return None
+    dates = pd.to_datetime(df[date_column], errors='coerce')
+    if dates.isna().all():
+        return None
+    return dates.min().to_pydatetime(), dates.max().to_pydatetime()
+
+def _with_date_range(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """ 生成带日期范围的按列缓存数据 {"columns": [...], "data": [...], "min_date": ..., "max_date": ...}
+
+    写入缓存时计算一次最早和最晚交易日期，增量检查时直接读取，不再逐条解析日期。
+    fetched_on记录写入时的最近交易日，同一交易日内无需再检查增量更新。DataFrame为空时返回None
+    """
+    payload = _to_columnar(df)
+    if payload is None:
+        return None
+    payload["fetched_on"] = DataService._latest_trading_day().date().isoformat()
+    payload["min_date"] = payload["max_date"] = None
+    date_range = _scan_date_range(df)
+    if date_range is not None:
+        payload["min_date"] = date_range[0].date().isoformat()
+        payload["max_date"] = date_range[1].date().isoformat()
+    return payload
+
+def _split_date_range(cached_data: Any) -> Tuple[pd.DataFrame, Optional[Tuple[datetime, datetime]], Optional[str]]:
+    """ 拆分带日期范围的缓存数据，返回(DataFrame, (最早日期, 最晚日期), 写入时的最近交易日)
+
+    旧格式缓存的日期范围和交易日为None
+    """
+    if not is_columnar(cached_data):
+        return pd.DataFrame(cached_data), None, None
+    df = pd.DataFrame(dict(zip(cached_data["columns"], cached_data["data"])), columns=cached_data["columns"])
+    fetched_on = cached_data.get("fetched_on")
+    min_date, max_date = cached_data.get("min_date"), cached_data.get("max_date")
+    if not min_date or not max_date:
+        return df, None, fetched_on
+    return df, (datetime.fromisoformat(min_date), datetime.fromisoformat(max_date)), fetched_on
+
 class QhDataService(DataService):
     """期货数据类，封装期货相关数据获取逻辑"""
     def __init__(self):
         super().__init__()
-        self.futures_list = FuturesList()
-        
+        # 正在进行的上游请求，键为缓存键
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @cached_property
+    def futures_list(self):
+        """期货品种列表接口，首次使用时创建"""
+        return _qh_module("qh_list").FuturesList()
+
+    def _coalesce(self, cache_key: str, fn: Callable[..., Any], *args,
+                  pack: Callable[[pd.DataFrame], Optional[Dict]] = _to_columnar, expiry: int = 3600,
+                  **kwargs) -> pd.DataFrame:
+        """ 合并相同缓存键的并发请求
+
+        第一个请求在当前线程中调用fn获取DataFrame，并将pack(DataFrame)写入缓存，
+        其余并发请求等待同一个Future的结果，不再重复请求上游接口。pack返回None时写入空结果标记。
+        fn遇到网络或上游错误时应抛出异常而不是返回空DataFrame，此时不写入缓存，避免临时故障被当作无数据缓存
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not leader:
+            logger.debug("等待进行中的请求: %s", cache_key)
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+            payload = pack(result)
+            if payload:
+                # 默认缓存数据1小时
+                self.set_cached_data(cache_key, payload, expiry=expiry)
+            else:
+                # 空结果以较短的过期时间缓存
+                self.set_cached_data(cache_key, _empty_marker(), expiry=_EMPTY_EXPIRY)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _cached_fetch(self, cache_key: str, desc: str, fetch_fn: Callable[..., pd.DataFrame],
+                      on_hit: Callable[[Any], List[Dict]] = _records,
+                      pack: Callable[[pd.DataFrame], Optional[Dict]] = _to_columnar, expiry: int = 3600,
+                      **kwargs) -> List[Dict]:
+        """ 带缓存的数据获取流程
+
+        缓存命中时交给on_hit处理缓存数据，未命中时通过_coalesce调用fetch_fn获取实时数据并写入缓存
+        """
+        cached_data = self.get_cached_data(cache_key)
+        empty_fresh = _empty_marker_fresh(cached_data)
+        if empty_fresh:
+            logger.info(f"缓存标记为无数据: {cache_key}")
+            return []
+        if empty_fresh is False:
+            # Redis过期后会从SQLite重新读到标记，超过有效期的标记视为未命中
+            cached_data = None
+        try:
+            if cached_data is not None:
+                logger.info(f"从缓存获取{desc}数据: {cache_key}")
+                # on_hit可能解析请求参数(如日期)或增量更新，与获取实时数据使用同一错误处理
+                return on_hit(cached_data)
+
+            # 获取实时数据，相同缓存键的并发请求只发起一次，DataFrame在返回前才转换为字典列表
+            return df_to_records(self._coalesce(cache_key, fetch_fn, pack=pack, expiry=expiry, **kwargs))
+        except Exception as e:
+            logger.error(f"获取{desc}数据时发生错误：{str(e)}")
+            return []
+
+    def _on_jcgc_data_hit(self, cache_key: str, security_code: str, org_code: str,
+                          start_date: Optional[str], end_date: Optional[str], cookies: Optional[Dict],
+                          use_chinese_fields: bool, cached_data: Any) -> List[Dict]:
+        """建仓过程数据缓存命中时的处理：覆盖请求范围直接返回，否则按需增量更新"""
+        cached_data, date_range, fetched_on = _split_date_range(cached_data)
+        # 缓存已覆盖请求的日期范围时直接返回，无需检查增量更新
+        if start_date:
+            window_end = datetime.fromisoformat(end_date) if end_date else datetime.now()
+            covered = self._slice_covered_window(
+                cached_data, date_range, adjust_start_date(datetime.fromisoformat(start_date)), window_end)
+            if covered is not None:
+                return covered
+        # 检查是否需要增量更新
+        if not self._fetched_on_latest_trading_day(fetched_on) \
+                and self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            logger.info("检测到需要增量更新建仓过程数据")
+            incremental_data = self._get_incremental_qh_jcgc_data(
+                cached_data, security_code, org_code, start_date, end_date, cookies, use_chinese_fields,
+                date_range=date_range)
+            if len(incremental_data.index) > 0:
+                # 合并数据
+                merged_data = self._merge_jcgc_data(cached_data, incremental_data)
+                # 更新缓存
+                self.set_cached_data(cache_key, _with_date_range(pd.DataFrame(merged_data)), expiry=3600)
+                logger.info(f"更新缓存数据，新增{len(incremental_data.index)}条记录")
+                return merged_data
+
+        return df_to_records(cached_data)
+
+    def _on_jcgc_history_hit(self, cache_key: str, security_code: str, org_code: str,
+                             days: int, end_date: Optional[str], cookies: Optional[Dict],
+                             use_chinese_fields: bool, cached_data: Any) -> List[Dict]:
+        """持仓历史数据缓存命中时的处理：覆盖请求范围直接返回，否则按需增量更新"""
+        cached_data, date_range, fetched_on = _split_date_range(cached_data)
+        # 缓存已覆盖请求的日期范围时直接返回，无需检查增量更新
+        window_end = adjust_end_date(datetime.fromisoformat(end_date) if end_date else datetime.now())
+        covered = self._slice_covered_window(
+            cached_data, date_range, adjust_start_date(window_end - timedelta(days=days)), window_end)
+        if covered is not None:
+            return covered
+        # 检查是否需要增量更新
+        if not self._fetched_on_latest_trading_day(fetched_on) and self._need_incremental_update(cached_data):
+            logger.info("检测到需要增量更新持仓历史数据")
+            incremental_data = self._get_incremental_qh_jcgc_history(
+                cached_data, security_code, org_code, days, end_date, cookies, use_chinese_fields,
+                date_range=date_range)
+            if len(incremental_data.index) > 0:
+                # 合并数据
+                merged_data = self._merge_jcgc_data(cached_data, incremental_data)
+                # 更新缓存
+                self.set_cached_data(cache_key, _with_date_range(pd.DataFrame(merged_data)), expiry=3600)
+                logger.info(f"更新缓存数据，新增{len(incremental_data.index)}条记录")
+                return merged_data
+
+        return df_to_records(cached_data)
+
+    def _trading_day_key(self, base_key: str) -> str:
+        """在缓存键中加入最近交易日，交易日切换后自动使用新的缓存"""
+        return f"{base_key}:td={self._latest_trading_day().date().isoformat()}"
+
+    def _slice_covered_window(self, cached_data: pd.DataFrame,
+                              date_range: Optional[Tuple[datetime, datetime]],
+                              window_start: datetime, window_end: datetime) -> Optional[List[Dict]]:
+        """ 缓存的日期范围覆盖[window_start, window_end]时，返回窗口内的缓存记录，否则返回None
+
+        window_end不晚于最近一个交易日，日期均按天比较
+        """
+        if date_range is None:
+            return None
+        window_start = window_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        window_end = min(window_end, self._latest_trading_day()).replace(hour=0, minute=0, second=0, microsecond=0)
+        earliest_cached_date, latest_cached_date = date_range
+        if earliest_cached_date > window_start or latest_cached_date < window_end:
+            return None
+        logger.info("缓存已覆盖请求的日期范围(%s至%s)", window_start.date(), window_end.date())
+        dates = pd.to_datetime(cached_data[_date_column(cached_data)], errors='coerce').dt.normalize()
+        return df_to_records(cached_data[(dates >= window_start) & (dates <= window_end)])
+
+    def _fetched_on_latest_trading_day(self, fetched_on: Optional[str]) -> bool:
+        """缓存是否在最近一个交易日写入，是则跳过逐条扫描的增量更新检查"""
+        return fetched_on is not None and fetched_on == self._latest_trading_day().date().isoformat()
+
     def get_futures_list(self,
         is_main_code: bool = True,
         use_chinese_fields: bool = True
@@ -33,67 +301,27 @@ class QhDataService(DataService):
         返回:
             List[Dict]: 包含期货品种数据的字典列表
         """
-        # 生成缓存键
-        cache_key = f"futures_list:{is_main_code}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取期货品种列表数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新期货品种列表数据")
-                # 获取最新数据
-                new_data = self._fetch_futures_list(
-                    is_main_code=is_main_code,
-                    use_chinese_fields=use_chinese_fields
-                )
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新期货品种列表数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_futures_list(
-                is_main_code=is_main_code,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取期货品种列表数据时发生错误：{str(e)}")
-            return []
+        # 生成缓存键，包含最近交易日，交易日变化后重新获取
+        cache_key = self._trading_day_key(f"futures_list:{is_main_code}:{use_chinese_fields}")
+        return self._cached_fetch(
+            cache_key,
+            "期货品种列表",
+            self._fetch_futures_list,
+            expiry=_TRADING_DAY_EXPIRY,
+            is_main_code=is_main_code,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def _fetch_futures_list(self,
         is_main_code: bool = True,
         use_chinese_fields: bool = True
-    ) -> List[Dict]:
+    ) -> pd.DataFrame:
         """ 获取期货品种列表数据的实际实现 """
-        try:
-            # 获取实时数据
-            df = self.futures_list.get_futures_list(
-                is_main_code=is_main_code,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                return []
-                
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取期货品种列表数据时发生错误：{str(e)}")
-            return []
+        # 获取实时数据
+        return self.futures_list.get_futures_list(
+            is_main_code=is_main_code,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def get_future_org_list(self,
         page_size: int = 200,
@@ -108,67 +336,27 @@ class QhDataService(DataService):
         返回:
             List[Dict]: 包含期货公司数据的字典列表
         """
-        # 生成缓存键
-        cache_key = f"future_org_list:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取期货公司列表数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新期货公司列表数据")
-                # 获取最新数据
-                new_data = self._fetch_future_org_list(
-                    page_size=page_size,
-                    use_chinese_fields=use_chinese_fields
-                )
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新期货公司列表数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_future_org_list(
-                page_size=page_size,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取期货公司列表数据时发生错误：{str(e)}")
-            return []
+        # 生成缓存键，包含最近交易日，交易日变化后重新获取
+        cache_key = self._trading_day_key(f"future_org_list:{use_chinese_fields}")
+        return self._cached_fetch(
+            cache_key,
+            "期货公司列表",
+            self._fetch_future_org_list,
+            expiry=_TRADING_DAY_EXPIRY,
+            page_size=page_size,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def _fetch_future_org_list(self,
         page_size: int = 200,
         use_chinese_fields: bool = True
-    ) -> List[Dict]:
+    ) -> pd.DataFrame:
         """ 获取期货公司列表数据的实际实现 """
-        try:
-            # 获取实时数据
-            df = self.futures_list.get_future_org_list(
-                page_size=page_size,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                return []
-                
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取期货公司列表数据时发生错误：{str(e)}")
-            return []
+        # 获取实时数据
+        return self.futures_list.get_future_org_list(
+            page_size=page_size,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def get_exchange_products(self,
         msgid: str,
@@ -183,67 +371,27 @@ class QhDataService(DataService):
         返回:
             List[Dict]: 包含交易所品种数据的字典列表
         """
-        # 生成缓存键
-        cache_key = f"exchange_products:{msgid}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取交易所品种列表数据: {cache_key}")
-            # 检查是否需要更新（基于交易日变化）
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新交易所品种列表数据")
-                # 获取最新数据
-                new_data = self._fetch_exchange_products(
-                    msgid=msgid,
-                    use_chinese_fields=use_chinese_fields
-                )
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新交易所品种列表数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
-
-        try:
-            # 获取实时数据
-            result = self._fetch_exchange_products(
-                msgid=msgid,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取交易所品种列表数据时发生错误：{str(e)}")
-            return []
+        # 生成缓存键，包含最近交易日，交易日变化后重新获取
+        cache_key = self._trading_day_key(f"exchange_products:{msgid}:{use_chinese_fields}")
+        return self._cached_fetch(
+            cache_key,
+            "交易所品种列表",
+            self._fetch_exchange_products,
+            expiry=_TRADING_DAY_EXPIRY,
+            msgid=msgid,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def _fetch_exchange_products(self,
         msgid: str,
         use_chinese_fields: bool = True
-    ) -> List[Dict]:
+    ) -> pd.DataFrame:
         """ 获取交易所可交易品种列表的实际实现 """
-        try:
-            # 获取实时数据
-            df = self.futures_list.get_exchange_products(
-                msgid=msgid,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                return []
-                
-            return df.to_dict(orient='records')
-        except Exception as e:
-            logger.error(f"获取交易所品种列表数据时发生错误：{str(e)}")
-            return []
+        # 获取实时数据
+        return self.futures_list.get_exchange_products(
+            msgid=msgid,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def get_qh_lhb_data(self,
         security_code: str,
@@ -264,34 +412,31 @@ class QhDataService(DataService):
         """
         # 生成缓存键，包含交易日期以支持按交易日更新
         cache_key = f"qh_lhb_data:{security_code}:{trade_date}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取期货龙虎榜数据: {cache_key}")
-            return cached_data
+        return self._cached_fetch(
+            cache_key,
+            "期货龙虎榜",
+            self._fetch_qh_lhb_data,
+            security_code=security_code,
+            trade_date=trade_date,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields
+        )
 
-        try:
-            # 获取实时数据
-            lhb = FuturesLHB(cookies=cookies)
-            df = lhb.get_data(
-                security_code=security_code,
-                trade_date=trade_date,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取期货龙虎榜数据时发生错误：{str(e)}")
-            return []
+    def _fetch_qh_lhb_data(self,
+        security_code: str,
+        trade_date: str,
+        cookies: Optional[Dict[str, str]] = None,
+        use_chinese_fields: bool = True,
+        sort_field: Optional[str] = None
+    ) -> pd.DataFrame:
+        """ 获取期货龙虎榜数据的实际实现 """
+        lhb = _futures_lhb(cookies)
+        return lhb.get_data(
+            security_code=security_code,
+            trade_date=trade_date,
+            sort_field=sort_field,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def get_qh_lhb_rank(self,
         security_code: str,
@@ -314,35 +459,16 @@ class QhDataService(DataService):
         """
         # 生成缓存键，包含交易日期以支持按交易日更新
         cache_key = f"qh_lhb_rank:{security_code}:{trade_date}:{rank_field}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取期货{rank_field}排名数据: {cache_key}")
-            return cached_data
-
-        try:
-            # 获取实时数据
-            lhb = FuturesLHB(cookies=cookies)
-            df = lhb.get_data(
-                security_code=security_code,
-                trade_date=trade_date,
-                sort_field=rank_field,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取期货排名数据时发生错误：{str(e)}")
-            return []
+        return self._cached_fetch(
+            cache_key,
+            "期货排名",
+            self._fetch_qh_lhb_data,
+            security_code=security_code,
+            trade_date=trade_date,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields,
+            sort_field=rank_field
+        )
 
     def get_qh_ccjg_data(self,
         org_code: str,
@@ -365,42 +491,40 @@ class QhDataService(DataService):
         """
         # 生成缓存键，包含交易日期以支持按交易日更新
         cache_key = f"qh_ccjg_data:{org_code}:{trade_date}:{market_name}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取期货公司持仓结构数据: {cache_key}")
-            return cached_data
+        return self._cached_fetch(
+            cache_key,
+            "期货公司持仓结构",
+            self._fetch_qh_ccjg_data,
+            org_code=org_code,
+            trade_date=trade_date,
+            market_name=market_name,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields
+        )
 
-        try:
-            # 获取实时数据
-            ccjg = FuturesCCJG(cookies=cookies)
-            df = ccjg.get_data(
-                org_code=org_code,
-                trade_date=trade_date,
-                market_name=market_name,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取期货公司持仓结构数据时发生错误：{str(e)}")
-            return []
+    def _fetch_qh_ccjg_data(self,
+        org_code: str,
+        trade_date: str,
+        market_name: str,
+        cookies: Optional[Dict[str, str]] = None,
+        use_chinese_fields: bool = True
+    ) -> pd.DataFrame:
+        """ 获取期货公司持仓结构数据的实际实现 """
+        ccjg = _futures_ccjg(cookies)
+        return ccjg.get_data(
+            org_code=org_code,
+            trade_date=trade_date,
+            market_name=market_name,
+            use_chinese_fields=use_chinese_fields
+        )
 
     def get_qh_ccjg_multi_market(self,
         org_code: str,
         trade_date: str,
         markets: List[str],
         cookies: Optional[Dict[str, str]] = None,
-        use_chinese_fields: bool = True
+        use_chinese_fields: bool = True,
+        prefer_server_batch: bool = False
     ) -> List[Dict]:
         """ 获取期货公司在多个市场的持仓数据(带缓存支持)
         
@@ -410,6 +534,7 @@ class QhDataService(DataService):
             markets: 市场名称列表(如上期所、中金所等)
             cookies: 请求cookies字典
             use_chinese_fields: 是否使用中文字段名，默认为True
+            prefer_server_batch: 是否逐个市场顺序获取，默认为False(并发获取各市场数据)
             
         返回:
             List[Dict]: 包含多市场持仓数据的字典列表
@@ -417,35 +542,84 @@ class QhDataService(DataService):
         # 生成缓存键，包含交易日期以支持按交易日更新
         markets_str = ",".join(markets)
         cache_key = f"qh_ccjg_multi_market:{org_code}:{trade_date}:{markets_str}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取多市场持仓数据: {cache_key}")
-            return cached_data
+        return self._cached_fetch(
+            cache_key,
+            "多市场持仓",
+            self._fetch_qh_ccjg_multi_market,
+            org_code=org_code,
+            trade_date=trade_date,
+            markets=markets,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields,
+            prefer_server_batch=prefer_server_batch
+        )
 
-        try:
-            # 获取实时数据
-            ccjg = FuturesCCJG(cookies=cookies)
-            df = ccjg.get_org_positions(
-                org_code=org_code,
-                trade_date=trade_date,
-                markets=markets,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取多市场持仓数据时发生错误：{str(e)}")
-            return []
+    def _fetch_qh_ccjg_multi_market(self,
+        org_code: str,
+        trade_date: str,
+        markets: List[str],
+        cookies: Optional[Dict[str, str]] = None,
+        use_chinese_fields: bool = True,
+        prefer_server_batch: bool = False
+    ) -> pd.DataFrame:
+        """ 获取期货公司多市场持仓数据的实际实现 """
+        ccjg = _futures_ccjg(cookies)
+        # 不使用FuturesCCJG.get_org_positions：它吞掉请求异常并返回空DataFrame，网络故障会被当作无数据缓存
+        max_workers = 1 if prefer_server_batch else 8
+        return self._fetch_markets_concurrently(ccjg, org_code, trade_date, markets, use_chinese_fields,
+                                                max_workers=max_workers)
+
+    def _fetch_markets_concurrently(self,
+        ccjg: "FuturesCCJG",
+        org_code: str,
+        trade_date: str,
+        markets: List[str],
+        use_chinese_fields: bool = True,
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """ 并发获取各市场的持仓数据并合并，结果与FuturesCCJG.get_org_positions一致
+
+        max_workers为1时逐个市场顺序获取。没有获取到任何数据且有市场请求失败时抛出异常
+        """
+        for market in markets:
+            if market not in ccjg.MARKET_MAPPING:
+                raise ValueError(f"不支持的市场名称: {market}，支持的市场名称: {list(ccjg.MARKET_MAPPING.keys())}")
+
+        market_col = "交易市场" if use_chinese_fields else "MARKET_NAME"
+
+        errors: List[Exception] = []
+
+        def fetch_market(market: str) -> Optional[pd.DataFrame]:
+            try:
+                df = ccjg.get_data(
+                    org_code=org_code,
+                    trade_date=trade_date,
+                    market_name=market,
+                    use_chinese_fields=use_chinese_fields
+                )
+            except Exception as e:
+                logger.error("获取 %s 市场数据失败: %s", market, e)
+                errors.append(e)
+                return None
+            if len(df.index) == 0:
+                logger.warning("%s 市场数据为空", market)
+                return None
+            # 添加市场名称列
+            df[market_col] = market
+            return df
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(markets)))) as executor:
+            # map按提交顺序返回结果，合并后的行顺序与顺序获取时相同
+            all_data = [df for df in executor.map(fetch_market, markets) if df is not None]
+
+        if not all_data:
+            # 有市场请求失败时抛出异常，避免把上游故障当作无数据写入缓存
+            if errors:
+                raise errors[-1]
+            logger.warning("所有市场数据均为空")
+            return pd.DataFrame()
+
+        return pd.concat(all_data, copy=False, ignore_index=True)
 
     def get_qh_jcgc_data(self,
         security_code: str,
@@ -471,98 +645,58 @@ class QhDataService(DataService):
         # 生成缓存键，包含日期范围以支持按交易日更新
         date_range_key = f"{start_date or ''}-{end_date or ''}"
         cache_key = f"qh_jcgc_data:{security_code}:{org_code}:{date_range_key}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取建仓过程数据: {cache_key}")
-            # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
-                logger.info("检测到需要增量更新建仓过程数据")
-                incremental_data = self._get_incremental_qh_jcgc_data(
-                    cached_data, security_code, org_code, start_date, end_date, cookies, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
-            
-            return cached_data
+        return self._cached_fetch(
+            cache_key,
+            "建仓过程",
+            self._fetch_qh_jcgc_data,
+            on_hit=partial(self._on_jcgc_data_hit, cache_key, security_code, org_code,
+                           start_date, end_date, cookies, use_chinese_fields),
+            pack=_with_date_range,
+            security_code=security_code,
+            org_code=org_code,
+            start_date=start_date,
+            end_date=end_date,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields
+        )
 
-        try:
-            # 获取实时数据
-            jcgc = FuturesJCGC(cookies=cookies)
-            df = jcgc.get_data(
-                security_code=security_code,
-                org_code=org_code,
-                start_date=start_date,
-                end_date=end_date,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取建仓过程数据时发生错误：{str(e)}")
-            return []
+    def _fetch_qh_jcgc_data(self,
+        security_code: str,
+        org_code: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        use_chinese_fields: bool = True
+    ) -> pd.DataFrame:
+        """ 获取期货建仓过程数据的实际实现 """
+        jcgc = _futures_jcgc(cookies)
+        return jcgc.get_data(
+            security_code=security_code,
+            org_code=org_code,
+            start_date=start_date,
+            end_date=end_date,
+            use_chinese_fields=use_chinese_fields
+        )
 
-    def _get_incremental_qh_jcgc_data(self, cached_data: List[Dict],
+    def _get_incremental_qh_jcgc_data(self, cached_data: pd.DataFrame,
                                       security_code: str, org_code: str,
                                       start_date: Optional[str], end_date: Optional[str],
-                                      cookies: Optional[Dict[str, str]], use_chinese_fields: bool) -> List[Dict]:
+                                      cookies: Optional[Dict[str, str]], use_chinese_fields: bool,
+                                      date_range: Optional[Tuple[datetime, datetime]] = None) -> pd.DataFrame:
         """获取增量的建仓过程数据"""
         try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "交易日期" in item:
-                    if isinstance(item["交易日期"], str):
-                        item_date = datetime.strptime(item["交易日期"], "%Y-%m-%d")
-                    elif isinstance(item["交易日期"], datetime):
-                        item_date = item["交易日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
+            # 优先使用写入缓存时计算的日期范围，旧格式缓存才扫描日期列
+            if date_range is None:
+                date_range = _scan_date_range(cached_data)
+                if date_range is None:
+                    return pd.DataFrame()
+            earliest_cached_date, latest_cached_date = date_range
             
             # 确定增量开始日期
             incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
             
             if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
+                requested_start_date = datetime.fromisoformat(start_date)
                 # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
                 requested_start_date = adjust_start_date(requested_start_date)
             else:
@@ -577,7 +711,7 @@ class QhDataService(DataService):
             # 增量结束日期为今天或指定的结束日期
             incremental_end_date = datetime.now()
             if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+                incremental_end_date = datetime.fromisoformat(end_date)
                 # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
                 incremental_end_date = adjust_end_date(incremental_end_date)
             else:
@@ -587,17 +721,17 @@ class QhDataService(DataService):
             if earliest_cached_date and incremental_end_date > earliest_cached_date:
                 incremental_end_date = earliest_cached_date - timedelta(days=1)
             
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
+            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空DataFrame
             if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
+                return pd.DataFrame()
             
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
+            incremental_start_str = incremental_start_date.date().isoformat()
+            incremental_end_str = incremental_end_date.date().isoformat()
 
             logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的建仓过程数据")
             
             # 获取增量数据
-            jcgc = FuturesJCGC(cookies=cookies)
+            jcgc = _futures_jcgc(cookies)
             df = jcgc.get_data(
                 security_code=security_code,
                 org_code=org_code,
@@ -605,15 +739,35 @@ class QhDataService(DataService):
                 end_date=incremental_end_str,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            return result
+            return df
         except Exception as e:
             logger.error(f"获取增量建仓过程数据失败: {str(e)}")
-            return []
+            return pd.DataFrame()
+
+    def _merge_jcgc_data(self, cached_data: pd.DataFrame, incremental_data: pd.DataFrame) -> List[Dict]:
+        """ 按(合约代码, 交易日期)合并建仓过程数据
+
+        增量数据覆盖缓存中相同键的记录，结果按交易日期升序排列。记录较少时以字典按复合键合并，
+        记录较多时拼接DataFrame后按列做哈希去重。缺少合约代码或日期列时退回通用的合并去重逻辑
+        """
+        code_column = _first_column(cached_data, ("合约代码", "SECURITY_CODE"))
+        date_column = _date_column(cached_data)
+        if code_column is None or date_column is None \
+                or code_column not in incremental_data.columns or date_column not in incremental_data.columns:
+            return self._merge_and_deduplicate_data(cached_data, incremental_data)
+
+        if len(cached_data.index) + len(incremental_data.index) > _FRAME_MERGE_THRESHOLD:
+            frame = pd.concat([cached_data, incremental_data], ignore_index=True, copy=False)
+            # 缓存中的日期是Timestamp经JSON序列化后的字符串，统一转为字符串比较
+            dates = frame[date_column].astype(str)
+            latest = ~pd.DataFrame({"code": frame[code_column].astype(str), "date": dates}).duplicated(keep='last')
+            return df_to_records(frame.loc[dates[latest].sort_values(kind='stable').index])
+
+        merged = {}
+        for records in (df_to_records(cached_data), df_to_records(incremental_data)):
+            # 缓存中的日期是Timestamp经JSON序列化后的字符串，统一用str()比较
+            merged.update(((str(item[code_column]), str(item[date_column])), item) for item in records)
+        return [merged[key] for key in sorted(merged, key=lambda key: key[1])]
 
     def get_qh_jcgc_history(self,
         security_code: str,
@@ -639,92 +793,52 @@ class QhDataService(DataService):
         # 生成缓存键，包含日期参数以支持按交易日更新
         date_params_key = f"{days}-{end_date or ''}"
         cache_key = f"qh_jcgc_history:{security_code}:{org_code}:{date_params_key}:{use_chinese_fields}"
-        
-        # 尝试从缓存获取数据
-        cached_data = self.get_cached_data(cache_key)
-        if cached_data is not None:
-            logger.info(f"从缓存获取持仓历史数据: {cache_key}")
-            # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data):
-                logger.info("检测到需要增量更新持仓历史数据")
-                incremental_data = self._get_incremental_qh_jcgc_history(
-                    cached_data, security_code, org_code, days, end_date, cookies, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
-            
-            return cached_data
+        return self._cached_fetch(
+            cache_key,
+            "持仓历史",
+            self._fetch_qh_jcgc_history,
+            on_hit=partial(self._on_jcgc_history_hit, cache_key, security_code, org_code,
+                           days, end_date, cookies, use_chinese_fields),
+            pack=_with_date_range,
+            security_code=security_code,
+            org_code=org_code,
+            days=days,
+            end_date=end_date,
+            cookies=cookies,
+            use_chinese_fields=use_chinese_fields
+        )
 
-        try:
-            # 获取实时数据
-            jcgc = FuturesJCGC(cookies=cookies)
-            df = jcgc.get_position_history(
-                security_code=security_code,
-                org_code=org_code,
-                days=days,
-                end_date=end_date,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
-        except Exception as e:
-            logger.error(f"获取持仓历史数据时发生错误：{str(e)}")
-            return []
+    def _fetch_qh_jcgc_history(self,
+        security_code: str,
+        org_code: str,
+        days: int = 30,
+        end_date: Optional[str] = None,
+        cookies: Optional[Dict[str, str]] = None,
+        use_chinese_fields: bool = True
+    ) -> pd.DataFrame:
+        """ 获取持仓历史数据的实际实现 """
+        jcgc = _futures_jcgc(cookies)
+        return jcgc.get_position_history(
+            security_code=security_code,
+            org_code=org_code,
+            days=days,
+            end_date=end_date,
+            use_chinese_fields=use_chinese_fields
+        )
 
-    def _get_incremental_qh_jcgc_history(self, cached_data: List[Dict],
+    def _get_incremental_qh_jcgc_history(self, cached_data: pd.DataFrame,
                                          security_code: str, org_code: str,
                                          days: int, end_date: Optional[str],
-                                         cookies: Optional[Dict[str, str]], use_chinese_fields: bool) -> List[Dict]:
+                                         cookies: Optional[Dict[str, str]], use_chinese_fields: bool,
+                                         date_range: Optional[Tuple[datetime, datetime]] = None) -> pd.DataFrame:
         """获取增量的持仓历史数据"""
         try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "交易日期" in item:
-                    if isinstance(item["交易日期"], str):
-                        item_date = datetime.strptime(item["交易日期"], "%Y-%m-%d")
-                    elif isinstance(item["交易日期"], datetime):
-                        item_date = item["交易日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
+            # 优先使用写入缓存时计算的日期范围，旧格式缓存才扫描日期列
+            if date_range is None:
+                date_range = _scan_date_range(cached_data)
+                if date_range is None:
+                    return pd.DataFrame()
+            earliest_cached_date, latest_cached_date = date_range
             
             # 确定增量开始日期
             incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
@@ -733,7 +847,7 @@ class QhDataService(DataService):
             if end_date is None:
                 incremental_end_date = datetime.now()
             else:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
+                incremental_end_date = datetime.fromisoformat(end_date)
             
             # 计算开始日期
             incremental_end_date = adjust_end_date(incremental_end_date)
@@ -744,17 +858,17 @@ class QhDataService(DataService):
             if earliest_cached_date and incremental_end_date > earliest_cached_date:
                 incremental_end_date = earliest_cached_date - timedelta(days=1)
             
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
+            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空DataFrame
             if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
+                return pd.DataFrame()
             
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
+            incremental_start_str = incremental_start_date.date().isoformat()
+            incremental_end_str = incremental_end_date.date().isoformat()
 
             logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的持仓历史数据")
             
             # 获取增量数据
-            jcgc = FuturesJCGC(cookies=cookies)
+            jcgc = _futures_jcgc(cookies)
             df = jcgc.get_position_history(
                 security_code=security_code,
                 org_code=org_code,
@@ -762,12 +876,7 @@ class QhDataService(DataService):
                 end_date=end_date,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            if df.empty:
-                result = []
-            else:
-                result = df.to_dict(orient='records')
-            return result
+            return df
         except Exception as e:
             logger.error(f"获取增量持仓历史数据失败: {str(e)}")
-            return []
\ No newline at end of file
+            return pd.DataFrame()
\ No newline at end of file
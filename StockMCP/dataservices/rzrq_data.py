@@ -1,28 +1,375 @@
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
 import pandas as pd
-from datetime import datetime, timedelta
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from .data_service import DataService, adjust_start_date, adjust_end_date
-from stock_rzrq import (
-    get_rzrq_industry_rank,
-    get_rzrq_industry_detail,
-    get_rzrq_history,
-    get_rzrq_market_summary,
-    get_rzrq_concept_rank,
-    get_rzrq_account_data
-)
+from datetime import datetime, time, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+import threading
+
+from .data_service import (DataService, adjust_start_date, adjust_end_date, df_to_records, df_to_columnar,
+                           columnar_to_records, is_columnar)
+try:
+    from .. import stock_rzrq
+except ImportError:
+    # dataservices作为顶层包导入时(StockMCP目录已在sys.path中)
+    import stock_rzrq
 
 logger = logging.getLogger(__name__)
 
+# 缓存数据中的日期字段，按优先级排列
+_DATE_KEYS = ("交易日期", "日期")
+_ACCOUNT_DATE_KEYS = ("统计日期", "日期")
+# 各接口缓存的最长过期时间(秒)，按数据的发布周期设置，键同时是get_rzrq_bundle支持的接口名
+_TTL = {
+    "industry_rank": 24 * 3600,
+    "industry_detail": 24 * 3600,
+    "history": 24 * 3600,
+    "market_summary": 24 * 3600,
+    "concept_rank": 24 * 3600,
+    "account_data": 7 * 24 * 3600,
+}
+# A股收盘时间
+_MARKET_CLOSE = time(15, 0)
+# 增量获取的日期跨度超过_SPLIT_DAYS天时，按_WINDOW_DAYS天拆分为多个窗口并发获取
+_SPLIT_DAYS = 90
+_WINDOW_DAYS = 30
+
+def _expiry(endpoint: str) -> int:
+    """ 接口缓存的过期时间(秒)
+
+    取接口发布周期与距下一次收盘时间的较小值，收盘时所有接口的缓存同时过期，之后的请求获取当日新数据。
+    过期时间同时以expires_at时间戳写入缓存数据，从不会过期的SQLite读回的缓存也按其判断是否过期
+    """
+    now = datetime.now()
+    next_close = datetime.combine(now.date(), _MARKET_CLOSE)
+    if now >= next_close:
+        next_close += timedelta(days=1)
+    # 跳过周末
+    while next_close.weekday() >= 5:
+        next_close += timedelta(days=1)
+    return max(60, min(_TTL[endpoint], int((next_close - now).total_seconds())))
+
+def _parse_date(date_str: str) -> datetime:
+    """解析'YYYY-MM-DD'格式的日期，fromisoformat比strptime快数倍"""
+    return datetime.fromisoformat(date_str[:10])
+
+@lru_cache(maxsize=512)
+def _requested_start(start_date: str) -> datetime:
+    """请求的开始日期，周六周日调整为之后最近的工作日。同一请求日期只解析和调整一次"""
+    return adjust_start_date(_parse_date(start_date))
+
+@lru_cache(maxsize=512)
+def _requested_end(end_date: str) -> datetime:
+    """请求的结束日期，周六周日调整为之前最近的工作日。同一请求日期只解析和调整一次"""
+    return adjust_end_date(_parse_date(end_date))
+
+def _date_windows(start: datetime, end: datetime) -> List[Tuple[str, str]]:
+    """ 将[start, end]日期范围拆分为'YYYY-MM-DD'格式的(开始日期, 结束日期)窗口
+
+    跨度不超过_SPLIT_DAYS天时只返回一个窗口
+    """
+    if (end - start).days <= _SPLIT_DAYS:
+        return [(start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))]
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=_WINDOW_DAYS - 1), end)
+        windows.append((start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")))
+        start = window_end + timedelta(days=1)
+    return windows
+
+def _extract(data: Optional[Dict]) -> List[Dict]:
+    """从stock_rzrq的返回结果中取出数据列表，接口失败或没有数据时返回空列表"""
+    try:
+        return data['result']['data'] or []
+    except (KeyError, TypeError):
+        return []
+
+def _fetch_rows(fetcher: Callable[..., Optional[Dict]], **kwargs) -> List[Dict]:
+    """调用stock_rzrq中的数据获取函数并取出数据列表"""
+    return _extract(fetcher(**kwargs))
+
+def _scan_date_bounds(records: List[Dict], date_keys: Tuple[str, ...]) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+    """ 向量化扫描字典列表的(最早日期, 最晚日期)
+
+    日期列整列交给pd.to_datetime解析，不再逐条调用strptime。
+    记录中没有日期字段时返回None，日期均无法解析时返回(None, None)
+    """
+    if not records:
+        return None, None
+    date_key = next((key for key in date_keys if key in records[0]), None)
+    if date_key is None:
+        return None
+    dates = pd.to_datetime(pd.Series([item.get(date_key) for item in records], dtype=object),
+                           errors='coerce', cache=True)
+    if dates.isna().all():
+        return None, None
+    return dates.min().to_pydatetime(), dates.max().to_pydatetime()
+
+def _to_columnar(records: List[Dict]) -> Dict[str, list]:
+    """ 将字典列表转换为按列存储的缓存数据，每列一个列表，列名只保存一次 """
+    return df_to_columnar(pd.DataFrame(records))
+
+def _with_fetched_on(records: List[Dict]) -> Dict[str, Any]:
+    """ 生成带写入时最近交易日的按列缓存数据，最近交易日变化后缓存需要更新 """
+    payload = _to_columnar(records)
+    payload["fetched_on"] = DataService._latest_trading_day().date().isoformat()
+    return payload
+
+def _records(cached_data: Any) -> List[Dict]:
+    """ 将缓存数据统一为字典列表
+
+    按列存储的缓存数据展开为字典列表，旧格式的字典列表原样返回，其余无法识别的数据视为空列表。
+    缓存数据只在读取时转换一次，之后的处理均以字典列表为输入
+    """
+    if is_columnar(cached_data):
+        return columnar_to_records(cached_data)
+    if isinstance(cached_data, dict) and "data" in cached_data:
+        return cached_data["data"]
+    if isinstance(cached_data, list):
+        return cached_data
+    logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
+    return []
+
+def _with_date_bounds(records: List[Dict], date_keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """ 生成带日期范围的按列缓存数据 {"columns": [...], "data": [...], "min_date": ..., "max_date": ...}
+
+    写入缓存时计算一次最早和最晚日期，缓存命中时直接读取，不再扫描全部记录。
+    记录按日期升序保存，增量数据晚于缓存数据时合并只需追加
+    """
+    df = pd.DataFrame(records)
+    date_key = next((key for key in date_keys if key in df.columns), None)
+    dates = None
+    if date_key is not None:
+        dates = pd.to_datetime(df[date_key], errors='coerce', cache=True)
+        df = df.iloc[dates.to_numpy().argsort(kind='stable')]
+    payload = df_to_columnar(df)
+    payload["min_date"] = payload["max_date"] = None
+    if dates is not None and dates.notna().any():
+        payload["min_date"] = dates.min().date().isoformat()
+        payload["max_date"] = dates.max().date().isoformat()
+    return payload
+
+def _split_date_bounds(cached_data: Any, date_keys: Tuple[str, ...]) -> Tuple[List[Dict], Optional[Tuple[datetime, datetime]]]:
+    """ 拆分带日期范围的缓存数据，返回(记录, (最早日期, 最晚日期))
+
+    旧格式的缓存数据现场扫描一次日期范围，没有可用日期时日期范围为None
+    """
+    records = _records(cached_data)
+    if isinstance(cached_data, dict):
+        min_date, max_date = cached_data.get("min_date"), cached_data.get("max_date")
+        if not min_date or not max_date:
+            return records, None
+        return records, (_parse_date(min_date), _parse_date(max_date))
+    date_bounds = _scan_date_bounds(records, date_keys)
+    if date_bounds is None or date_bounds[0] is None:
+        return records, None
+    return records, date_bounds
+
+def _before_cached_range(date_bounds: Tuple[datetime, datetime], start_date: Optional[str]) -> bool:
+    """请求的开始日期是否早于缓存数据的最早日期"""
+    return bool(start_date) and _requested_start(start_date) < date_bounds[0]
+
 class RzrqDataService(DataService):
     """融资融券数据类，封装融资融券相关数据获取逻辑"""
     def __init__(self):
         super().__init__()
-        
+        # 后台刷新缓存的线程池，每个缓存键同一时间最多一个刷新任务
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rzrq-refresh")
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+        # 正在进行的上游请求，键为缓存键
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def get_cached_data(self, cache_key: str) -> Optional[Any]:
+        """获取缓存数据，超过写入时记录的过期时间的缓存视为未命中"""
+        cached_data = super().get_cached_data(cache_key)
+        if isinstance(cached_data, dict) and cached_data.get("expires_at", float("inf")) <= datetime.now().timestamp():
+            logger.info(f"缓存数据已过期: {cache_key}")
+            return None
+        return cached_data
+
+    def set_cached_data(self, cache_key: str, data: Any, expiry: int = 3600) -> bool:
+        """设置缓存数据，按列存储的缓存数据中记录过期时间戳"""
+        if isinstance(data, dict):
+            data = {**data, "expires_at": datetime.now().timestamp() + expiry}
+        return super().set_cached_data(cache_key, data, expiry)
+
+    def _incremental_fetch(self, fetcher: Callable[..., Optional[Dict]],
+                           date_bounds: Optional[Tuple[datetime, datetime]],
+                           start_date: Optional[str], end_date: Optional[str],
+                           desc: str, **kwargs) -> List[Dict]:
+        """ 获取缓存日期范围之外的增量数据
+
+        参数:
+            fetcher: stock_rzrq中的数据获取函数，需支持start_date和end_date参数
+            date_bounds: 缓存数据的(最早日期, 最晚日期)
+            start_date: 请求的开始日期，格式为'YYYY-MM-DD'
+            end_date: 请求的结束日期，格式为'YYYY-MM-DD'
+            desc: 数据描述，用于日志
+            kwargs: 传给fetcher的其余参数
+        """
+        try:
+            # 缓存数据的最早和最新日期在写入缓存时已经计算
+            if date_bounds is None:
+                return []
+            earliest_cached_date, latest_cached_date = date_bounds
+            
+            # 请求的开始日期，周六周日调整为之后最近的工作日
+            requested_start_date = _requested_start(start_date) if start_date else None
+            # 增量结束日期为今天或指定的结束日期，周六周日调整为之前最近的工作日
+            incremental_end_date = _requested_end(end_date) if end_date else adjust_end_date(datetime.now())
+            
+            if requested_start_date and requested_start_date < earliest_cached_date:
+                # 请求的开始日期早于缓存中最早的日期，只需要获取缓存之前的数据
+                incremental_start_date = requested_start_date
+                incremental_end_date = min(incremental_end_date, earliest_cached_date - timedelta(days=1))
+            else:
+                # 获取缓存最新日期之后的数据
+                incremental_start_date = adjust_start_date(latest_cached_date + timedelta(days=1))
+            
+            # 缓存数据已覆盖请求的日期范围
+            if incremental_start_date > incremental_end_date:
+                return []
+            
+            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
+            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
+
+            logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的{desc}数据")
+            
+            # 获取增量数据
+            windows = _date_windows(incremental_start_date, incremental_end_date)
+            if len(windows) == 1:
+                return _fetch_rows(fetcher, start_date=incremental_start_str, end_date=incremental_end_str, **kwargs)
+            # 日期跨度较大时拆分为多个窗口并发获取，按窗口顺序拼接
+            def fetch_window(window: Tuple[str, str]) -> List[Dict]:
+                return _fetch_rows(fetcher, start_date=window[0], end_date=window[1], **kwargs)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(windows))) as executor:
+                return list(chain.from_iterable(executor.map(fetch_window, windows)))
+        except Exception as e:
+            logger.error(f"获取增量{desc}数据失败: {str(e)}")
+            return []
+
+    def _merge_rzrq_data(self, cached_data: List[Dict], incremental_data: List[Dict],
+                         date_keys: Tuple[str, ...],
+                         date_bounds: Optional[Tuple[datetime, datetime]] = None) -> List[Dict]:
+        """ 按日期合并缓存数据和增量数据
+
+        增量数据全部晚于缓存的最新日期时(最常见的追加最新交易日数据)，直接追加到按日期升序保存的缓存数据之后；
+        否则两部分数据拼接为一个DataFrame后按日期列去重，同一日期保留增量数据中的记录，结果按日期升序排列。
+        数据中没有日期字段时退回通用的合并去重逻辑
+        """
+        try:
+            incremental_df = pd.DataFrame(incremental_data)
+            date_key = next((key for key in date_keys if key in incremental_df.columns), None)
+            if date_key is None:
+                return self._merge_and_deduplicate_data(cached_data, incremental_data)
+
+            incremental_dates = pd.to_datetime(incremental_df[date_key], errors='coerce', cache=True)
+            if date_bounds is not None and incremental_dates.notna().all() and incremental_dates.min() > date_bounds[1]:
+                # 日期范围不重叠，无需去重，只对增量数据排序
+                return cached_data + df_to_records(
+                    incremental_df.iloc[incremental_dates.to_numpy().argsort(kind='stable')])
+
+            cached_df = pd.DataFrame(cached_data)
+            if date_key not in cached_df.columns:
+                return self._merge_and_deduplicate_data(cached_data, incremental_data)
+
+            merged = pd.concat([cached_df, incremental_df], ignore_index=True, copy=False)
+            dates = pd.to_datetime(merged[date_key], errors='coerce', cache=True)
+            # 日期无法解析的记录不参与去重
+            keep = ~(dates.duplicated(keep='last') & dates.notna())
+            merged, dates = merged[keep], dates[keep]
+            # 无法解析的日期(NaT)排在最后
+            return df_to_records(merged.iloc[dates.to_numpy().argsort(kind='stable')])
+        except Exception as e:
+            logger.error(f"合并融资融券数据时出错: {str(e)}")
+            return self._merge_and_deduplicate_data(cached_data, incremental_data)
+
+    def _coalesce(self, cache_key: str, fetch_fn: Callable[..., List[Dict]],
+                  pack: Callable[[List[Dict]], Dict[str, Any]], expiry: int, **kwargs) -> List[Dict]:
+        """ 合并相同缓存键的并发请求
+
+        第一个请求在当前线程中调用fetch_fn获取数据，非空时将pack(数据)写入缓存，
+        其余并发请求等待同一个Future的结果，不再重复请求上游接口
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[cache_key] = future
+
+        if not leader:
+            logger.debug("等待进行中的请求: %s", cache_key)
+            return future.result()
+
+        try:
+            result = fetch_fn(**kwargs)
+            if result:
+                self.set_cached_data(cache_key, pack(result), expiry=expiry)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+
+    def _refresh_incremental(self, cache_key: str, endpoint: str, cached_data: List[Dict],
+                             date_bounds: Tuple[datetime, datetime],
+                             start_date: Optional[str], end_date: Optional[str],
+                             fetcher: Callable[..., Optional[Dict]], desc: str, date_keys: Tuple[str, ...],
+                             **kwargs) -> Optional[List[Dict]]:
+        """获取增量数据并与缓存数据合并后写回缓存，返回合并后的数据，没有增量数据时返回None"""
+        incremental_data = self._incremental_fetch(fetcher, date_bounds, start_date, end_date, desc, **kwargs)
+        if not incremental_data:
+            return None
+        # 合并数据
+        merged_data = self._merge_rzrq_data(cached_data, incremental_data, date_keys, date_bounds)
+        # 更新缓存
+        self.set_cached_data(cache_key, _with_date_bounds(merged_data, date_keys), expiry=_expiry(endpoint))
+        logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
+        return merged_data
+
+    def _refresh_latest(self, cache_key: str, endpoint: str, fetch_fn: Callable[..., List[Dict]],
+                        pack: Callable[[List[Dict]], Dict[str, Any]] = _to_columnar, **kwargs):
+        """获取最新数据并覆盖缓存，获取失败时保留原有缓存"""
+        new_data = fetch_fn(**kwargs)
+        if new_data:
+            self.set_cached_data(cache_key, pack(new_data), expiry=_expiry(endpoint))
+            logger.info(f"已更新缓存: {cache_key}")
+        else:
+            logger.warning(f"获取最新数据失败，保留缓存数据: {cache_key}")
+
+    def _schedule_refresh(self, cache_key: str, refresh: Callable[[], Any]):
+        """提交后台刷新任务，同一缓存键已有刷新任务在执行时直接跳过"""
+        with self._refreshing_lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+
+        def task():
+            try:
+                refresh()
+            except Exception as e:
+                logger.error(f"后台刷新缓存失败: {cache_key}, {str(e)}")
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(cache_key)
+
+        self._executor.submit(task)
+
+    def _covers_latest_trading_day(self, date_bounds: Tuple[datetime, datetime], start_date: Optional[str]) -> bool:
+        """缓存的最新日期已是最近交易日且覆盖请求的开始日期时返回True，此时无需判断增量更新"""
+        earliest_cached_date, latest_cached_date = date_bounds
+        if latest_cached_date.date() < self._latest_trading_day().date():
+            return False
+        return not start_date or _requested_start(start_date) >= earliest_cached_date
+
     def get_rzrq_industry_rank(self,
         page: int = 1,
         page_size: int = 5,
@@ -45,39 +392,35 @@ class RzrqDataService(DataService):
             List[Dict]: 包含融资融券行业板块排行数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_industry_rank:{sort_column}:{sort_type}:{board_type_code}:{use_chinese_fields}"
+        cache_key = self._key("rzrq_industry_rank", sort_column, sort_type, board_type_code, use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取融资融券行业板块排行数据: {cache_key}")
+            cached_data = _records(cached_data)
             # 检查是否需要更新（基于交易日变化）
             if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新融资融券行业板块排行数据")
-                # 获取最新数据
-                new_data = self._fetch_rzrq_industry_rank(
+                logger.info("检测到需要更新融资融券行业板块排行数据，后台刷新缓存")
+                # 先返回缓存数据，在后台获取最新数据
+                self._schedule_refresh(cache_key, partial(
+                    self._refresh_latest, cache_key, "industry_rank", self._fetch_rzrq_industry_rank,
                     page=page,
                     page_size=page_size,
                     sort_column=sort_column,
                     sort_type=sort_type,
                     board_type_code=board_type_code,
                     use_chinese_fields=use_chinese_fields
-                )
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新融资融券行业板块排行数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+                ))
+            return cached_data
 
         try:
-            # 获取实时数据
-            result = self._fetch_rzrq_industry_rank(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                self._fetch_rzrq_industry_rank,
+                _to_columnar,
+                _expiry("industry_rank"),
                 page=page,
                 page_size=page_size,
                 sort_column=sort_column,
@@ -85,11 +428,6 @@ class RzrqDataService(DataService):
                 board_type_code=board_type_code,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取融资融券行业板块排行数据时发生错误：{str(e)}")
             return []
@@ -102,23 +440,16 @@ class RzrqDataService(DataService):
         board_type_code: str = "006",
         use_chinese_fields: bool = True
     ) -> List[Dict]:
-        """ 获取融资融券行业板块排行数据的实际实现 """
-        try:
-            # 获取实时数据
-            data = get_rzrq_industry_rank(
-                page=page,
-                page_size=page_size,
-                sort_column=sort_column,
-                sort_type=sort_type,
-                board_type_code=board_type_code,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
-        except Exception as e:
-            logger.error(f"获取融资融券行业板块排行数据时发生错误：{str(e)}")
-            return []
+        """ 获取融资融券行业板块排行数据的实际实现，异常由调用方处理 """
+        data = stock_rzrq.get_rzrq_industry_rank(
+            page=page,
+            page_size=page_size,
+            sort_column=sort_column,
+            sort_type=sort_type,
+            board_type_code=board_type_code,
+            use_chinese_fields=use_chinese_fields
+        )
+        return _extract(data)
 
     def get_rzrq_industry_detail(self,
         board_code: str,
@@ -142,30 +473,36 @@ class RzrqDataService(DataService):
             List[Dict]: 包含特定行业板块融资融券明细数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_industry_detail:{board_code}:{use_chinese_fields}"
+        cache_key = self._key("rzrq_industry_detail", board_code, use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取板块{board_code}的融资融券明细数据: {cache_key}")
+            cached_data, date_bounds = _split_date_bounds(cached_data, _DATE_KEYS)
             # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            if date_bounds is not None and not self._covers_latest_trading_day(date_bounds, start_date) \
+                    and self._range_needs_update(*date_bounds, start_date=start_date, end_date=end_date):
                 logger.info("检测到需要增量更新融资融券行业明细数据")
-                incremental_data = self._get_incremental_rzrq_industry_detail(
-                    cached_data, board_code, start_date, end_date, page, page_size, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
+                refresh = partial(
+                    self._refresh_incremental, cache_key, "industry_detail", cached_data, date_bounds, start_date, end_date,
+                    stock_rzrq.get_rzrq_industry_detail, "融资融券行业明细", _DATE_KEYS,
+                    board_code=board_code, page=page, page_size=page_size, use_chinese_fields=use_chinese_fields)
+                if _before_cached_range(date_bounds, start_date):
+                    # 请求的开始日期早于缓存数据，缓存数据不满足请求，同步获取更早的数据
+                    return refresh() or cached_data
+                # 只缺少最新数据时先返回缓存数据，在后台获取增量数据
+                self._schedule_refresh(cache_key, refresh)
             
             return cached_data
 
         try:
-            # 获取实时数据
-            data = get_rzrq_industry_detail(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                partial(_fetch_rows, stock_rzrq.get_rzrq_industry_detail),
+                partial(_with_date_bounds, date_keys=_DATE_KEYS),
+                _expiry("industry_detail"),
                 board_code=board_code,
                 start_date=start_date,
                 end_date=end_date,
@@ -173,113 +510,10 @@ class RzrqDataService(DataService):
                 page_size=page_size,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取行业板块融资融券明细数据时发生错误：{str(e)}")
             return []
 
-    def _get_incremental_rzrq_industry_detail(self, cached_data: List[Dict], board_code: str,
-                                              start_date: Optional[str], end_date: Optional[str],
-                                              page: int, page_size: int, use_chinese_fields: bool) -> List[Dict]:
-        """获取增量的融资融券行业明细数据"""
-        try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "交易日期" in item:
-                    if isinstance(item["交易日期"], str):
-                        item_date = datetime.strptime(item["交易日期"], "%Y-%m-%d")
-                    elif isinstance(item["交易日期"], datetime):
-                        item_date = item["交易日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
-            
-            # 确定增量开始日期
-            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
-            
-            if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
-                # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
-                requested_start_date = adjust_start_date(requested_start_date)
-            else:
-                incremental_start_date = adjust_start_date(incremental_start_date)
-            
-            # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
-            if earliest_cached_date and requested_start_date < earliest_cached_date:
-                incremental_start_date = requested_start_date
-            elif earliest_cached_date is None:
-                incremental_start_date = requested_start_date
-            
-            # 增量结束日期为今天或指定的结束日期
-            incremental_end_date = datetime.now()
-            if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
-                # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            else:
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            
-            # 如果请求的结束时间比缓存中最早的日期晚，则只需要获取更早的数据
-            if earliest_cached_date and incremental_end_date > earliest_cached_date:
-                incremental_end_date = earliest_cached_date - timedelta(days=1)
-            
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
-            if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
-            
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
-
-            logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的融资融券行业明细数据")
-            
-            # 获取增量数据
-            data = get_rzrq_industry_detail(
-                board_code=board_code,
-                start_date=incremental_start_str,
-                end_date=incremental_end_str,
-                page=page,
-                page_size=page_size,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
-        except Exception as e:
-            logger.error(f"获取增量融资融券行业明细数据失败: {str(e)}")
-            return []
-
     def get_rzrq_history(self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
@@ -300,142 +534,46 @@ class RzrqDataService(DataService):
             List[Dict]: 包含融资融券交易历史明细数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_history:{use_chinese_fields}"
+        cache_key = self._key("rzrq_history", use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取融资融券交易历史明细数据: {cache_key}")
+            cached_data, date_bounds = _split_date_bounds(cached_data, _DATE_KEYS)
             # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            if date_bounds is not None and not self._covers_latest_trading_day(date_bounds, start_date) \
+                    and self._range_needs_update(*date_bounds, start_date=start_date, end_date=end_date):
                 logger.info("检测到需要增量更新融资融券历史数据")
-                incremental_data = self._get_incremental_rzrq_history(
-                    cached_data, start_date, end_date, page, page_size, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
+                refresh = partial(
+                    self._refresh_incremental, cache_key, "history", cached_data, date_bounds, start_date, end_date,
+                    stock_rzrq.get_rzrq_history, "融资融券历史", _DATE_KEYS,
+                    page=page, page_size=page_size, use_chinese_fields=use_chinese_fields)
+                if _before_cached_range(date_bounds, start_date):
+                    # 请求的开始日期早于缓存数据，缓存数据不满足请求，同步获取更早的数据
+                    return refresh() or cached_data
+                # 只缺少最新数据时先返回缓存数据，在后台获取增量数据
+                self._schedule_refresh(cache_key, refresh)
             
             return cached_data
 
         try:
-            # 获取实时数据
-            data = get_rzrq_history(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                partial(_fetch_rows, stock_rzrq.get_rzrq_history),
+                partial(_with_date_bounds, date_keys=_DATE_KEYS),
+                _expiry("history"),
                 start_date=start_date,
                 end_date=end_date,
                 page=page,
                 page_size=page_size,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取融资融券交易历史明细数据时发生错误：{str(e)}")
             return []
 
-    def _get_incremental_rzrq_history(self, cached_data: List[Dict],
-                                      start_date: Optional[str], end_date: Optional[str],
-                                      page: int, page_size: int, use_chinese_fields: bool) -> List[Dict]:
-        """获取增量的融资融券历史数据"""
-        try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "交易日期" in item:
-                    if isinstance(item["交易日期"], str):
-                        item_date = datetime.strptime(item["交易日期"], "%Y-%m-%d")
-                    elif isinstance(item["交易日期"], datetime):
-                        item_date = item["交易日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
-            
-            # 确定增量开始日期
-            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
-            
-            if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
-                # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
-                requested_start_date = adjust_start_date(requested_start_date)
-            else:
-                incremental_start_date = adjust_start_date(incremental_start_date)
-            
-            # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
-            if earliest_cached_date and requested_start_date < earliest_cached_date:
-                incremental_start_date = requested_start_date
-            elif earliest_cached_date is None:
-                incremental_start_date = requested_start_date
-            
-            # 增量结束日期为今天或指定的结束日期
-            incremental_end_date = datetime.now()
-            if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
-                # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            else:
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            
-            # 如果请求的结束时间比缓存中最早的日期晚，则只需要获取更早的数据
-            if earliest_cached_date and incremental_end_date > earliest_cached_date:
-                incremental_end_date = earliest_cached_date - timedelta(days=1)
-            
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
-            if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
-            
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
-
-            logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的融资融券历史数据")
-            
-            # 获取增量数据
-            data = get_rzrq_history(
-                start_date=incremental_start_str,
-                end_date=incremental_end_str,
-                page=page,
-                page_size=page_size,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
-        except Exception as e:
-            logger.error(f"获取增量融资融券历史数据失败: {str(e)}")
-            return []
-
     def get_rzrq_market_summary(self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
@@ -456,142 +594,46 @@ class RzrqDataService(DataService):
             List[Dict]: 包含市场融资融券交易总量数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_market_summary:{use_chinese_fields}"
+        cache_key = self._key("rzrq_market_summary", use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取市场融资融券交易总量数据: {cache_key}")
+            cached_data, date_bounds = _split_date_bounds(cached_data, _DATE_KEYS)
             # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            if date_bounds is not None and not self._covers_latest_trading_day(date_bounds, start_date) \
+                    and self._range_needs_update(*date_bounds, start_date=start_date, end_date=end_date):
                 logger.info("检测到需要增量更新融资融券市场汇总数据")
-                incremental_data = self._get_incremental_rzrq_market_summary(
-                    cached_data, start_date, end_date, page, page_size, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
+                refresh = partial(
+                    self._refresh_incremental, cache_key, "market_summary", cached_data, date_bounds, start_date, end_date,
+                    stock_rzrq.get_rzrq_market_summary, "融资融券市场汇总", _DATE_KEYS,
+                    page=page, page_size=page_size, use_chinese_fields=use_chinese_fields)
+                if _before_cached_range(date_bounds, start_date):
+                    # 请求的开始日期早于缓存数据，缓存数据不满足请求，同步获取更早的数据
+                    return refresh() or cached_data
+                # 只缺少最新数据时先返回缓存数据，在后台获取增量数据
+                self._schedule_refresh(cache_key, refresh)
             
             return cached_data
 
         try:
-            # 获取实时数据
-            data = get_rzrq_market_summary(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                partial(_fetch_rows, stock_rzrq.get_rzrq_market_summary),
+                partial(_with_date_bounds, date_keys=_DATE_KEYS),
+                _expiry("market_summary"),
                 start_date=start_date,
                 end_date=end_date,
                 page=page,
                 page_size=page_size,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取市场融资融券交易总量数据时发生错误：{str(e)}")
             return []
 
-    def _get_incremental_rzrq_market_summary(self, cached_data: List[Dict],
-                                             start_date: Optional[str], end_date: Optional[str],
-                                             page: int, page_size: int, use_chinese_fields: bool) -> List[Dict]:
-        """获取增量的融资融券市场汇总数据"""
-        try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "交易日期" in item:
-                    if isinstance(item["交易日期"], str):
-                        item_date = datetime.strptime(item["交易日期"], "%Y-%m-%d")
-                    elif isinstance(item["交易日期"], datetime):
-                        item_date = item["交易日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
-            
-            # 确定增量开始日期
-            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
-            
-            if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
-                # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
-                requested_start_date = adjust_start_date(requested_start_date)
-            else:
-                incremental_start_date = adjust_start_date(incremental_start_date)
-            
-            # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
-            if earliest_cached_date and requested_start_date < earliest_cached_date:
-                incremental_start_date = requested_start_date
-            elif earliest_cached_date is None:
-                incremental_start_date = requested_start_date
-            
-            # 增量结束日期为今天或指定的结束日期
-            incremental_end_date = datetime.now()
-            if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
-                # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            else:
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            
-            # 如果请求的结束时间比缓存中最早的日期晚，则只需要获取更早的数据
-            if earliest_cached_date and incremental_end_date > earliest_cached_date:
-                incremental_end_date = earliest_cached_date - timedelta(days=1)
-            
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
-            if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
-            
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
-
-            logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的融资融券市场汇总数据")
-            
-            # 获取增量数据
-            data = get_rzrq_market_summary(
-                start_date=incremental_start_str,
-                end_date=incremental_end_str,
-                page=page,
-                page_size=page_size,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
-        except Exception as e:
-            logger.error(f"获取增量融资融券市场汇总数据失败: {str(e)}")
-            return []
-
     def get_rzrq_concept_rank(self,
         page: int = 1,
         page_size: int = 50,
@@ -612,49 +654,40 @@ class RzrqDataService(DataService):
             List[Dict]: 包含融资融券概念板块排行数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_concept_rank:{sort_column}:{sort_type}:{use_chinese_fields}"
+        cache_key = self._key("rzrq_concept_rank", sort_column, sort_type, use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取融资融券概念板块排行数据: {cache_key}")
+            cached_data = _records(cached_data)
             # 检查是否需要更新（基于交易日变化）
             if self._need_incremental_update(cached_data):
-                logger.info("检测到需要更新融资融券概念板块排行数据")
-                # 获取最新数据
-                new_data = self._fetch_rzrq_concept_rank(
+                logger.info("检测到需要更新融资融券概念板块排行数据，后台刷新缓存")
+                # 先返回缓存数据，在后台获取最新数据
+                self._schedule_refresh(cache_key, partial(
+                    self._refresh_latest, cache_key, "concept_rank", self._fetch_rzrq_concept_rank,
                     page=page,
                     page_size=page_size,
                     sort_column=sort_column,
                     sort_type=sort_type,
                     use_chinese_fields=use_chinese_fields
-                )
-                if new_data:
-                    # 更新缓存
-                    self.set_cached_data(cache_key, new_data, expiry=3600)
-                    logger.info("已更新融资融券概念板块排行数据缓存")
-                    return new_data
-                else:
-                    # 如果获取新数据失败，返回缓存数据
-                    logger.warning("获取最新数据失败，返回缓存数据")
-                    return cached_data
-            else:
-                return cached_data
+                ))
+            return cached_data
 
         try:
-            # 获取实时数据
-            result = self._fetch_rzrq_concept_rank(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                self._fetch_rzrq_concept_rank,
+                _to_columnar,
+                _expiry("concept_rank"),
                 page=page,
                 page_size=page_size,
                 sort_column=sort_column,
                 sort_type=sort_type,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取融资融券概念板块排行数据时发生错误：{str(e)}")
             return []
@@ -666,22 +699,15 @@ class RzrqDataService(DataService):
         sort_type: int = -1,
         use_chinese_fields: bool = True
     ) -> List[Dict]:
-        """ 获取融资融券概念板块排行数据的实际实现 """
-        try:
-            # 获取实时数据
-            data = get_rzrq_concept_rank(
-                page=page,
-                page_size=page_size,
-                sort_column=sort_column,
-                sort_type=sort_type,
-                use_chinese_fields=use_chinese_fields
-            )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
-        except Exception as e:
-            logger.error(f"获取融资融券概念板块排行数据时发生错误：{str(e)}")
-            return []
+        """ 获取融资融券概念板块排行数据的实际实现，异常由调用方处理 """
+        data = stock_rzrq.get_rzrq_concept_rank(
+            page=page,
+            page_size=page_size,
+            sort_column=sort_column,
+            sort_type=sort_type,
+            use_chinese_fields=use_chinese_fields
+        )
+        return _extract(data)
 
     def get_rzrq_account_data(self,
         page: int = 1,
@@ -707,30 +733,37 @@ class RzrqDataService(DataService):
             List[Dict]: 包含两融账户信息数据的字典列表
         """
         # 生成缓存键
-        cache_key = f"rzrq_account_data::{sort_column}:{sort_type}:{use_chinese_fields}"
+        cache_key = self._key("rzrq_account_data", "", sort_column, sort_type, use_chinese_fields)
         
         # 尝试从缓存获取数据
         cached_data = self.get_cached_data(cache_key)
         if cached_data is not None:
             logger.info(f"从缓存获取两融账户信息数据: {cache_key}")
+            cached_data, date_bounds = _split_date_bounds(cached_data, _ACCOUNT_DATE_KEYS)
             # 检查是否需要增量更新
-            if self._need_incremental_update(cached_data, start_date=start_date, end_date=end_date):
+            if date_bounds is not None and not self._covers_latest_trading_day(date_bounds, start_date) \
+                    and self._range_needs_update(*date_bounds, start_date=start_date, end_date=end_date):
                 logger.info("检测到需要增量更新两融账户数据")
-                incremental_data = self._get_incremental_rzrq_account_data(
-                    cached_data, page, page_size, sort_column, sort_type, start_date, end_date, use_chinese_fields)
-                if incremental_data:
-                    # 合并数据
-                    merged_data = self._merge_and_deduplicate_data(cached_data, incremental_data)
-                    # 更新缓存
-                    self.set_cached_data(cache_key, merged_data, expiry=3600)
-                    logger.info(f"更新缓存数据，新增{len(incremental_data)}条记录")
-                    return merged_data
+                refresh = partial(
+                    self._refresh_incremental, cache_key, "account_data", cached_data, date_bounds, start_date, end_date,
+                    stock_rzrq.get_rzrq_account_data, "两融账户", _ACCOUNT_DATE_KEYS,
+                    page=page, page_size=page_size, sort_column=sort_column, sort_type=sort_type,
+                    use_chinese_fields=use_chinese_fields)
+                if _before_cached_range(date_bounds, start_date):
+                    # 请求的开始日期早于缓存数据，缓存数据不满足请求，同步获取更早的数据
+                    return refresh() or cached_data
+                # 只缺少最新数据时先返回缓存数据，在后台获取增量数据
+                self._schedule_refresh(cache_key, refresh)
             
             return cached_data
 
         try:
-            # 获取实时数据
-            data = get_rzrq_account_data(
+            # 获取实时数据，相同缓存键的并发请求只发起一次，缓存数据至下一次收盘(不超过接口的发布周期)
+            return self._coalesce(
+                cache_key,
+                partial(_fetch_rows, stock_rzrq.get_rzrq_account_data),
+                partial(_with_date_bounds, date_keys=_ACCOUNT_DATE_KEYS),
+                _expiry("account_data"),
                 page=page,
                 page_size=page_size,
                 sort_column=sort_column,
@@ -739,112 +772,162 @@ class RzrqDataService(DataService):
                 end_date=end_date,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            
-            # 缓存数据1小时
-            if result:
-                self.set_cached_data(cache_key, result, expiry=3600)
-            return result
         except Exception as e:
             logger.error(f"获取两融账户信息数据时发生错误：{str(e)}")
             return []
 
-    def _get_incremental_rzrq_account_data(self, cached_data: List[Dict],
-                                           page: int, page_size: int,
-                                           sort_column: str, sort_type: int,
-                                           start_date: Optional[str], end_date: Optional[str],
-                                           use_chinese_fields: bool) -> List[Dict]:
-        """获取增量的两融账户数据"""
-        try:
-            # 处理不同类型的数据
-            if isinstance(cached_data, pd.DataFrame):
-                cached_data_list = cached_data.to_dict(orient='records')
-            elif isinstance(cached_data, list):
-                cached_data_list = cached_data
-            else:
-                logger.warning(f"Unexpected cached_data type: {type(cached_data)}")
-                cached_data_list = list(cached_data) if cached_data else []
-            
-            # 获取缓存数据的最新日期
-            latest_cached_date = None
-            earliest_cached_date = None
-            
-            for item in cached_data_list:
-                if "统计日期" in item:
-                    if isinstance(item["统计日期"], str):
-                        item_date = datetime.strptime(item["统计日期"], "%Y-%m-%d")
-                    elif isinstance(item["统计日期"], datetime):
-                        item_date = item["统计日期"]
-                    else:
-                        continue
-                elif "日期" in item:
-                    if isinstance(item["日期"], str):
-                        item_date = datetime.strptime(item["日期"], "%Y-%m-%d")
-                    elif isinstance(item["日期"], datetime):
-                        item_date = item["日期"]
-                    else:
-                        continue
-                else:
-                    return []
-                
-                if latest_cached_date is None or item_date > latest_cached_date:
-                    latest_cached_date = item_date
-                    
-                if earliest_cached_date is None or item_date < earliest_cached_date:
-                    earliest_cached_date = item_date
-            
-            # 确定增量开始日期
-            incremental_start_date = latest_cached_date + timedelta(days=1) if latest_cached_date else datetime.now()
-            
-            if start_date:
-                requested_start_date = datetime.strptime(start_date, "%Y-%m-%d")
-                # 如果指定的开始日期是周六周日，则调整为之后最近的工作日
-                requested_start_date = adjust_start_date(requested_start_date)
-            else:
-                incremental_start_date = adjust_start_date(incremental_start_date)
-            
-            # 如果请求的开始日期早于缓存中最早的日期，则需要从更早的日期开始获取数据
-            if earliest_cached_date and requested_start_date < earliest_cached_date:
-                incremental_start_date = requested_start_date
-            elif earliest_cached_date is None:
-                incremental_start_date = requested_start_date
-            
-            # 增量结束日期为今天或指定的结束日期
-            incremental_end_date = datetime.now()
-            if end_date:
-                incremental_end_date = datetime.strptime(end_date, "%Y-%m-%d")
-                # 如果指定的结束日期是周六周日，则调整为之前最近的工作日
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            else:
-                incremental_end_date = adjust_end_date(incremental_end_date)
-            
-            # 如果请求的结束时间比缓存中最早的日期晚，则只需要获取更早的数据
-            if earliest_cached_date and incremental_end_date > earliest_cached_date:
-                incremental_end_date = earliest_cached_date - timedelta(days=1)
-            
-            # 如果不需要获取更早的数据且最新缓存日期已是最新的，则返回空列表
-            if latest_cached_date and incremental_start_date > incremental_end_date:
-                return []
-            
-            incremental_start_str = incremental_start_date.strftime("%Y-%m-%d")
-            incremental_end_str = incremental_end_date.strftime("%Y-%m-%d")
+    def get_rzrq_account_data_multi(self,
+        pages: Iterable[int] = range(1, 6),
+        page_size: int = 50,
+        sort_column: str = "STATISTICS_DATE",
+        sort_type: int = -1,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        use_chinese_fields: bool = True
+    ) -> List[Dict]:
+        """ 并发获取多页两融账户信息数据(带缓存支持)
 
-            logger.info(f"获取指定日期范围（{incremental_start_str}至{incremental_end_str}）的两融账户数据")
-            
-            # 获取增量数据
-            data = get_rzrq_account_data(
-                page=page,
+        各页请求提交到线程池并发执行，按页码顺序拼接结果，总耗时取决于最慢的一页
+
+        参数:
+            pages: 页码序列，默认为第1至5页
+            page_size: 每页数量，默认为50
+            sort_column: 排序列，默认为"STATISTICS_DATE"(统计日期)
+            sort_type: 排序类型，1为升序，-1为降序，默认为-1
+            start_date: 开始日期，格式为'YYYY-MM-DD'，默认为None
+            end_date: 结束日期，格式为'YYYY-MM-DD'，默认为None
+            use_chinese_fields: 是否使用中文字段名，默认为True
+
+        返回:
+            List[Dict]: 包含各页两融账户信息数据的字典列表
+        """
+        pages = list(pages)
+        if not pages:
+            return []
+
+        # 生成缓存键
+        cache_key = self._key("rzrq_account_data_multi", ",".join(map(str, pages)), page_size,
+                              sort_column, sort_type, start_date, end_date, use_chinese_fields)
+
+        # 尝试从缓存获取数据
+        cached_data = self.get_cached_data(cache_key)
+        if cached_data is not None:
+            logger.info(f"从缓存获取多页两融账户信息数据: {cache_key}")
+            fetched_on = cached_data.get("fetched_on") if isinstance(cached_data, dict) else None
+            # 写入缓存后最近交易日已变化(或旧格式缓存没有记录)时，先返回缓存数据，在后台获取最新数据
+            if fetched_on != self._latest_trading_day().date().isoformat():
+                logger.info("检测到需要更新多页两融账户信息数据，后台刷新缓存")
+                self._schedule_refresh(cache_key, partial(
+                    self._refresh_latest, cache_key, "account_data", self._fetch_rzrq_account_pages, _with_fetched_on,
+                    pages=pages,
+                    page_size=page_size,
+                    sort_column=sort_column,
+                    sort_type=sort_type,
+                    start_date=start_date,
+                    end_date=end_date,
+                    use_chinese_fields=use_chinese_fields
+                ))
+            return _records(cached_data)
+
+        try:
+            # 获取实时数据，相同缓存键的并发请求只发起一次
+            return self._coalesce(
+                cache_key,
+                self._fetch_rzrq_account_pages,
+                _with_fetched_on,
+                _expiry("account_data"),
+                pages=pages,
                 page_size=page_size,
                 sort_column=sort_column,
                 sort_type=sort_type,
-                start_date=incremental_start_str,
-                end_date=incremental_end_str,
+                start_date=start_date,
+                end_date=end_date,
                 use_chinese_fields=use_chinese_fields
             )
-            
-            result = data.get('result', {}).get('data', []) if data else []
-            return result
         except Exception as e:
-            logger.error(f"获取增量两融账户数据失败: {str(e)}")
-            return []
\ No newline at end of file
+            logger.error(f"获取多页两融账户信息数据时发生错误：{str(e)}")
+            return []
+
+    def iter_rzrq_account_pages(self,
+        start_page: int = 1,
+        max_pages: Optional[int] = None,
+        page_size: int = 50,
+        sort_column: str = "STATISTICS_DATE",
+        sort_type: int = -1,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        use_chinese_fields: bool = True
+    ) -> Iterator[List[Dict]]:
+        """ 逐页获取两融账户信息数据(不经过缓存)
+
+        调用方处理当前页时在后台预取下一页，内存中最多同时保留两页数据；
+        某页数据为空或不足page_size条、或已取满max_pages页时停止
+
+        参数:
+            start_page: 起始页码，默认为1
+            max_pages: 最多获取的页数，默认为None(取到最后一页)
+            page_size: 每页数量，默认为50
+            sort_column: 排序列，默认为"STATISTICS_DATE"(统计日期)
+            sort_type: 排序类型，1为升序，-1为降序，默认为-1
+            start_date: 开始日期，格式为'YYYY-MM-DD'，默认为None
+            end_date: 结束日期，格式为'YYYY-MM-DD'，默认为None
+            use_chinese_fields: 是否使用中文字段名，默认为True
+
+        返回:
+            Iterator[List[Dict]]: 按页码顺序产出每页两融账户信息数据的字典列表
+        """
+        if max_pages is not None and max_pages <= 0:
+            return
+        fetch_page = partial(_fetch_rows, stock_rzrq.get_rzrq_account_data, page_size=page_size,
+                             sort_column=sort_column, sort_type=sort_type, start_date=start_date,
+                             end_date=end_date, use_chinese_fields=use_chinese_fields)
+        stop_page = start_page + max_pages if max_pages is not None else None
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rzrq-prefetch") as executor:
+            page = start_page
+            pending = executor.submit(fetch_page, page=page)
+            while True:
+                try:
+                    rows = pending.result()
+                except Exception as e:
+                    logger.error(f"获取第{page}页两融账户信息数据时发生错误：{str(e)}")
+                    return
+                page += 1
+                last = len(rows) < page_size or (stop_page is not None and page >= stop_page)
+                if not last:
+                    # 在产出当前页之前提交下一页的请求
+                    pending = executor.submit(fetch_page, page=page)
+                if rows:
+                    yield rows
+                if last:
+                    return
+
+    def _fetch_rzrq_account_pages(self, pages: List[int], **kwargs) -> List[Dict]:
+        """ 并发获取多页两融账户信息数据的实际实现 """
+        def fetch_page(page: int) -> List[Dict]:
+            return _fetch_rows(stock_rzrq.get_rzrq_account_data, page=page, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+            return list(chain.from_iterable(executor.map(fetch_page, pages)))
+
+    def get_rzrq_bundle(self, specs: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict]]:
+        """ 并发获取多个融资融券接口的数据(带缓存支持)
+
+        各接口的请求相互独立，提交到线程池并发执行，总耗时取决于最慢的一次请求
+
+        参数:
+            specs: 接口名到参数的映射，接口名为get_rzrq_*去掉前缀的部分，
+                如 {"industry_rank": {"page_size": 10}, "history": {"start_date": "2024-01-01"}}
+        返回:
+            Dict[str, List[Dict]]: 接口名到数据的映射
+        """
+        unknown = set(specs) - set(_TTL)
+        if unknown:
+            raise ValueError(f"不支持的融资融券接口: {', '.join(sorted(unknown))}")
+        if not specs:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+            futures = {name: executor.submit(getattr(self, f"get_rzrq_{name}"), **kwargs)
+                       for name, kwargs in specs.items()}
+            return {name: future.result() for name, future in futures.items()}
@@ -21,15 +21,12 @@ async def main():
 
     # 获取5日内竞价总成交数据
     print("=== 获取5日内竞价总成交数据 ===")
-    df = data_service.get_turnover_history_data(
+    data = data_service.get_turnover_history_at_time(
+        time_str='09:30:00',
         start_date='2025-06-22',
         end_date='2025-08-01',
-        freq=1,
-        fqt=1,
         use_chinese_fields=True
     )
-    print(df)
-    data = [d for d in df if '09:30:00' in d['日期']]
     print(data)
 
     print("=== 获取指定指数代码的历史数据 ===")
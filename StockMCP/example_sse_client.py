@@ -9,13 +9,84 @@ SSE/Streamable HTTP调用MCP工具示例
 
 import asyncio
 import json
+import logging
 import aiohttp
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        """序列化JSON-RPC消息"""
+        return json.dumps(data).encode('utf-8')
+
+    _loads = json.loads
+
+# tools/list请求不带参数，消息体只序列化一次
+_LIST_TOOLS_PAYLOAD = _dumps({
+    "jsonrpc": "2.0",
+    "id": 2,
+    "method": "tools/list",
+    "params": {}
+})
+# tools/call请求中固定不变的字段
+_CALL_TOOL_ENVELOPE = {
+    "jsonrpc": "2.0",
+    "id": 3,
+    "method": "tools/call"
+}
+
+# 模块级共享的HTTP会话，各MCPClient复用同一连接池，保持连接和DNS缓存
+_shared_session: Optional[aiohttp.ClientSession] = None
+# 创建共享会话时所在的事件循环，会话只能在该循环中使用
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """获取共享的HTTP会话，需在事件循环中调用
+
+    首次调用、会话已关闭或当前事件循环与创建会话时不同(如再次调用asyncio.run)时创建新会话
+    """
+    global _shared_session, _shared_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_loop is not loop:
+        if _shared_session is not None and not _shared_session.closed:
+            # 旧会话绑定的事件循环已无法使用，无法再await close()，直接丢弃
+            logger.warning("事件循环已变化，丢弃未关闭的共享HTTP会话，请在事件循环结束前调用close_shared_session()")
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+        _shared_loop = loop
+    return _shared_session
+
+
+async def close_shared_session():
+    """关闭共享的HTTP会话，应在事件循环结束前调用"""
+    global _shared_session, _shared_loop
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_loop = None
 
 class MCPClient:
-    """MCP客户端，支持SSE和Streamable HTTP协议"""
+    """MCP客户端，支持SSE和Streamable HTTP协议
+
+    所有MCPClient共用模块级的HTTP会话，退出上下文管理器时不会关闭该会话。
+    使用方需在事件循环结束前调用close_shared_session()，否则会出现"Unclosed client session"警告::
+
+        try:
+            async with MCPClient("http://127.0.0.1:8000") as client:
+                ...
+        finally:
+            await close_shared_session()
+    """
     
     def __init__(self, base_url: str, transport: str = "sse"):
         """
@@ -31,14 +102,13 @@ class MCPClient:
         self.session = None
         
     async def __aenter__(self):
-        """异步上下文管理器入口"""
-        self.session = aiohttp.ClientSession()
+        """异步上下文管理器入口，使用共享的HTTP会话"""
+        self.session = get_shared_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """异步上下文管理器出口"""
-        if self.session:
-            await self.session.close()
+        """异步上下文管理器出口，共享的HTTP会话由close_shared_session统一关闭"""
+        self.session = None
             
     async def connect(self) -> bool:
         """
@@ -64,33 +134,68 @@ class MCPClient:
         try:
             # SSE连接到/mcp端点
             url = f"{self.base_url}/mcp"
-            print(f"正在连接到SSE端点: {url}")
+            logger.info(f"正在连接到SSE端点: {url}")
             
             # 发送初始化请求获取会话信息
             async with self.session.get(url) as response:
                 if response.status == 200:
                     # 读取SSE流中的第一条消息
-                    async for line in response.content:
-                        line = line.decode('utf-8').strip()
-                        if line.startswith('data:'):
-                            data = line[5:].strip()
-                            try:
-                                message = json.loads(data)
-                                if 'session_id' in message:
-                                    self.session_id = message['session_id']
-                                    print(f"连接成功，会话ID: {self.session_id}")
-                                    return True
-                            except json.JSONDecodeError:
-                                continue
+                    async for data in self._iter_sse_data(response.content):
+                        try:
+                            message = _loads(data)
+                        except ValueError:
+                            continue
+                        if isinstance(message, dict) and 'session_id' in message:
+                            self.session_id = message['session_id']
+                            logger.info(f"连接成功，会话ID: {self.session_id}")
+                            return True
                 else:
-                    print(f"连接失败，状态码: {response.status}")
+                    logger.error(f"连接失败，状态码: {response.status}")
                     return False
         except Exception as e:
-            print(f"SSE连接异常: {e}")
+            logger.error(f"SSE连接异常: {e}")
             return False
             
         return False
         
+    @staticmethod
+    async def _iter_sse_data(content: aiohttp.StreamReader):
+        """
+        按事件解析SSE流
+        
+        按块读取字节流，以空行切分出完整事件后再提取data字段，不逐行解码
+        
+        Args:
+            content: SSE响应的字节流
+            
+        Yields:
+            bytes: 每个事件的data字段内容，多行data以换行符连接
+        """
+        buffer = b""
+        async for chunk in content.iter_any():
+            # 统一换行符，末尾不完整的事件留在缓冲区中等待后续数据
+            buffer = (buffer + chunk).replace(b"\r\n", b"\n")
+            *events, buffer = buffer.split(b"\n\n")
+            for event in events:
+                data = b"\n".join(line[5:].lstrip() for line in event.split(b"\n") if line.startswith(b"data:"))
+                if data:
+                    yield data
+        
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """
+        读取响应体并解析为JSON
+        
+        直接解析响应的字节串，不再先整体解码为str，大体积的工具调用结果只保留一份原始字节
+        
+        Args:
+            response: HTTP响应
+            
+        Returns:
+            Any: 解析后的JSON数据
+        """
+        return _loads(await response.read())
+        
     async def _connect_streamable_http(self) -> bool:
         """
         通过Streamable HTTP协议连接到MCP服务器
@@ -101,7 +206,7 @@ class MCPClient:
         try:
             # Streamable HTTP连接到/mcp/message端点
             url = f"{self.base_url}/mcp/message"
-            print(f"正在连接到Streamable HTTP端点: {url}")
+            logger.info(f"正在连接到Streamable HTTP端点: {url}")
             
             # 发送初始化请求
             init_message = {
@@ -115,23 +220,23 @@ class MCPClient:
             
             async with self.session.post(
                 url, 
-                json=init_message,
+                data=_dumps(init_message),
                 headers={"Content-Type": "application/json"}
             ) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await self._read_json(response)
                     if 'result' in result and 'session_id' in result['result']:
                         self.session_id = result['result']['session_id']
-                        print(f"连接成功，会话ID: {self.session_id}")
+                        logger.info(f"连接成功，会话ID: {self.session_id}")
                         return True
                     else:
-                        print(f"初始化响应不包含会话ID: {result}")
+                        logger.warning(f"初始化响应不包含会话ID: {result}")
                 else:
-                    print(f"连接失败，状态码: {response.status}")
+                    logger.error(f"连接失败，状态码: {response.status}")
                     text = await response.text()
-                    print(f"响应内容: {text}")
+                    logger.error(f"响应内容: {text}")
         except Exception as e:
-            print(f"Streamable HTTP连接异常: {e}")
+            logger.error(f"Streamable HTTP连接异常: {e}")
             
         return False
         
@@ -143,16 +248,9 @@ class MCPClient:
             Dict: 工具列表或None（如果失败）
         """
         try:
-            message = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/list",
-                "params": {}
-            }
-            
-            return await self._send_message(message)
+            return await self._send_message(_LIST_TOOLS_PAYLOAD)
         except Exception as e:
-            print(f"获取工具列表失败: {e}")
+            logger.error(f"获取工具列表失败: {e}")
             return None
             
     async def call_tool(self, name: str, arguments: Dict) -> Optional[Dict[Any, Any]]:
@@ -168,9 +266,7 @@ class MCPClient:
         """
         try:
             message = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
+                **_CALL_TOOL_ENVELOPE,
                 "params": {
                     "name": name,
                     "arguments": arguments
@@ -179,15 +275,15 @@ class MCPClient:
             
             return await self._send_message(message)
         except Exception as e:
-            print(f"调用工具 {name} 失败: {e}")
+            logger.error(f"调用工具 {name} 失败: {e}")
             return None
             
-    async def _send_message(self, message: Dict) -> Optional[Dict[Any, Any]]:
+    async def _send_message(self, message: Union[Dict, bytes]) -> Optional[Dict[Any, Any]]:
         """
         发送消息到MCP服务器
         
         Args:
-            message: 要发送的JSON-RPC消息
+            message: 要发送的JSON-RPC消息，或已序列化的消息字节串
             
         Returns:
             Dict: 服务器响应或None（如果失败）
@@ -199,12 +295,12 @@ class MCPClient:
         else:
             raise ValueError(f"不支持的传输协议: {self.transport}")
             
-    async def _send_message_sse(self, message: Dict) -> Optional[Dict[Any, Any]]:
+    async def _send_message_sse(self, message: Union[Dict, bytes]) -> Optional[Dict[Any, Any]]:
         """
         通过SSE协议发送消息
         
         Args:
-            message: 要发送的JSON-RPC消息
+            message: 要发送的JSON-RPC消息，或已序列化的消息字节串
             
         Returns:
             Dict: 服务器响应或None（如果失败）
@@ -213,24 +309,24 @@ class MCPClient:
             url = f"{self.base_url}/mcp/message"
             async with self.session.post(
                 url,
-                json=message,
+                data=message if isinstance(message, bytes) else _dumps(message),
                 headers={"Content-Type": "application/json"}
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await self._read_json(response)
                 else:
-                    print(f"发送消息失败，状态码: {response.status}")
+                    logger.error(f"发送消息失败，状态码: {response.status}")
                     return None
         except Exception as e:
-            print(f"发送SSE消息异常: {e}")
+            logger.error(f"发送SSE消息异常: {e}")
             return None
             
-    async def _send_message_streamable_http(self, message: Dict) -> Optional[Dict[Any, Any]]:
+    async def _send_message_streamable_http(self, message: Union[Dict, bytes]) -> Optional[Dict[Any, Any]]:
         """
         通过Streamable HTTP协议发送消息
         
         Args:
-            message: 要发送的JSON-RPC消息
+            message: 要发送的JSON-RPC消息，或已序列化的消息字节串
             
         Returns:
             Dict: 服务器响应或None（如果失败）
@@ -239,16 +335,16 @@ class MCPClient:
             url = f"{self.base_url}/mcp/message"
             async with self.session.post(
                 url,
-                json=message,
+                data=message if isinstance(message, bytes) else _dumps(message),
                 headers={"Content-Type": "application/json"}
             ) as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await self._read_json(response)
                 else:
-                    print(f"发送消息失败，状态码: {response.status}")
+                    logger.error(f"发送消息失败，状态码: {response.status}")
                     return None
         except Exception as e:
-            print(f"发送Streamable HTTP消息异常: {e}")
+            logger.error(f"发送Streamable HTTP消息异常: {e}")
             return None
 
 
@@ -343,14 +439,19 @@ async def main():
         
     protocol = sys.argv[1].lower()
     
-    if protocol == "sse":
-        await example_sse_usage()
-    elif protocol == "streamable":
-        await example_streamable_http_usage()
-    else:
-        print_usage()
+    try:
+        if protocol == "sse":
+            await example_sse_usage()
+        elif protocol == "streamable":
+            await example_streamable_http_usage()
+        else:
+            print_usage()
+    finally:
+        await close_shared_session()
 
 
 if __name__ == "__main__":
+    # 示例中输出MCPClient的连接日志
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # 运行示例
     asyncio.run(main())
\ No newline at end of file
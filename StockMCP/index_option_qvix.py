@@ -9,10 +9,30 @@ http://1.optbbs.com/s/vix.shtml?300ETF
 """
 
 import pandas as pd
-from functools import lru_cache
+import hashlib
+import json
+import logging
 import os
+import threading
+import time
+from datetime import datetime, timedelta
+from datetime import time as dt_time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 import requests
-from io import StringIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from io import BytesIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
 headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.90 Safari/537.36",
@@ -30,51 +50,290 @@ def _format_proxy(proxy):
         return {"http": proxy, "https": proxy}
     return proxy
 
-@lru_cache
-def __get_optbbs_daily(proxy=None) -> pd.DataFrame:
+# 请求超时时间(秒)
+_TIMEOUT = 15
+
+
+def _make_session() -> requests.Session:
+    """
+    创建带连接池和自动重试的 requests.Session
+    :return: requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# 模块级共享的会话，未传入 session 时所有请求复用同一个 keep-alive 连接池
+_SESSION = _make_session()
+
+
+def _requester(session=None):
+    """
+    返回用于发送请求的对象
+    :param session: requests.Session，传入时复用其连接池
+    :return: session 或模块级共享的 _SESSION
+    """
+    return _SESSION if session is None else session
+
+# 磁盘缓存目录，可通过环境变量 QVIX_CACHE_DIR 指定
+_CACHE_DIR = os.environ.get("QVIX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "qvix"))
+# 交易时段内磁盘缓存的有效期(秒)，分时数据盘中持续更新，有效期较短
+_CACHE_TTL = 3600
+_MIN_CACHE_TTL = 60
+# 交易时段，之外写入的缓存在下一个交易日开盘前一直有效
+_MARKET_OPEN = dt_time(9, 0)
+_MARKET_CLOSE = dt_time(15, 30)
+# 收盘后当日数据可能尚未发布，该时间段内写入的缓存仍按 ttl 过期，且不晚于时间段结束
+_POST_CLOSE_GRACE = timedelta(hours=1)
+
+
+def _cache_path(url: str, ext: str = ".feather") -> str:
+    """
+    URL 对应的磁盘缓存文件路径
+    :param url: CSV 地址
+    :param ext: 文件扩展名，数据为 .feather，响应的 ETag/Last-Modified 为 .json
+    :return: 缓存文件路径
+    """
+    return os.path.join(_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ext)
+
+
+def _atomic_write(path: str, write):
+    """
+    先写临时文件再原子替换，并发写入同一文件时不会读到写了一半的内容
+    :param path: 目标文件路径
+    :param write: 以临时文件路径为参数的写入函数
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _expires_at(mtime: float, ttl: int = _CACHE_TTL) -> float:
+    """
+    计算磁盘缓存的过期时间
+    交易时段内写入的缓存 ttl 秒后过期；收盘后 _POST_CLOSE_GRACE 内写入的缓存 ttl 秒后过期，
+    最晚到该时间段结束，之后至少重新验证一次以取得当日数据；其余时间写入的缓存到下一个交易日开盘时过期
+    :param mtime: 缓存文件的修改时间戳
+    :param ttl: 交易时段内的有效期(秒)
+    :return: 过期时间戳
+    """
+    written = datetime.fromtimestamp(mtime)
+    if written.weekday() < 5 and _MARKET_OPEN <= written.time():
+        if written.time() < _MARKET_CLOSE:
+            return mtime + ttl
+        grace_end = datetime.combine(written.date(), _MARKET_CLOSE) + _POST_CLOSE_GRACE
+        if written < grace_end:
+            return min(mtime + ttl, grace_end.timestamp())
+    next_open = datetime.combine(written.date(), _MARKET_OPEN)
+    if written.time() >= _MARKET_OPEN:
+        next_open += timedelta(days=1)
+    while next_open.weekday() >= 5:
+        next_open += timedelta(days=1)
+    return next_open.timestamp()
+
+
+def _request_csv(url, proxy=None, session=None, validators=None) -> requests.Response:
+    """
+    请求 CSV，带上次响应的 ETag/Last-Modified 时发送条件请求，数据未变化时服务端返回 304 且不带响应体
+    网络错误由会话的重试策略处理
+    :param url: CSV 地址
+    :param proxy: 代理配置
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
+    :param validators: 上次响应的 {"etag": ..., "last_modified": ...}
+    :return: 响应
+    """
+    request_headers = headers
+    if validators:
+        request_headers = dict(headers)
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+    return _requester(session).get(url, proxies=_format_proxy(proxy), headers=request_headers, timeout=_TIMEOUT)
+
+
+def _read_csv_bytes(content: bytes, encoding: str) -> pd.DataFrame:
+    """
+    直接从响应字节解析 CSV，优先使用 pyarrow 多线程解析，失败时回退到 pandas
+    :param content: 响应体字节
+    :param encoding: 响应体编码
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    if ARROW_AVAILABLE:
+        try:
+            table = pacsv.read_csv(
+                pa.py_buffer(content),
+                read_options=pacsv.ReadOptions(encoding=encoding, use_threads=True),
+            )
+            # pyarrow 会把日期、时间列推断为时间类型，转回字符串以保持与 pd.read_csv 一致的列类型
+            for i, field in enumerate(table.schema):
+                if pa.types.is_temporal(field.type):
+                    table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+            return table.to_pandas()
+        except Exception as e:
+            logger.debug("pyarrow 解析 CSV 失败，回退到 pandas: %s", e)
+    return pd.read_csv(BytesIO(content), encoding=encoding)
+
+
+def _parse_csv(response: requests.Response, encodings=(None,)) -> pd.DataFrame:
+    """
+    解析 CSV 响应，解析失败时换用下一个编码重新解析同一份响应，无需重新下载
+    :param response: 响应
+    :param encodings: 依次尝试的编码，None 表示使用 requests 推断的编码
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    content = response.content
+    for i, encoding in enumerate(encodings):
+        try:
+            return _read_csv_bytes(content, encoding or response.encoding or response.apparent_encoding)
+        except Exception:
+            if i == len(encodings) - 1:
+                raise
+
+
+def _download_csv(url, proxy=None, session=None, encodings=(None,)) -> pd.DataFrame:
+    """
+    下载并解析 CSV
+    :param url: CSV 地址
+    :param proxy: 代理配置
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
+    :param encodings: 依次尝试的编码，None 表示使用 requests 推断的编码
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    return _parse_csv(_request_csv(url, proxy, session), encodings)
+
+
+def _read_validators(url: str) -> dict:
+    """
+    读取磁盘缓存数据对应响应的 ETag/Last-Modified
+    :param url: CSV 地址
+    :return: {"etag": ..., "last_modified": ...}，没有记录时为空字典
+    """
+    try:
+        with open(_cache_path(url, ".json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_validators(url: str, response: requests.Response):
+    """
+    记录响应的 ETag/Last-Modified，下次请求时用于条件请求
+    响应不带这两个头时删除旧记录，避免之后的条件请求带上与磁盘缓存不符的旧值
+    :param url: CSV 地址
+    :param response: 状态码为 200 的响应
+    """
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    if not any(validators.values()):
+        try:
+            os.remove(_cache_path(url, ".json"))
+        except FileNotFoundError:
+            pass
+        return
+
+    def write(tmp_path):
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(validators, f)
+
+    _atomic_write(_cache_path(url, ".json"), write)
+
+
+def _cached_csv(url, proxy=None, session=None, encodings=(None,), ttl: int = _CACHE_TTL) -> pd.DataFrame:
+    """
+    读取 CSV，优先使用未过期的磁盘缓存(feather 格式)，跨进程复用已下载的数据
+    未安装 pyarrow 时直接下载
+    :param url: CSV 地址
+    :param proxy: 代理配置
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
+    :param encodings: 依次尝试的编码，None 表示使用 requests 推断的编码
+    :param ttl: 交易时段内磁盘缓存的有效期(秒)
+    :return: 解析后的数据
+    :rtype: pandas.DataFrame
+    """
+    if not ARROW_AVAILABLE:
+        return _download_csv(url, proxy, session, encodings)
+
+    path = _cache_path(url)
+    try:
+        if time.time() < _expires_at(os.path.getmtime(path), ttl):
+            return feather.read_feather(path)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"读取 QVIX 磁盘缓存失败: {path}, {e}")
+
+    # 缓存已过期时发送条件请求，服务端数据未变化则沿用磁盘缓存
+    response = _request_csv(url, proxy, session, _read_validators(url) if os.path.exists(path) else None)
+    if response.status_code == 304:
+        try:
+            temp_df = feather.read_feather(path)
+            # 顺延缓存的有效期
+            os.utime(path)
+            return temp_df
+        except Exception as e:
+            logger.warning(f"读取 QVIX 磁盘缓存失败: {path}, {e}")
+            response = _request_csv(url, proxy, session)
+
+    # 只缓存 200 的 CSV 响应，5xx、HTML 错误页/验证页等直接抛出异常，保留原有的磁盘缓存
+    if response.status_code != 200:
+        raise requests.HTTPError(f"QVIX 请求返回状态码 {response.status_code}: {url}", response=response)
+    if "html" in response.headers.get("Content-Type", "").lower():
+        raise requests.HTTPError(f"QVIX 请求返回了 HTML 页面而不是 CSV: {url}", response=response)
+    temp_df = _parse_csv(response, encodings)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        _atomic_write(path, lambda tmp_path: feather.write_feather(temp_df, tmp_path, compression="zstd"))
+        _write_validators(url, response)
+    except Exception as e:
+        logger.warning(f"写入 QVIX 磁盘缓存失败: {path}, {e}")
+    return temp_df
+
+
+# k.csv 的下载锁，并发调用时只有一个线程下载，其余线程等待后直接读取磁盘缓存
+_DAILY_LOCK = threading.Lock()
+
+
+def __get_optbbs_daily(proxy=None, session=None) -> pd.DataFrame:
     """
     读取原始数据
     http://1.optbbs.com/d/csv/d/k.csv
+    不在内存中缓存，数据的有效期以磁盘缓存为准
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
-                 或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 原始数据
     :rtype: pandas.DataFrame
     """
-    
     url = "http://1.optbbs.com/d/csv/d/k.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    try:
-        if proxies:
-            response = requests.get(url, proxies=proxies, headers=headers)
-        else:
-            response = requests.get(url, headers=headers)
-        response.encoding = "gbk"
-        temp_df = pd.read_csv(StringIO(response.text))
-    except Exception as e:
-        if proxies:
-            response = requests.get(url, proxies=proxies, headers=headers)
-        else:
-            response = requests.get(url, headers=headers)
-        response.encoding = "utf-8"
-        temp_df = pd.read_csv(StringIO(response.text))
-        if temp_df.empty:
-            raise ValueError(f"无法读取数据，请检查 URL 是否正确: {url}")
+    with _DAILY_LOCK:
+        temp_df = _cached_csv(url, proxy, session, encodings=("gbk", "utf-8"))
+    if temp_df.empty:
+        raise ValueError(f"无法读取数据，请检查 URL 是否正确: {url}")
     return temp_df
 
 
-def index_option_50etf_qvix(proxy=None) -> pd.DataFrame:
+def index_option_50etf_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     50ETF 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?50ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 50ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, :5]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, :5]
     temp_df.columns = [
         "date",
         "open",
@@ -90,25 +349,19 @@ def index_option_50etf_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_50etf_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_50etf_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     50 ETF 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?50ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 50 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vix50.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -117,16 +370,17 @@ def index_option_50etf_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_300etf_qvix(proxy=None) -> pd.DataFrame:
+def index_option_300etf_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     300 ETF 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?300ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 300 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 9, 10, 11, 12]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 9, 10, 11, 12]]
     temp_df.columns = [
         "date",
         "open",
@@ -142,25 +396,19 @@ def index_option_300etf_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_300etf_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_300etf_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     300 ETF 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?300ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 300 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vix300.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -169,16 +417,17 @@ def index_option_300etf_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_500etf_qvix(proxy=None) -> pd.DataFrame:
+def index_option_500etf_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     500 ETF 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?500ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 500 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 67, 68, 69, 70]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 67, 68, 69, 70]]
     temp_df.columns = [
         "date",
         "open",
@@ -194,25 +443,19 @@ def index_option_500etf_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_500etf_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_500etf_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     500 ETF 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?500ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 500 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vix500.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -221,16 +464,17 @@ def index_option_500etf_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_cyb_qvix(proxy=None) -> pd.DataFrame:
+def index_option_cyb_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     创业板 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?CYB
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 创业板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 71, 72, 73, 74]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 71, 72, 73, 74]]
     temp_df.columns = [
         "date",
         "open",
@@ -246,24 +490,18 @@ def index_option_cyb_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_cyb_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_cyb_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     创业板 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?CYB
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 创业板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vixcyb.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -272,16 +510,17 @@ def index_option_cyb_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_kcb_qvix(proxy=None) -> pd.DataFrame:
+def index_option_kcb_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     科创板 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?KCB
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 科创板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 83, 84, 85, 86]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 83, 84, 85, 86]]
     temp_df.columns = [
         "date",
         "open",
@@ -297,24 +536,18 @@ def index_option_kcb_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_kcb_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_kcb_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     科创板 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?KCB
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 科创板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vixkcb.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -323,16 +556,17 @@ def index_option_kcb_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_100etf_qvix(proxy=None) -> pd.DataFrame:
+def index_option_100etf_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     深证100ETF 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?100ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 深证100ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 75, 76, 77, 78]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 75, 76, 77, 78]]
     temp_df.columns = [
         "date",
         "open",
@@ -348,24 +582,18 @@ def index_option_100etf_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_100etf_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_100etf_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     深证100ETF 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?100ETF
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 深证100ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vix100.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -374,16 +602,17 @@ def index_option_100etf_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_300index_qvix(proxy=None) -> pd.DataFrame:
+def index_option_300index_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     中证300股指 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?Index
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 中证300股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 17, 18, 19, 20]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 17, 18, 19, 20]]
     temp_df.columns = [
         "date",
         "open",
@@ -399,24 +628,18 @@ def index_option_300index_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_300index_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_300index_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     中证300股指 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?Index
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 中证300股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vixindex.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -425,16 +648,17 @@ def index_option_300index_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_1000index_qvix(proxy=None) -> pd.DataFrame:
+def index_option_1000index_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     中证1000股指 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?Index1000
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 中证1000股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 25, 26, 27, 28]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 25, 26, 27, 28]]
     temp_df.columns = [
         "date",
         "open",
@@ -450,24 +674,18 @@ def index_option_1000index_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_1000index_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_1000index_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     中证1000股指 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?Index1000
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 中证1000股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vixindex1000.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -476,16 +694,17 @@ def index_option_1000index_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_50index_qvix(proxy=None) -> pd.DataFrame:
+def index_option_50index_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     上证50股指 期权波动率指数 QVIX
     http://1.optbbs.com/s/vix.shtml?50index
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 上证50股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily(proxy).iloc[:, [0, 79, 80, 81, 82]]
+    temp_df = __get_optbbs_daily(proxy, session).iloc[:, [0, 79, 80, 81, 82]]
     temp_df.columns = [
         "date",
         "open",
@@ -501,24 +720,18 @@ def index_option_50index_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-def index_option_50index_min_qvix(proxy=None) -> pd.DataFrame:
+def index_option_50index_min_qvix(proxy=None, session=None) -> pd.DataFrame:
     """
     上证50股指 期权波动率指数 QVIX-分时
     http://1.optbbs.com/s/vix.shtml?50index
     :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
                  或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
     :return: 上证50股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/vix50index.csv"
-    # 处理代理参数
-    proxies = _format_proxy(proxy)
-            
-    if proxies:
-        response = requests.get(url, proxies=proxies, headers=headers)
-    else:
-        response = requests.get(url, headers=headers)
-    temp_df = pd.read_csv(StringIO(response.text)).iloc[:, :2]
+    temp_df = _cached_csv(url, proxy, session, ttl=_MIN_CACHE_TTL).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
@@ -527,58 +740,57 @@ def index_option_50index_min_qvix(proxy=None) -> pd.DataFrame:
     return temp_df
 
 
-if __name__ == "__main__":
-    proxy = "http://192.168.8.212:21006"
-    index_option_50etf_qvix_df = index_option_50etf_qvix(proxy=proxy)
-    print(index_option_50etf_qvix_df)
-
-    index_option_50etf_min_qvix_df = index_option_50etf_min_qvix(proxy=proxy)
-    print(index_option_50etf_min_qvix_df)
-
-    index_option_300etf_qvix_df = index_option_300etf_qvix(proxy=proxy)
-    print(index_option_300etf_qvix_df)
-
-    index_option_300etf_min_qvix_df = index_option_300etf_min_qvix(proxy=proxy)
-    print(index_option_300etf_min_qvix_df)
-
-    index_option_500etf_qvix_df = index_option_500etf_qvix(proxy=proxy)
-    print(index_option_500etf_qvix_df)
-
-    index_option_500etf_min_qvix_df = index_option_500etf_min_qvix(proxy=proxy)
-    print(index_option_500etf_min_qvix_df)
-
-    index_option_cyb_qvix_df = index_option_cyb_qvix(proxy=proxy)
-    print(index_option_cyb_qvix_df)
-
-    index_option_cyb_min_qvix_df = index_option_cyb_min_qvix(proxy=proxy)
-    print(index_option_cyb_min_qvix_df)
-
-    index_option_kcb_qvix_df = index_option_kcb_qvix(proxy=proxy)
-    print(index_option_kcb_qvix_df)
-
-    index_option_kcb_min_qvix_df = index_option_kcb_min_qvix(proxy=proxy)
-    print(index_option_kcb_min_qvix_df)
-
-    index_option_100etf_qvix_df = index_option_100etf_qvix(proxy=proxy)
-    print(index_option_100etf_qvix_df)
-
-    index_option_100etf_min_qvix_df = index_option_100etf_min_qvix(proxy=proxy)
-    print(index_option_100etf_min_qvix_df)
-
-    index_option_300index_qvix_df = index_option_300index_qvix(proxy=proxy)
-    print(index_option_300index_qvix_df)
-
-    index_option_300index_min_qvix_df = index_option_300index_min_qvix(proxy=proxy)
-    print(index_option_300index_min_qvix_df)
-
-    index_option_1000index_qvix_df = index_option_1000index_qvix(proxy=proxy)
-    print(index_option_1000index_qvix_df)
-
-    index_option_1000index_min_qvix_df = index_option_1000index_min_qvix(proxy=proxy)
-    print(index_option_1000index_min_qvix_df)
+# 从 k.csv 中切分的日线 QVIX 获取函数
+_DAILY_FETCHERS = (
+    index_option_50etf_qvix,
+    index_option_300etf_qvix,
+    index_option_500etf_qvix,
+    index_option_cyb_qvix,
+    index_option_kcb_qvix,
+    index_option_100etf_qvix,
+    index_option_300index_qvix,
+    index_option_1000index_qvix,
+    index_option_50index_qvix,
+)
+
+# 各自下载独立 CSV 的分时 QVIX 获取函数
+_MIN_FETCHERS = (
+    index_option_50etf_min_qvix,
+    index_option_300etf_min_qvix,
+    index_option_500etf_min_qvix,
+    index_option_cyb_min_qvix,
+    index_option_kcb_min_qvix,
+    index_option_100etf_min_qvix,
+    index_option_300index_min_qvix,
+    index_option_1000index_min_qvix,
+    index_option_50index_min_qvix,
+)
+
+
+def fetch_all(proxy=None, session=None, max_workers: int = 8) -> Dict[str, pd.DataFrame]:
+    """
+    并发获取全部 QVIX 数据
+    k.csv 与 9 个分时 CSV 同时提交到线程池下载，k.csv 下载完成后再切分出 9 个日线数据
+    :param proxy: 代理配置，支持 dict 格式，如 {"http": "http://127.0.0.1:1080", "https": "http://127.0.0.1:1080"}
+                 或字符串格式，如 "http://127.0.0.1:1080"
+    :param session: 复用连接池的 requests.Session，为 None 时使用模块级共享的会话
+    :param max_workers: 最大并发请求数
+    :return: 获取函数名到数据的映射，如 {"index_option_50etf_qvix": DataFrame, ...}
+    :rtype: dict
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        daily = executor.submit(__get_optbbs_daily, proxy, session)
+        futures = {fetcher.__name__: executor.submit(fetcher, proxy=proxy, session=session)
+                   for fetcher in _MIN_FETCHERS}
+        daily.result()
+        # k.csv 已缓存，日线数据只需切分
+        result = {fetcher.__name__: fetcher(proxy=proxy, session=session) for fetcher in _DAILY_FETCHERS}
+        result.update((name, future.result()) for name, future in futures.items())
+    return result
 
-    index_option_50index_qvix_df = index_option_50index_qvix(proxy=proxy)
-    print(index_option_50index_qvix_df)
 
-    index_option_50index_min_qvix_df = index_option_50index_min_qvix(proxy=proxy)
-    print(index_option_50index_min_qvix_df)
\ No newline at end of file
+if __name__ == "__main__":
+    proxy = "http://192.168.8.212:21006"
+    for name, df in fetch_all(proxy=proxy).items():
+        print(name)
+        print(df)
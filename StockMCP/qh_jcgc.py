@@ -112,6 +112,8 @@ class FuturesJCGC:
         self.retry_times = 3
         self.headers = headers.copy()
         self.cookies = cookies or {}
+        # 复用连接(keep-alive)，避免每次请求重新建立TCP/TLS连接
+        self.session = requests.Session()
     
     def set_cookies(self, cookies: Dict[str, str]) -> None:
         """
@@ -132,7 +134,7 @@ class FuturesJCGC:
         """
         try:
             # 发送一个简单请求来检查cookies是否有效
-            response = requests.get(
+            response = self.session.get(
                 "https://data.eastmoney.com/IF/Data/Contract.html",
                 headers=self.headers,
                 cookies=self.cookies,
@@ -250,7 +252,7 @@ class FuturesJCGC:
                 logger.info(f"请求URL: {full_url}")
                 logger.info(f"使用cookies: {True if self.cookies else False}")
                 
-                response = requests.get(
+                response = self.session.get(
                     full_url,
                     headers=self.headers,
                     cookies=self.cookies,
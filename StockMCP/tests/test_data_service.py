@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 # 添加项目根目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dataservices.data_service import DataService, get_date, adjust_start_date, adjust_end_date
+from dataservices.data_service import DataService, get_date, adjust_start_date, adjust_end_date, df_to_records
 
 class TestDataService(unittest.TestCase):
     
@@ -141,5 +141,16 @@ class TestDataService(unittest.TestCase):
         self.assertEqual(result[1]["value"], 120)
         self.assertEqual(result[2]["日期"], "2023-01-03 00:00:00")
 
+    def test_df_to_records(self):
+        """测试按列将DataFrame转换为字典列表"""
+        df = pd.DataFrame({"日期": ["2023-01-01", "2023-01-02"], "value": [100, 110]})
+        result = df_to_records(df)
+
+        self.assertEqual(result, df.to_dict(orient='records'))
+        # 数值为Python原生类型
+        self.assertIs(type(result[0]["value"]), int)
+
+        self.assertEqual(df_to_records(pd.DataFrame()), [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import index_option_qvix
+from index_option_qvix import _cached_csv, _cache_path, _expires_at, _CACHE_TTL
+
+URL = "http://1.optbbs.com/d/csv/d/vix50.csv"
+CSV = b"time,qvix\n09:30:00,17.2\n09:31:00,17.3\n"
+
+
+def _response(status_code=200, content=CSV, headers=None):
+    """构造模拟的requests响应"""
+    response = Mock()
+    response.status_code = status_code
+    response.content = content
+    response.encoding = "utf-8"
+    response.headers = headers or {}
+    return response
+
+
+class TestExpiresAt(unittest.TestCase):
+
+    def test_trading_hours_use_ttl(self):
+        """测试交易时段内写入的缓存ttl秒后过期"""
+        mtime = datetime(2024, 1, 3, 10, 0).timestamp()
+        self.assertEqual(_expires_at(mtime, 60), mtime + 60)
+
+    def test_post_close_grace_is_capped(self):
+        """测试收盘后宽限时间段内写入的缓存最晚在时间段结束时过期"""
+        mtime = datetime(2024, 1, 3, 16, 0).timestamp()
+        self.assertEqual(_expires_at(mtime, 60), mtime + 60)
+        self.assertEqual(_expires_at(mtime, 3600), datetime(2024, 1, 3, 16, 30).timestamp())
+
+    def test_after_hours_expire_at_next_open(self):
+        """测试收盘后写入的缓存到下一个交易日开盘时过期"""
+        self.assertEqual(_expires_at(datetime(2024, 1, 3, 20, 0).timestamp()),
+                         datetime(2024, 1, 4, 9, 0).timestamp())
+        self.assertEqual(_expires_at(datetime(2024, 1, 4, 8, 0).timestamp()),
+                         datetime(2024, 1, 4, 9, 0).timestamp())
+        # 周五收盘后到下周一开盘
+        self.assertEqual(_expires_at(datetime(2024, 1, 5, 20, 0).timestamp()),
+                         datetime(2024, 1, 8, 9, 0).timestamp())
+
+
+@unittest.skipUnless(index_option_qvix.ARROW_AVAILABLE, "需要pyarrow")
+class TestCachedCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        patcher = patch.object(index_option_qvix, "_CACHE_DIR", self.tmp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.session = Mock()
+        self.session.get.return_value = _response(headers={"ETag": '"v1"'})
+
+    def _expire(self):
+        """把磁盘缓存的修改时间改到一周前，使其过期"""
+        old = time.time() - 7 * 86400
+        os.utime(_cache_path(URL), (old, old))
+        return old
+
+    def test_fresh_hit_skips_request(self):
+        """测试未过期的磁盘缓存直接读取，不再请求"""
+        first = _cached_csv(URL, session=self.session, ttl=_CACHE_TTL)
+        second = _cached_csv(URL, session=self.session, ttl=_CACHE_TTL)
+        self.assertEqual(self.session.get.call_count, 1)
+        self.assertEqual(second["qvix"].tolist(), first["qvix"].tolist())
+
+    def test_expired_cache_is_downloaded_again(self):
+        """测试过期的磁盘缓存带条件请求重新下载"""
+        _cached_csv(URL, session=self.session)
+        self._expire()
+        self.session.get.return_value = _response(content=b"time,qvix\n09:30:00,18.5\n")
+
+        temp_df = _cached_csv(URL, session=self.session)
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(self.session.get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(temp_df["qvix"].tolist(), [18.5])
+
+    def test_not_modified_refreshes_mtime(self):
+        """测试304响应沿用磁盘缓存并顺延其有效期"""
+        _cached_csv(URL, session=self.session)
+        old = self._expire()
+        self.session.get.return_value = _response(status_code=304, content=b"")
+
+        temp_df = _cached_csv(URL, session=self.session)
+
+        self.assertEqual(temp_df["qvix"].tolist(), [17.2, 17.3])
+        self.assertGreater(os.path.getmtime(_cache_path(URL)), old)
+        # 顺延后的缓存再次命中时不再请求
+        _cached_csv(URL, session=self.session)
+        self.assertEqual(self.session.get.call_count, 2)
+
+    def test_response_without_validators_drops_old_ones(self):
+        """测试新的200响应不带ETag/Last-Modified时删除旧的记录"""
+        _cached_csv(URL, session=self.session)
+        self.assertTrue(os.path.exists(_cache_path(URL, ".json")))
+        self._expire()
+        self.session.get.return_value = _response()
+
+        _cached_csv(URL, session=self.session)
+        self._expire()
+        _cached_csv(URL, session=self.session)
+
+        self.assertFalse(os.path.exists(_cache_path(URL, ".json")))
+        self.assertNotIn("If-None-Match", self.session.get.call_args.kwargs["headers"])
+
+    def test_error_response_keeps_old_cache(self):
+        """测试非200响应或HTML页面抛出异常，不覆盖原有的磁盘缓存"""
+        _cached_csv(URL, session=self.session)
+        for response in (_response(status_code=502, content=b"<html>Bad Gateway</html>"),
+                         _response(content=b"<html>captcha</html>", headers={"Content-Type": "text/html"})):
+            with self.subTest(status_code=response.status_code):
+                self._expire()
+                self.session.get.return_value = response
+                with self.assertRaises(index_option_qvix.requests.HTTPError):
+                    _cached_csv(URL, session=self.session)
+
+        self.session.get.return_value = _response(status_code=304, content=b"")
+        self._expire()
+        self.assertEqual(_cached_csv(URL, session=self.session)["qvix"].tolist(), [17.2, 17.3])
+
+if __name__ == '__main__':
+    unittest.main()
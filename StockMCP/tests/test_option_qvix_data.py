@@ -0,0 +1,162 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import threading
+import time
+import pandas as pd
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import index_option_qvix
+from dataservices import option_qvix_data
+from dataservices.option_qvix_data import OptionQvixDataService, QvixSymbol, _REGISTRY, _L1_TTL, _L1_MAXSIZE
+
+
+class _DictCache:
+    """以字典模拟的缓存管理器，记录读取次数"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiries = {}
+        self.touched = []
+        self.gets = 0
+
+    def get_cached_data(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    def get_cached_data_many(self, keys):
+        return {key: self.get_cached_data(key) for key in keys}
+
+    def set_cached_data(self, key, data, expiry=3600):
+        self.store[key] = data
+        self.expiries[key] = expiry
+        return True
+
+    def touch_cached_data(self, key, expiry=3600):
+        self.touched.append((key, expiry))
+        return key in self.store
+
+
+def _qvix_frame():
+    return pd.DataFrame({
+        "date": ["2024-01-02", "2024-01-03"],
+        "open": [17.1, 17.5],
+        "high": [17.8, 18.0],
+        "low": [16.9, 17.2],
+        "close": [17.5, 17.9],
+    })
+
+class TestOptionQvixRegistry(unittest.TestCase):
+
+    def test_registry_covers_all_symbols(self):
+        """测试注册表覆盖所有QVIX品种"""
+        self.assertEqual(set(_REGISTRY), set(QvixSymbol))
+
+    def test_registry_fetchers_exist(self):
+        """测试注册表中的获取函数在index_option_qvix中存在"""
+        for symbol, spec in _REGISTRY.items():
+            with self.subTest(symbol=symbol):
+                self.assertTrue(callable(getattr(index_option_qvix, spec.fetcher, None)))
+
+    def test_generated_getters(self):
+        """测试按注册表生成的get_*方法"""
+        for symbol in _REGISTRY:
+            name = f"get_{symbol.key.split(':', 1)[1]}_qvix"
+            with self.subTest(symbol=symbol):
+                self.assertTrue(callable(getattr(OptionQvixDataService, name, None)))
+
+class TestOptionQvixCaching(unittest.TestCase):
+
+    def setUp(self):
+        self.service = OptionQvixDataService()
+        self.cache = _DictCache()
+        self.service.set_cache_manager(self.cache)
+        self.addCleanup(self.service._executor.shutdown, wait=True)
+        self.addCleanup(self.service._pool.shutdown, wait=True)
+        # 上游获取函数：记录调用次数，直到release被设置才返回
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.fetch_calls = 0
+
+        def fetch(symbol):
+            self.fetch_calls += 1
+            self.started.set()
+            self.release.wait(timeout=5)
+            return _qvix_frame()
+
+        self.service._fetch = fetch
+
+    def test_concurrent_misses_fetch_once(self):
+        """测试同一品种的并发缓存未命中只请求一次上游"""
+        # 领头请求完成后到达的线程命中缓存，不检查是否需要更新
+        self.service._schedule_refresh = Mock()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.service._fresh_or_cached(QvixSymbol.ETF50)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(self.started.wait(timeout=5))
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(self.fetch_calls, 1)
+        self.assertEqual(len(results), 8)
+        for records in results:
+            self.assertEqual([r["date"] for r in records], ["2024-01-02", "2024-01-03"])
+
+    def test_stale_hit_returns_cached_and_refreshes_once(self):
+        """测试缓存需要更新时立即返回缓存数据，并只提交一次后台刷新"""
+        self.service.set_cached_data(QvixSymbol.ETF50, _qvix_frame().iloc[:1])
+        self.service._is_stale = Mock(return_value=True)
+
+        first = self.service._fresh_or_cached(QvixSymbol.ETF50)
+        second = self.service._fresh_or_cached(QvixSymbol.ETF50)
+
+        # 后台刷新仍在等待上游时，两次请求都已返回缓存数据
+        self.assertFalse(self.release.is_set())
+        self.assertEqual([r["date"] for r in first], ["2024-01-02"])
+        self.assertEqual(second, first)
+        self.release.set()
+        self.service._executor.shutdown(wait=True)
+        self.assertEqual(self.fetch_calls, 1)
+
+    def test_unchanged_refresh_extends_data_ttl(self):
+        """测试上游没有新增数据时不重写数据，但与元数据一起顺延数据的过期时间"""
+        self.release.set()
+        spec = _REGISTRY[QvixSymbol.ETF50]
+        self.service._refresh(QvixSymbol.ETF50)
+        data = self.cache.store[QvixSymbol.ETF50.key]
+
+        self.service._refresh(QvixSymbol.ETF50)
+
+        self.assertIs(self.cache.store[QvixSymbol.ETF50.key], data)
+        self.assertEqual(self.cache.touched, [(QvixSymbol.ETF50.key, spec.expiry)])
+        self.assertEqual(self.cache.expiries[f"{QvixSymbol.ETF50.key}:meta"], spec.expiry)
+
+    def test_l1_entry_expires_after_ttl(self):
+        """测试进程内缓存在TTL内直接返回，过期后重新读取缓存管理器"""
+        self.cache.store["qvix:test"] = [{"date": "2024-01-02"}]
+        now = time.monotonic()
+        with patch.object(option_qvix_data, "time") as mock_time:
+            mock_time.monotonic.return_value = now
+            self.service.get_cached_data("qvix:test")
+            self.service.get_cached_data("qvix:test")
+            self.assertEqual(self.cache.gets, 1)
+
+            mock_time.monotonic.return_value = now + _L1_TTL + 1
+            self.service.get_cached_data("qvix:test")
+            self.assertEqual(self.cache.gets, 2)
+
+    def test_l1_is_bounded(self):
+        """测试进程内缓存的条目数不超过上限"""
+        for i in range(_L1_MAXSIZE * 2):
+            self.service._remember(f"qvix:{i}", [])
+            self.assertLessEqual(len(self.service._l1), _L1_MAXSIZE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import time
+import pandas as pd
+from datetime import datetime
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataservices import qh_data
+from dataservices.qh_data import QhDataService, _EMPTY_SENTINEL, _EMPTY_EXPIRY
+
+
+class _DictCache:
+    """以字典模拟的缓存管理器"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiries = {}
+
+    def get_cached_data(self, key):
+        return self.store.get(key)
+
+    def set_cached_data(self, key, data, expiry=3600):
+        self.store[key] = data
+        self.expiries[key] = expiry
+        return True
+
+
+def _jcgc_frame(rows):
+    return pd.DataFrame(rows, columns=["合约代码", "交易日期", "持仓量"])
+
+
+class TestQhCachedFetch(unittest.TestCase):
+
+    def setUp(self):
+        self.service = QhDataService()
+        self.cache = _DictCache()
+        self.service.set_cache_manager(self.cache)
+        self.fetch = Mock(return_value=pd.DataFrame({"品种": ["IF", "IC"], "交易所": ["中金所", "中金所"]}))
+
+    def test_coalesce_writes_columnar_payload(self):
+        """测试获取到数据时按列写入缓存并原样返回DataFrame"""
+        df = self.service._coalesce("qh:test", self.fetch, expiry=60)
+
+        self.assertIs(df, self.fetch.return_value)
+        self.assertEqual(self.cache.store["qh:test"]["columns"], ["品种", "交易所"])
+        self.assertEqual(self.cache.expiries["qh:test"], 60)
+
+    def test_empty_result_writes_marker(self):
+        """测试空结果写入带时间戳的空结果标记，过期时间较短"""
+        self.fetch.return_value = pd.DataFrame()
+        self.assertEqual(self.service._cached_fetch("qh:test", "测试", self.fetch), [])
+
+        marker = self.cache.store["qh:test"]
+        self.assertIn(_EMPTY_SENTINEL, marker)
+        self.assertEqual(self.cache.expiries["qh:test"], _EMPTY_EXPIRY)
+
+    def test_fresh_marker_skips_fetch(self):
+        """测试有效期内的空结果标记直接返回空列表"""
+        self.cache.store["qh:test"] = {_EMPTY_SENTINEL: time.time()}
+
+        self.assertEqual(self.service._cached_fetch("qh:test", "测试", self.fetch), [])
+        self.fetch.assert_not_called()
+
+    def test_expired_marker_is_a_miss(self):
+        """测试超过有效期的空结果标记(如从SQLite重新读到的)和旧版本的字符串标记视为未命中"""
+        for marker in ({_EMPTY_SENTINEL: time.time() - _EMPTY_EXPIRY - 1}, _EMPTY_SENTINEL):
+            with self.subTest(marker=marker):
+                self.fetch.reset_mock()
+                self.cache.store["qh:test"] = marker
+
+                records = self.service._cached_fetch("qh:test", "测试", self.fetch)
+
+                self.fetch.assert_called_once()
+                self.assertEqual([r["品种"] for r in records], ["IF", "IC"])
+
+    def test_fetch_error_is_not_cached(self):
+        """测试上游异常时返回空列表，不写入缓存"""
+        self.fetch.side_effect = ConnectionError("timeout")
+
+        self.assertEqual(self.service._cached_fetch("qh:test", "测试", self.fetch), [])
+        self.assertNotIn("qh:test", self.cache.store)
+
+
+class TestQhJcgc(unittest.TestCase):
+
+    def setUp(self):
+        self.service = QhDataService()
+        self.cached = _jcgc_frame([
+            ("IF2509", "2024-01-02", 100),
+            ("IF2509", "2024-01-03", 110),
+        ])
+        self.incremental = _jcgc_frame([
+            ("IF2509", "2024-01-04", 130),
+            ("IF2509", "2024-01-03", 120),
+        ])
+
+    def test_merge_prefers_incremental(self):
+        """测试按(合约代码, 交易日期)合并，增量数据覆盖相同键的记录，结果按日期升序"""
+        for threshold in (qh_data._FRAME_MERGE_THRESHOLD, 0):
+            with self.subTest(threshold=threshold), patch.object(qh_data, "_FRAME_MERGE_THRESHOLD", threshold):
+                merged = self.service._merge_jcgc_data(self.cached, self.incremental)
+
+                self.assertEqual([(r["交易日期"], r["持仓量"]) for r in merged],
+                                 [("2024-01-02", 100), ("2024-01-03", 120), ("2024-01-04", 130)])
+
+    def test_slice_covered_window(self):
+        """测试缓存日期范围覆盖请求窗口时返回窗口内的记录，否则返回None"""
+        date_range = (datetime(2024, 1, 2), datetime(2024, 1, 3))
+        with patch.object(QhDataService, "_latest_trading_day", return_value=datetime(2024, 1, 3)):
+            covered = self.service._slice_covered_window(
+                self.cached, date_range, datetime(2024, 1, 3), datetime(2024, 1, 5))
+            self.assertEqual([r["交易日期"] for r in covered], ["2024-01-03"])
+
+            self.assertIsNone(self.service._slice_covered_window(
+                self.cached, date_range, datetime(2024, 1, 1), datetime(2024, 1, 3)))
+            self.assertIsNone(self.service._slice_covered_window(
+                self.cached, None, datetime(2024, 1, 2), datetime(2024, 1, 3)))
+
+
+class TestQhCcjgMarkets(unittest.TestCase):
+
+    def setUp(self):
+        self.service = QhDataService()
+        self.ccjg = Mock()
+        self.ccjg.MARKET_MAPPING = {"中金所": "220", "上期所": "113"}
+
+    def test_all_markets_failed_raises(self):
+        """测试所有市场请求失败时抛出异常，不返回空DataFrame"""
+        self.ccjg.get_data.side_effect = ConnectionError("timeout")
+        for max_workers in (1, 8):
+            with self.subTest(max_workers=max_workers):
+                with self.assertRaises(ConnectionError):
+                    self.service._fetch_markets_concurrently(
+                        self.ccjg, "10102950", "2024-01-02", ["中金所", "上期所"], max_workers=max_workers)
+
+    def test_empty_markets_return_empty_frame(self):
+        """测试各市场均无数据且没有请求失败时返回空DataFrame"""
+        self.ccjg.get_data.return_value = pd.DataFrame()
+
+        df = self.service._fetch_markets_concurrently(self.ccjg, "10102950", "2024-01-02", ["中金所", "上期所"])
+
+        self.assertTrue(df.empty)
+
+    def test_markets_are_concatenated_in_order(self):
+        """测试各市场数据按请求顺序拼接，并添加市场名称列"""
+        self.ccjg.get_data.side_effect = lambda market_name, **kwargs: pd.DataFrame({"持仓量": [len(market_name)]})
+
+        df = self.service._fetch_markets_concurrently(self.ccjg, "10102950", "2024-01-02", ["上期所", "中金所"])
+
+        self.assertEqual(df["交易市场"].tolist(), ["上期所", "中金所"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+import threading
+import time
+from datetime import datetime
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataservices.rzrq_data import (RzrqDataService, _with_date_bounds, _split_date_bounds, _to_columnar,
+                                    _DATE_KEYS)
+
+
+def _rows(*dates):
+    return [{"交易日期": date, "融资余额": float(i) + 0.5} for i, date in enumerate(dates)]
+
+
+class TestRzrqCacheFormat(unittest.TestCase):
+
+    def test_columnar_round_trip(self):
+        """测试带日期范围的按列缓存数据写入后还原为按日期升序的记录"""
+        records = _rows("2024-01-04", "2024-01-02", "2024-01-03")
+        payload = _with_date_bounds(records, _DATE_KEYS)
+
+        self.assertEqual(payload["min_date"], "2024-01-02")
+        self.assertEqual(payload["max_date"], "2024-01-04")
+        restored, date_bounds = _split_date_bounds(payload, _DATE_KEYS)
+        self.assertEqual(restored, sorted(records, key=lambda r: r["交易日期"]))
+        self.assertEqual(date_bounds, (datetime(2024, 1, 2), datetime(2024, 1, 4)))
+
+    def test_payload_without_dates(self):
+        """测试记录没有日期字段时日期范围为None"""
+        records = [{"名称": "a"}, {"名称": "b"}]
+        payload = _with_date_bounds(records, _DATE_KEYS)
+
+        self.assertIsNone(payload["min_date"])
+        restored, date_bounds = _split_date_bounds(payload, _DATE_KEYS)
+        self.assertEqual(restored, records)
+        self.assertIsNone(date_bounds)
+
+    def test_legacy_records_are_scanned(self):
+        """测试旧格式的字典列表缓存现场扫描日期范围"""
+        records = _rows("2024-01-03", "2024-01-02")
+        restored, date_bounds = _split_date_bounds(records, _DATE_KEYS)
+
+        self.assertIs(restored, records)
+        self.assertEqual(date_bounds, (datetime(2024, 1, 2), datetime(2024, 1, 3)))
+
+
+class TestRzrqMerge(unittest.TestCase):
+
+    def setUp(self):
+        self.service = RzrqDataService()
+        self.addCleanup(self.service._executor.shutdown, wait=True)
+
+    def test_merge_disjoint_appends(self):
+        """测试增量数据晚于缓存数据时直接追加并排序"""
+        cached = _rows("2024-01-02", "2024-01-03")
+        incremental = [{"交易日期": "2024-01-05", "融资余额": 9.5}, {"交易日期": "2024-01-04", "融资余额": 8.5}]
+
+        merged = self.service._merge_rzrq_data(cached, incremental, _DATE_KEYS,
+                                               (datetime(2024, 1, 2), datetime(2024, 1, 3)))
+
+        self.assertEqual([r["交易日期"] for r in merged], ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+        self.assertEqual(merged[2]["融资余额"], 8.5)
+
+    def test_merge_overlapping_prefers_incremental(self):
+        """测试日期重叠时同一日期保留增量数据中的记录，结果按日期升序"""
+        cached = _rows("2024-01-02", "2024-01-03", "2024-01-04")
+        incremental = [{"交易日期": "2024-01-04", "融资余额": 7.5}, {"交易日期": "2024-01-01", "融资余额": 6.5}]
+
+        merged = self.service._merge_rzrq_data(cached, incremental, _DATE_KEYS,
+                                               (datetime(2024, 1, 2), datetime(2024, 1, 4)))
+
+        self.assertEqual([r["交易日期"] for r in merged], ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"])
+        self.assertEqual(merged[0]["融资余额"], 6.5)
+        self.assertEqual(merged[-1]["融资余额"], 7.5)
+
+
+class TestRzrqCoalesce(unittest.TestCase):
+
+    def setUp(self):
+        self.service = RzrqDataService()
+        self.addCleanup(self.service._executor.shutdown, wait=True)
+        self.cache_manager = Mock()
+        self.service.set_cache_manager(self.cache_manager)
+
+    def test_writes_packed_result(self):
+        """测试获取到数据时将pack后的数据写入缓存，空结果不写入"""
+        records = _rows("2024-01-02")
+        result = self.service._coalesce("rzrq:test", lambda: records,
+                                        pack=lambda rows: _with_date_bounds(rows, _DATE_KEYS), expiry=60)
+
+        self.assertIs(result, records)
+        key, payload, expiry = self.cache_manager.set_cached_data.call_args.args
+        self.assertEqual((key, expiry), ("rzrq:test", 60))
+        self.assertEqual(_split_date_bounds(payload, _DATE_KEYS)[0], records)
+
+        self.cache_manager.set_cached_data.reset_mock()
+        self.service._coalesce("rzrq:empty", lambda: [], pack=lambda rows: rows, expiry=60)
+        self.cache_manager.set_cached_data.assert_not_called()
+
+    def test_expired_payload_is_a_miss(self):
+        """测试超过写入时记录的过期时间的缓存视为未命中(SQLite中的缓存不会随Redis过期)"""
+        self.service.set_cached_data("rzrq:test", _with_date_bounds(_rows("2024-01-02"), _DATE_KEYS), expiry=60)
+        payload = self.cache_manager.set_cached_data.call_args.args[1]
+
+        self.cache_manager.get_cached_data.return_value = payload
+        self.assertIs(self.service.get_cached_data("rzrq:test"), payload)
+        self.cache_manager.get_cached_data.return_value = {**payload, "expires_at": time.time() - 1}
+        self.assertIsNone(self.service.get_cached_data("rzrq:test"))
+
+    def test_account_multi_refreshes_after_trading_day_changes(self):
+        """测试多页两融账户缓存写入后最近交易日变化时返回缓存并提交后台刷新"""
+        records = [{"统计日期": "2024-01-02", "新增投资者": 1.5}]
+        self.service._schedule_refresh = Mock()
+        with patch.object(RzrqDataService, "_latest_trading_day", return_value=datetime(2024, 1, 3)):
+            for fetched_on, refreshed in (("2024-01-03", False), ("2024-01-02", True)):
+                with self.subTest(fetched_on=fetched_on):
+                    self.service._schedule_refresh.reset_mock()
+                    self.cache_manager.get_cached_data.return_value = {**_to_columnar(records), "fetched_on": fetched_on}
+                    self.assertEqual(self.service.get_rzrq_account_data_multi(pages=[1]), records)
+                    self.assertEqual(self.service._schedule_refresh.called, refreshed)
+
+    def test_concurrent_requests_fetch_once(self):
+        """测试相同缓存键的并发请求只调用一次上游接口"""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return _rows("2024-01-02")
+
+        results = []
+
+        def worker():
+            results.append(self.service._coalesce("rzrq:test", fetch, pack=lambda rows: rows, expiry=60))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        self.assertTrue(started.wait(timeout=5))
+        followers = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in followers:
+            thread.start()
+        # 留出时间让其余请求进入等待
+        time.sleep(0.1)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 5)
+
+if __name__ == '__main__':
+    unittest.main()